@@ -0,0 +1,134 @@
+"""
+Registry, timing and result storage shared by the benchmark suite.
+
+A benchmark is an async function registered with @benchmark that returns a
+list of Result rows (one per parameter set). Results are written as JSON keyed
+by git commit so two runs can be diffed with compare().
+"""
+import json
+import subprocess
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+@dataclass
+class Result:
+    name: str
+    params: dict[str, Any]
+    items: int
+    best_seconds: float
+    median_seconds: float
+    repeat: int
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        params = ",".join(f"{k}={v}" for k, v in sorted(self.params.items()))
+        return f"{self.name}[{params}]" if params else self.name
+
+    @property
+    def items_per_second(self) -> float:
+        return self.items / self.best_seconds if self.best_seconds else 0.0
+
+
+@dataclass
+class Benchmark:
+    name: str
+    func: Callable[[int], Awaitable[list[Result]]]
+    # Services the benchmark talks to: "postgres", "redis", "minio".
+    requires: tuple[str, ...]
+
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, requires: tuple[str, ...] = ()):
+    def decorator(func):
+        BENCHMARKS[name] = Benchmark(name=name, func=func, requires=requires)
+        return func
+    return decorator
+
+
+async def measure(
+    name: str,
+    params: dict[str, Any],
+    items: int,
+    run: Callable[[], Awaitable[Any]],
+    repeat: int,
+    setup: Callable[[], Awaitable[Any]] | None = None,
+) -> Result:
+    """Time run() repeat times (setup() excluded from each sample)."""
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            await setup()
+        started = time.perf_counter()
+        await run()
+        samples.append(time.perf_counter() - started)
+    samples.sort()
+    return Result(
+        name=name,
+        params=params,
+        items=items,
+        best_seconds=samples[0],
+        median_seconds=samples[len(samples) // 2],
+        repeat=repeat,
+    )
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def write_results(results: list[Result], skipped: dict[str, str], path: Path | None = None) -> Path:
+    revision = git_revision()
+    path = path or RESULTS_DIR / f"{revision}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document = {
+        "revision": revision,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "results": [
+            {**asdict(result), "key": result.key, "items_per_second": result.items_per_second}
+            for result in results
+        ],
+        "skipped": skipped,
+    }
+    path.write_text(json.dumps(document, indent=2))
+    return path
+
+
+def load_results(path: Path) -> dict[str, dict[str, Any]]:
+    document = json.loads(path.read_text())
+    return {entry["key"]: entry for entry in document["results"]}
+
+
+def compare(baseline: dict[str, dict[str, Any]], results: list[Result], threshold: float) -> list[str]:
+    """
+    Print throughput change against a baseline and return the keys that got
+    slower by more than threshold (a fraction, 0.1 == 10%).
+    """
+    regressions = []
+    print(f"{'benchmark':<56}{'baseline/s':>14}{'current/s':>14}{'change':>10}")
+    for result in results:
+        previous = baseline.get(result.key)
+        if previous is None or not previous["items_per_second"]:
+            print(f"{result.key:<56}{'-':>14}{result.items_per_second:>14,.0f}{'new':>10}")
+            continue
+        change = result.items_per_second / previous["items_per_second"] - 1
+        flag = ""
+        if change < -threshold:
+            regressions.append(result.key)
+            flag = " !"
+        print(f"{result.key:<56}{previous['items_per_second']:>14,.0f}{result.items_per_second:>14,.0f}{change:>+9.1%}{flag}")
+    return regressions
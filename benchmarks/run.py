@@ -0,0 +1,107 @@
+"""
+Run the benchmark suite and store the results as JSON.
+
+Service-backed benchmarks use the Postgres, Redis and MinIO configured in .env
+(the docker-compose stack); any whose service is unreachable are reported as
+skipped rather than failing the run. Results land in
+benchmarks/results/<git revision>.json unless --output is given.
+
+    python -m benchmarks.run
+    python -m benchmarks.run --only cache api.sync_cluster --repeat 3
+    python -m benchmarks.run --compare benchmarks/results/abc1234.json --threshold 0.15
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+from sqlalchemy import text
+
+from benchmarks import suite
+from benchmarks.harness import BENCHMARKS, compare, load_results, write_results
+
+PROBE_TIMEOUT_SECONDS = 3
+
+
+async def _probe_postgres() -> None:
+    from src.database.connection import sessionmaker
+
+    async with sessionmaker() as session:
+        await session.execute(text("SELECT 1"))
+
+
+async def _probe_redis() -> None:
+    from src.redis.connection import get_redis
+
+    redis = await get_redis()
+    await redis.ping()
+
+
+async def _probe_minio() -> None:
+    from src.minio.client import MinioClient
+
+    if not await MinioClient().is_available():
+        raise RuntimeError("bucket is not reachable")
+
+
+PROBES = {"postgres": _probe_postgres, "redis": _probe_redis, "minio": _probe_minio}
+
+
+async def available_services(required: set[str]) -> dict[str, str | None]:
+    """Map each required service to None when reachable, else the reason it is not."""
+    status = {}
+    for service in sorted(required):
+        try:
+            await asyncio.wait_for(PROBES[service](), PROBE_TIMEOUT_SECONDS)
+            status[service] = None
+        except Exception as exc:
+            status[service] = f"{service} unavailable: {exc!r}"
+    return status
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--only", nargs="*", default=None, help="benchmark names or name prefixes")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--compare", type=Path, default=None, help="baseline results JSON")
+    parser.add_argument("--threshold", type=float, default=0.1, help="allowed throughput drop, 0.1 == 10%%")
+    args = parser.parse_args()
+
+    selected = [
+        bench for name, bench in BENCHMARKS.items()
+        if not args.only or any(name == only or name.startswith(f"{only}.") for only in args.only)
+    ]
+    services = await available_services({service for bench in selected for service in bench.requires})
+
+    results = []
+    skipped = {}
+    for bench in selected:
+        reasons = [services[service] for service in bench.requires if services[service]]
+        if reasons:
+            skipped[bench.name] = "; ".join(reasons)
+            print(f"skip {bench.name}: {skipped[bench.name]}")
+            continue
+        try:
+            bench_results = await bench.func(args.repeat)
+        except suite.SkipBenchmark as exc:
+            skipped[bench.name] = str(exc)
+            print(f"skip {bench.name}: {exc}")
+            continue
+        for result in bench_results:
+            print(f"{result.key:<64}{result.items_per_second:>14,.0f}/s  best {result.best_seconds * 1000:,.1f} ms")
+        results.extend(bench_results)
+
+    path = write_results(results, skipped, args.output)
+    print(f"results written to {path}")
+
+    if args.compare:
+        regressions = compare(load_results(args.compare), results, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,108 @@
+"""
+Serialization throughput of the /peers/ and /clients/ list responses.
+
+Compares the previous path (model_validate per ORM row, then FastAPI's
+jsonable_encoder + json.dumps) with the current one (plain row dicts dumped
+in one pass by a TypeAdapter). No database is needed: rows are synthetic.
+
+    python -m benchmarks.serialization --rows 10000 --repeat 5
+"""
+import argparse
+import json
+import time
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from fastapi.encoders import jsonable_encoder
+
+from src.api.v1.clients.schemas import ClientWithPeersResponse, client_rows_adapter
+from src.api.v1.peers.schemas import PeerResponse, peer_rows_adapter
+
+
+def make_peer_rows(count: int) -> list[dict]:
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "id": uuid.uuid4(),
+            "client_id": uuid.uuid4(),
+            "cluster_id": uuid.uuid4(),
+            "public_key": f"{i:043d}=",
+            "allocated_ip": f"10.8.{i // 250 % 250}.{i % 250 + 2}/32",
+            "endpoint": "203.0.113.10:51820",
+            "app_type": "amnezia_vpn",
+            "protocol": "awg",
+            "created_at": now,
+            "updated_at": now,
+            "config": "[Interface]\nPrivateKey = ...\n" * 8,
+            "config_download_url": f"https://minio.example.com/configs/{i}.conf?X-Amz-Signature={'f' * 64}",
+        }
+        for i in range(count)
+    ]
+
+
+def make_client_rows(count: int) -> list[dict]:
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "id": uuid.uuid4(),
+            "username": f"user_{i}",
+            "expires_at": now,
+            "subscription_status": "active",
+            "trial_used": True,
+            "is_admin": False,
+            "last_subscription_at": now,
+            "created_at": now,
+            "updated_at": now,
+            "peers_count": i % 3,
+        }
+        for i in range(count)
+    ]
+
+
+def legacy_peers(rows: list[dict]) -> bytes:
+    result = []
+    for row in rows:
+        response = PeerResponse.model_validate(SimpleNamespace(**row))
+        result.append(response)
+    return json.dumps(jsonable_encoder(result)).encode()
+
+
+def legacy_clients(rows: list[dict]) -> bytes:
+    result = []
+    for row in rows:
+        response = ClientWithPeersResponse.model_validate(SimpleNamespace(**row))
+        result.append(response)
+    return json.dumps(jsonable_encoder(result)).encode()
+
+
+def measure(func, rows: list[dict], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(rows)
+        best = min(best, time.perf_counter() - started)
+    return len(rows) / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    cases = [
+        ("peers", make_peer_rows(args.rows), legacy_peers, peer_rows_adapter.dump_json),
+        ("clients", make_client_rows(args.rows), legacy_clients, client_rows_adapter.dump_json),
+    ]
+
+    print(f"{'endpoint':<10}{'before rows/s':>16}{'after rows/s':>16}{'speedup':>10}")
+    for name, rows, before, after in cases:
+        assert json.loads(before(rows)) == json.loads(after(rows))
+        before_rate = measure(before, rows, args.repeat)
+        after_rate = measure(after, rows, args.repeat)
+        print(f"{name:<10}{before_rate:>16,.0f}{after_rate:>16,.0f}{after_rate / before_rate:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Cold start time of one API worker.
+
+Each run starts a fresh interpreter that imports src.main and, unless
+--import-only is given, runs the application lifespan startup (which needs
+Postgres, Redis and an up-to-date schema). Exits non-zero when the median
+exceeds --max-ms, so it can guard CI.
+
+    python -m benchmarks.startup --runs 5 --max-ms 500
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+PROBE = """
+import asyncio, json, time
+started = time.perf_counter()
+from src.main import app
+imported = time.perf_counter()
+
+async def startup():
+    async with app.router.lifespan_context(app):
+        return time.perf_counter()
+
+ready = imported if {import_only} else asyncio.run(startup())
+print(json.dumps({{"import_ms": (imported - started) * 1000, "startup_ms": (ready - started) * 1000}}))
+"""
+
+
+def measure(import_only: bool) -> dict[str, float]:
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(import_only=import_only)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-ms", type=float, default=500)
+    parser.add_argument("--import-only", action="store_true")
+    args = parser.parse_args()
+
+    samples = [measure(args.import_only) for _ in range(args.runs)]
+    import_ms = statistics.median(s["import_ms"] for s in samples)
+    startup_ms = statistics.median(s["startup_ms"] for s in samples)
+
+    print(f"import  median: {import_ms:8.1f} ms")
+    print(f"startup median: {startup_ms:8.1f} ms (limit {args.max_ms:.0f} ms)")
+
+    if startup_ms > args.max_ms:
+        print("FAIL: cold start exceeds the limit")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
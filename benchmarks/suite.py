@@ -0,0 +1,278 @@
+"""
+Benchmark cases. Each one creates its own synthetic data (cluster names and
+usernames prefixed with "bench-") and removes it afterwards, so the suite can
+run against the local docker-compose stack without touching real records.
+"""
+import asyncio
+import json
+import secrets
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import httpx
+from sqlalchemy import delete, insert
+
+from benchmarks.harness import benchmark, measure
+from benchmarks.serialization import make_client_rows, make_peer_rows
+from loadtest.fake_node import build_sync_payload, generate_key
+from src.api.v1.clients.schemas import client_rows_adapter
+from src.api.v1.peers.schemas import peer_rows_adapter
+from src.database.connection import sessionmaker
+from src.database.management.operations.cluster import create_cluster
+from src.database.models import ClientModel, ClusterModel, PeerModel, SubscriptionStatus
+from src.management.settings import get_settings
+from src.redis.management.cluster_status import ClusterStatusCache
+from src.redis.management.encoding import decode_peer_status, encode_peer_status
+
+settings = get_settings()
+
+
+class SkipBenchmark(Exception):
+    pass
+
+
+def _bench_name() -> str:
+    return f"bench-{secrets.token_hex(4)}"
+
+
+def _peer_statuses(count: int) -> dict[str, dict]:
+    payload = build_sync_payload([generate_key() for _ in range(count)])
+    return {peer["public_key"]: peer for peer in payload["peers"]}
+
+
+async def _create_bench_cluster() -> ClusterModel:
+    async with sessionmaker() as session:
+        return await create_cluster(session, _bench_name(), "http://127.0.0.1:9", secrets.token_urlsafe(32))
+
+
+async def _drop_bench_cluster(cluster_id: uuid.UUID, usernames_prefix: str | None = None) -> None:
+    async with sessionmaker() as session:
+        await session.execute(delete(PeerModel).where(PeerModel.cluster_id == cluster_id))
+        if usernames_prefix:
+            await session.execute(delete(ClientModel).where(ClientModel.username.startswith(usernames_prefix)))
+        await session.execute(delete(ClusterModel).where(ClusterModel.id == cluster_id))
+        await session.commit()
+
+
+@benchmark("cache.peer_status_writes", requires=("redis",))
+async def cache_peer_status_writes(repeat: int):
+    """Per-key save_peer_status_if_changed loop vs the bulk MGET + pipeline path."""
+    cache = ClusterStatusCache()
+    results = []
+
+    for count in (1000, 10000):
+        cluster_id = _bench_name()
+        statuses = _peer_statuses(count)
+
+        async def per_key():
+            for public_key, data in statuses.items():
+                await cache.save_peer_status_if_changed(cluster_id, public_key, data)
+
+        async def bulk():
+            await cache.save_peer_statuses_if_changed(cluster_id, statuses)
+
+        try:
+            for mode, run in (("per_key", per_key), ("bulk", bulk)):
+                # cold: every key is written; warm: unchanged payloads, reads only.
+                results.append(await measure(
+                    "cache.peer_status_writes", {"peers": count, "mode": mode, "state": "cold"},
+                    count, run, repeat, setup=lambda: cache.clear_cluster_cache(cluster_id),
+                ))
+                await run()
+                results.append(await measure(
+                    "cache.peer_status_writes", {"peers": count, "mode": mode, "state": "warm"},
+                    count, run, repeat,
+                ))
+        finally:
+            await cache.clear_cluster_cache(cluster_id)
+
+    return results
+
+
+@benchmark("cache.peer_status_encoding")
+async def peer_status_encoding(repeat: int):
+    """Legacy sorted-key JSON vs the msgpack format, encode and decode of one sync's statuses."""
+    count = 10000
+    statuses = _peer_statuses(count)
+    legacy = [json.dumps(status, sort_keys=True).encode() for status in statuses.values()]
+    current = [encode_peer_status(status) for status in statuses.values()]
+    keys = list(statuses)
+
+    async def json_encode():
+        for status in statuses.values():
+            json.dumps(status, sort_keys=True)
+
+    async def json_decode():
+        for data in legacy:
+            json.loads(data)
+
+    async def msgpack_encode():
+        for status in statuses.values():
+            encode_peer_status(status)
+
+    async def msgpack_decode():
+        for key, data in zip(keys, current):
+            decode_peer_status(key, data)
+
+    results = []
+    for fmt, op, run, values in (
+        ("json", "encode", json_encode, legacy),
+        ("json", "decode", json_decode, legacy),
+        ("msgpack", "encode", msgpack_encode, current),
+        ("msgpack", "decode", msgpack_decode, current),
+    ):
+        result = await measure("cache.peer_status_encoding", {"format": fmt, "op": op}, count, run, repeat)
+        result.extra["bytes_per_status"] = sum(map(len, values)) / count
+        results.append(result)
+    return results
+
+
+@benchmark("api.sync_cluster", requires=("postgres", "redis"))
+async def sync_cluster_throughput(repeat: int):
+    """POST /clusters/sync end to end through the ASGI app, without a network hop."""
+    from src.main import app
+
+    cache = ClusterStatusCache()
+    cluster = await _create_bench_cluster()
+    results = []
+    transport = httpx.ASGITransport(app=app)
+
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for count in (500, 5000):
+                keys = [generate_key() for _ in range(count)]
+                state = {}
+
+                async def setup():
+                    # fresh counters each sample so every peer status is a cache write
+                    state["payload"] = build_sync_payload(keys)
+
+                async def run():
+                    response = await client.post(
+                        "/clusters/sync", json=state["payload"], headers={"X-API-Key": cluster.api_key},
+                    )
+                    response.raise_for_status()
+
+                results.append(await measure(
+                    "api.sync_cluster", {"peers": count}, count, run, repeat, setup=setup,
+                ))
+    finally:
+        await cache.clear_cluster_cache(str(cluster.id))
+        await _drop_bench_cluster(cluster.id)
+
+    return results
+
+
+@benchmark("serialization.list_rows")
+async def list_rows_serialization(repeat: int):
+    """TypeAdapter dump of the /peers/ and /clients/ list rows."""
+    results = []
+    for rows_count in (10000, 100000):
+        for endpoint, rows, adapter in (
+            ("peers", make_peer_rows(rows_count), peer_rows_adapter),
+            ("clients", make_client_rows(rows_count), client_rows_adapter),
+        ):
+            async def run():
+                adapter.dump_json(rows)
+
+            results.append(await measure(
+                "serialization.list_rows", {"endpoint": endpoint, "rows": rows_count}, rows_count, run, repeat,
+            ))
+    return results
+
+
+@benchmark("tasks.cleanup_expired_clients", requires=("postgres",))
+async def cleanup_expired_clients_throughput(repeat: int):
+    """
+    Drain a synthetic set of expired clients (one peer each) with the expiry
+    worker. Other expired clients in the database are drained too, so run it on
+    a scratch database.
+    """
+    from src.services.tasks.cleanup_clients import cleanup_expired_clients
+
+    if not settings.subscription_enabled:
+        raise SkipBenchmark("SUBSCRIPTION_ENABLED is off, the expiry worker is a no-op")
+
+    count = 1000
+    batches = -(-count // settings.expiry_batch_size)
+    cluster = await _create_bench_cluster()
+    prefix = f"{cluster.name}-"
+
+    async def setup():
+        expired_at = datetime.now(timezone.utc) - timedelta(minutes=1)
+        clients = [
+            {
+                "id": uuid.uuid4(),
+                "username": f"{prefix}{secrets.token_hex(6)}",
+                "expires_at": expired_at,
+                "subscription_status": SubscriptionStatus.ACTIVE.value,
+                "trial_used": True,
+            }
+            for _ in range(count)
+        ]
+        peers = [
+            {
+                "id": uuid.uuid4(),
+                "client_id": client["id"],
+                "cluster_id": cluster.id,
+                "public_key": generate_key(),
+                "private_key_hash": "bench",
+                "allocated_ip": f"10.250.{i // 250}.{i % 250 + 2}/32",
+                "endpoint": "203.0.113.10:51820",
+                "app_type": "amnezia_wg",
+                "protocol": "awg",
+            }
+            for i, client in enumerate(clients)
+        ]
+        async with sessionmaker() as session:
+            await session.execute(insert(ClientModel), clients)
+            await session.execute(insert(PeerModel), peers)
+            await session.commit()
+
+    async def run():
+        for _ in range(batches):
+            await cleanup_expired_clients()
+
+    try:
+        result = await measure(
+            "tasks.cleanup_expired_clients",
+            {"clients": count, "batch_size": settings.expiry_batch_size},
+            count, run, repeat, setup=setup,
+        )
+    finally:
+        await _drop_bench_cluster(cluster.id, usernames_prefix=prefix)
+
+    return [result]
+
+
+@benchmark("minio.peer_config_io", requires=("minio",))
+async def peer_config_io(repeat: int):
+    """save_peer_params / get_peer_params round trips, concurrency as in the peers router."""
+    from src.minio.client import MinioClient
+
+    minio = MinioClient()
+    count = 200
+    peer_ids = [uuid.uuid4() for _ in range(count)]
+    document = json.dumps({
+        "version": 1,
+        "template": MinioClient.cluster_template_key(uuid.uuid4(), "amnezia_wg", "awg", "0" * 64),
+        "params": {
+            "Interface.PrivateKey": generate_key(),
+            "Interface.Address": "10.8.0.2/32",
+            "Peer.PresharedKey": generate_key(),
+        },
+    })
+
+    async def upload():
+        await asyncio.gather(*(minio.save_peer_params(peer_id, document) for peer_id in peer_ids))
+
+    async def download():
+        await asyncio.gather(*(minio.get_peer_params(peer_id) for peer_id in peer_ids))
+
+    try:
+        return [
+            await measure("minio.peer_config_io", {"op": "save", "objects": count}, count, upload, repeat),
+            await measure("minio.peer_config_io", {"op": "get", "objects": count}, count, download, repeat),
+        ]
+    finally:
+        await asyncio.gather(*(minio.delete_peer_params(peer_id) for peer_id in peer_ids))
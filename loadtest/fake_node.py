@@ -0,0 +1,173 @@
+"""
+Stand-in for a cluster node: the endpoints ClusterAPIClient calls, backed by memory.
+
+    FAKE_NODE_API_KEY=loadtest uvicorn loadtest.fake_node:app --port 9100
+
+Environment:
+    FAKE_NODE_API_KEY          key expected in X-API-Key (default: loadtest)
+    FAKE_NODE_LATENCY_MS       added to every response (default: 20)
+    FAKE_NODE_JITTER_MS        random extra latency, uniform 0..N (default: 10)
+    FAKE_NODE_FAILURE_RATE     share of requests answered with 503 (default: 0)
+    FAKE_NODE_CENTRAL_URL      e.g. http://localhost:8000/api/v1; enables the sync loop
+    FAKE_NODE_SYNC_INTERVAL    seconds between syncs (default: 30)
+    FAKE_NODE_SYNTHETIC_PEERS  peers reported in syncs on top of created ones (default: 0)
+"""
+import asyncio
+import base64
+import ipaddress
+import os
+import random
+import secrets
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+
+import httpx
+from fastapi import FastAPI, Header, HTTPException, Request
+from fastapi.responses import JSONResponse
+
+API_KEY = os.getenv("FAKE_NODE_API_KEY", "loadtest")
+LATENCY_MS = float(os.getenv("FAKE_NODE_LATENCY_MS", "20"))
+JITTER_MS = float(os.getenv("FAKE_NODE_JITTER_MS", "10"))
+FAILURE_RATE = float(os.getenv("FAKE_NODE_FAILURE_RATE", "0"))
+CENTRAL_URL = os.getenv("FAKE_NODE_CENTRAL_URL")
+SYNC_INTERVAL = float(os.getenv("FAKE_NODE_SYNC_INTERVAL", "30"))
+SYNTHETIC_PEERS = int(os.getenv("FAKE_NODE_SYNTHETIC_PEERS", "0"))
+
+SUBNET = ipaddress.ip_network("10.8.0.0/16")
+PROTOCOL = "awg"
+
+peers: dict[str, dict] = {}
+_ip_counter = iter(range(2, SUBNET.num_addresses - 1))
+
+
+def generate_key() -> str:
+    return base64.b64encode(secrets.token_bytes(32)).decode()
+
+
+def make_peer_status(public_key: str, index: int) -> dict:
+    online = index % 3 != 0
+    return {
+        "public_key": public_key,
+        "endpoint": f"198.51.100.{index % 250 + 1}:{40000 + index % 20000}" if online else None,
+        "allowed_ips": [f"10.9.{index // 250 % 250}.{index % 250 + 2}/32"],
+        "last_handshake": datetime.now(timezone.utc).isoformat() if online else None,
+        "rx_bytes": random.randint(0, 10**10),
+        "tx_bytes": random.randint(0, 10**10),
+        "online": online,
+        "persistent_keepalive": 25,
+    }
+
+
+def build_sync_payload(public_keys: list[str]) -> dict:
+    statuses = [make_peer_status(key, i) for i, key in enumerate(public_keys)]
+    return {
+        "protocol": PROTOCOL,
+        "container_name": "amnezia-awg",
+        "container_status": "running",
+        "peers": statuses,
+        "server_traffic": {
+            "total_rx_bytes": sum(p["rx_bytes"] for p in statuses),
+            "total_tx_bytes": sum(p["tx_bytes"] for p in statuses),
+            "total_peers": len(statuses),
+            "online_peers": sum(1 for p in statuses if p["online"]),
+        },
+        "sync_timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+async def _sync_loop() -> None:
+    synthetic_keys = [generate_key() for _ in range(SYNTHETIC_PEERS)]
+    async with httpx.AsyncClient(base_url=CENTRAL_URL, timeout=30) as client:
+        while True:
+            try:
+                response = await client.post(
+                    "/clusters/sync",
+                    json=build_sync_payload([*peers, *synthetic_keys]),
+                    headers={"X-API-Key": API_KEY},
+                )
+                print(f"sync: {response.status_code}")
+            except httpx.HTTPError as e:
+                print(f"sync failed: {e}")
+            await asyncio.sleep(SYNC_INTERVAL)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    sync_task = asyncio.create_task(_sync_loop()) if CENTRAL_URL else None
+    yield
+    if sync_task is not None:
+        sync_task.cancel()
+
+
+app = FastAPI(title="Fake cluster node", lifespan=lifespan)
+
+
+@app.middleware("http")
+async def simulate_network(request: Request, call_next):
+    await asyncio.sleep((LATENCY_MS + random.uniform(0, JITTER_MS)) / 1000)
+    if FAILURE_RATE and random.random() < FAILURE_RATE:
+        return JSONResponse({"detail": "Injected failure"}, status_code=503)
+    return await call_next(request)
+
+
+def _authorize(x_api_key: str | None) -> None:
+    if x_api_key != API_KEY:
+        raise HTTPException(status_code=401, detail="Invalid API key")
+
+
+@app.get("/api/v1/server/status")
+async def server_status(x_api_key: str | None = Header(None)):
+    _authorize(x_api_key)
+    return {"container_name": "amnezia-awg", "status": "running", "protocol": PROTOCOL, "peers": len(peers)}
+
+
+@app.post("/api/v1/server/restart")
+async def restart(x_api_key: str | None = Header(None)):
+    _authorize(x_api_key)
+    return {"status": "restarting"}
+
+
+@app.post("/api/v1/peers/")
+async def create_peer(payload: dict, x_api_key: str | None = Header(None)):
+    _authorize(x_api_key)
+    public_key = payload.get("public_key") or generate_key()
+    allocated_ip = payload.get("allocated_ip") or f"{SUBNET[next(_ip_counter)]}/32"
+    peer = {
+        "id": str(uuid.uuid4()),
+        "public_key": public_key,
+        "private_key": generate_key(),
+        "allocated_ip": allocated_ip,
+        "endpoint": "203.0.113.10:51820",
+        "protocol": payload.get("protocol") or PROTOCOL,
+        "app_type": payload.get("app_type"),
+    }
+    peer["config"] = (
+        f"[Interface]\nPrivateKey = {peer['private_key']}\nAddress = {allocated_ip}\n\n"
+        f"[Peer]\nEndpoint = {peer['endpoint']}\nAllowedIPs = 0.0.0.0/0\n"
+    )
+    peers[public_key] = peer
+    return peer
+
+
+@app.delete("/api/v1/peers/")
+async def delete_peer(payload: dict, x_api_key: str | None = Header(None)):
+    _authorize(x_api_key)
+    if peers.pop(payload.get("public_key"), None) is None:
+        raise HTTPException(status_code=404, detail="Peer not found")
+    return {"status": "deleted"}
+
+
+@app.get("/api/v1/peers/")
+async def list_peers(x_api_key: str | None = Header(None)):
+    _authorize(x_api_key)
+    return list(peers.values())
+
+
+@app.get("/api/v1/peers/{peer_id}")
+async def get_peer(peer_id: str, x_api_key: str | None = Header(None)):
+    _authorize(x_api_key)
+    for peer in peers.values():
+        if peer["id"] == peer_id:
+            return peer
+    raise HTTPException(status_code=404, detail="Peer not found")
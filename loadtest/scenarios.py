@@ -0,0 +1,175 @@
+"""
+End-to-end load scenarios against a running central API.
+
+Start the API and a fake node first (see loadtest/fake_node.py), then e.g.:
+
+    python -m loadtest.scenarios peer-storm --peers 500 --concurrency 50
+    python -m loadtest.scenarios sync-storm --clusters 20 --peers-per-sync 5000 --rounds 5
+    python -m loadtest.scenarios stats-poll --duration 60 --concurrency 20
+    python -m loadtest.scenarios all
+
+Each scenario prints throughput, p50/p99 latency and error count per request type.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+import uuid
+from collections import defaultdict
+
+import httpx
+
+from loadtest.fake_node import build_sync_payload, generate_key
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+        self.started = time.perf_counter()
+
+    async def call(self, name: str, request) -> httpx.Response | None:
+        started = time.perf_counter()
+        try:
+            response = await request
+        except httpx.HTTPError:
+            self.errors[name] += 1
+            return None
+        self.latencies[name].append(time.perf_counter() - started)
+        if response.status_code >= 400:
+            self.errors[name] += 1
+        return response
+
+    def report(self, title: str) -> None:
+        elapsed = time.perf_counter() - self.started
+        print(f"\n== {title} ({elapsed:.1f}s)")
+        print(f"{'request':<22}{'count':>8}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'errors':>8}")
+        for name, samples in sorted(self.latencies.items()):
+            ordered = sorted(samples)
+            p50 = statistics.median(ordered) * 1000
+            p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000
+            print(
+                f"{name:<22}{len(samples):>8}{len(samples) / elapsed:>10.1f}"
+                f"{p50:>10.1f}{p99:>10.1f}{self.errors[name]:>8}"
+            )
+
+
+async def login(client: httpx.AsyncClient, username: str, password: str) -> None:
+    response = await client.post("/auth/login", json={"username": username, "password": password})
+    response.raise_for_status()
+    client.headers["Authorization"] = f"Bearer {response.json()['access_token']}"
+
+
+async def ensure_cluster(client: httpx.AsyncClient, name: str, endpoint: str, api_key: str) -> str:
+    response = await client.post("/clusters/", json={"name": name, "endpoint": endpoint, "api_key": api_key})
+    if response.status_code == 409:
+        clusters = (await client.get("/clusters/")).json()
+        return next(c["id"] for c in clusters if c["name"] == name)
+    response.raise_for_status()
+    return response.json()["id"]
+
+
+async def run_bounded(concurrency: int, jobs) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _run(job):
+        async with semaphore:
+            await job
+
+    await asyncio.gather(*(_run(job) for job in jobs))
+
+
+async def peer_storm(client: httpx.AsyncClient, args) -> None:
+    """Create clients and a peer for each as fast as the API allows, then delete them."""
+    cluster_id = await ensure_cluster(client, "loadtest-node", args.node_endpoint, args.node_api_key)
+    recorder = Recorder()
+    run_id = uuid.uuid4().hex[:8]
+    client_ids: list[str] = []
+
+    async def create(i: int) -> None:
+        response = await recorder.call(
+            "POST /clients/", client.post("/clients/", json={"username": f"lt-{run_id}-{i}"})
+        )
+        if response is None or response.status_code >= 400:
+            return
+        client_id = response.json()["id"]
+        client_ids.append(client_id)
+        await recorder.call(
+            "POST /peers/",
+            client.post("/peers/", json={"cluster_id": cluster_id, "client_id": client_id, "app_type": "amnezia_vpn"}),
+        )
+
+    await run_bounded(args.concurrency, (create(i) for i in range(args.peers)))
+    await run_bounded(
+        args.concurrency,
+        (recorder.call("DELETE /clients/{id}", client.delete(f"/clients/{cid}")) for cid in client_ids),
+    )
+    recorder.report(f"peer storm: {args.peers} clients/peers, concurrency {args.concurrency}")
+
+
+async def sync_storm(client: httpx.AsyncClient, args) -> None:
+    """Many clusters pushing large status payloads at the same moment, round after round."""
+    api_keys = [f"loadtest-sync-{i}" for i in range(args.clusters)]
+    for i, api_key in enumerate(api_keys):
+        await ensure_cluster(client, f"loadtest-sync-{i}", args.node_endpoint, api_key)
+
+    keys = [[generate_key() for _ in range(args.peers_per_sync)] for _ in api_keys]
+    recorder = Recorder()
+
+    for _ in range(args.rounds):
+        payloads = [build_sync_payload(peer_keys) for peer_keys in keys]
+        await asyncio.gather(*(
+            recorder.call("POST /clusters/sync", client.post("/clusters/sync", json=body, headers={"X-API-Key": key}))
+            for key, body in zip(api_keys, payloads)
+        ))
+
+    recorder.report(f"sync storm: {args.clusters} clusters x {args.peers_per_sync} peers, {args.rounds} rounds")
+
+
+async def stats_poll(client: httpx.AsyncClient, args) -> None:
+    """Dashboards polling the read endpoints for a fixed duration."""
+    recorder = Recorder()
+    paths = ["/statistics/", "/clusters/", "/clients/", "/peers/", "/tariffs/active"]
+    deadline = time.perf_counter() + args.duration
+
+    async def worker(offset: int) -> None:
+        i = offset
+        while time.perf_counter() < deadline:
+            path = paths[i % len(paths)]
+            await recorder.call(f"GET {path}", client.get(path))
+            i += 1
+
+    await asyncio.gather(*(worker(i) for i in range(args.concurrency)))
+    recorder.report(f"stats poll: {args.duration}s, concurrency {args.concurrency}")
+
+
+SCENARIOS = {"peer-storm": peer_storm, "sync-storm": sync_storm, "stats-poll": stats_poll}
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("scenario", choices=[*SCENARIOS, "all"])
+    parser.add_argument("--base-url", default=os.getenv("LOADTEST_BASE_URL", "http://localhost:8000/api/v1"))
+    parser.add_argument("--username", default=os.getenv("ADMIN_USERNAME", "admin"))
+    parser.add_argument("--password", default=os.getenv("ADMIN_PASSWORD", ""))
+    parser.add_argument("--node-endpoint", default="localhost:9100", help="fake node host:port as the API reaches it")
+    parser.add_argument("--node-api-key", default=os.getenv("FAKE_NODE_API_KEY", "loadtest"))
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--peers", type=int, default=200)
+    parser.add_argument("--clusters", type=int, default=10)
+    parser.add_argument("--peers-per-sync", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--duration", type=float, default=30)
+    args = parser.parse_args()
+
+    limits = httpx.Limits(max_connections=max(args.concurrency, args.clusters) + 10)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=60, limits=limits) as client:
+        await login(client, args.username, args.password)
+        names = list(SCENARIOS) if args.scenario == "all" else [args.scenario]
+        for name in names:
+            await SCENARIOS[name](client, args)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -6,7 +6,7 @@ from sqlalchemy import pool
 from alembic import context
 
 from src.database.base import Base
-from src.database.models import AdminModel, ClusterModel, ClientModel, PeerModel
+from src.database.models import AdminModel, ClusterModel, ClientModel, PeerModel, TariffModel, PeerOutboxModel, ResourceVersionModel
 from src.management.settings import get_settings
 
 settings = get_settings()
@@ -64,6 +64,17 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
+    # src.migrate passes a connection that already holds the migrations lock.
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        context.configure(
+            connection=connection, target_metadata=target_metadata
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
@@ -0,0 +1,43 @@
+"""add peer outbox table
+
+Revision ID: 3c8e1f7a9b42
+Revises: 5f2be39f5bc0
+Create Date: 2026-10-19 10:12:41.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c8e1f7a9b42'
+down_revision: Union[str, Sequence[str], None] = '5f2be39f5bc0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('peer_outbox',
+    sa.Column('cluster_id', sa.UUID(), nullable=False),
+    sa.Column('operation', sa.String(length=50), nullable=False),
+    sa.Column('public_key', sa.String(length=500), nullable=False),
+    sa.Column('status', sa.String(length=50), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('next_attempt_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['cluster_id'], ['clusters.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_peer_outbox_pending', 'peer_outbox', ['cluster_id', 'next_attempt_at'], unique=False, postgresql_where=sa.text("status = 'pending'"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_peer_outbox_pending', table_name='peer_outbox', postgresql_where=sa.text("status = 'pending'"))
+    op.drop_table('peer_outbox')
@@ -0,0 +1,102 @@
+"""add denormalized peer counters
+
+Revision ID: 4e7b2d9c1a53
+Revises: b91f0d3e6a27
+Create Date: 2026-10-19 14:02:47.518230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4e7b2d9c1a53'
+down_revision: Union[str, Sequence[str], None] = 'b91f0d3e6a27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('clients', sa.Column('peers_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('clusters', sa.Column('amnezia_vpn_peers_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('clusters', sa.Column('amnezia_wg_peers_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('clusters', sa.Column('unique_clients_count', sa.Integer(), server_default='0', nullable=False))
+
+    # The clients row is updated first: its row lock serializes concurrent peer
+    # changes of one client, so the unique-client check below sees committed state.
+    op.execute(
+        """
+        CREATE FUNCTION peers_maintain_counters() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('DELETE', 'UPDATE') THEN
+                UPDATE clients SET peers_count = peers_count - 1 WHERE id = OLD.client_id;
+                UPDATE clusters SET
+                    amnezia_vpn_peers_count = amnezia_vpn_peers_count - (OLD.app_type = 'amnezia_vpn')::int,
+                    amnezia_wg_peers_count = amnezia_wg_peers_count - (OLD.app_type = 'amnezia_wg')::int,
+                    unique_clients_count = unique_clients_count - (NOT EXISTS (
+                        SELECT 1 FROM peers
+                        WHERE cluster_id = OLD.cluster_id AND client_id = OLD.client_id AND id <> OLD.id
+                    ))::int
+                WHERE id = OLD.cluster_id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                UPDATE clients SET peers_count = peers_count + 1 WHERE id = NEW.client_id;
+                UPDATE clusters SET
+                    amnezia_vpn_peers_count = amnezia_vpn_peers_count + (NEW.app_type = 'amnezia_vpn')::int,
+                    amnezia_wg_peers_count = amnezia_wg_peers_count + (NEW.app_type = 'amnezia_wg')::int,
+                    unique_clients_count = unique_clients_count + (NOT EXISTS (
+                        SELECT 1 FROM peers
+                        WHERE cluster_id = NEW.cluster_id AND client_id = NEW.client_id AND id <> NEW.id
+                    ))::int
+                WHERE id = NEW.cluster_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER peers_maintain_counters
+        AFTER INSERT OR DELETE OR UPDATE OF client_id, cluster_id, app_type ON peers
+        FOR EACH ROW EXECUTE FUNCTION peers_maintain_counters()
+        """
+    )
+
+    op.execute(
+        """
+        UPDATE clients SET peers_count = counts.total
+        FROM (SELECT client_id, count(*) AS total FROM peers GROUP BY client_id) AS counts
+        WHERE clients.id = counts.client_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE clusters SET
+            amnezia_vpn_peers_count = counts.vpn,
+            amnezia_wg_peers_count = counts.wg,
+            unique_clients_count = counts.clients
+        FROM (
+            SELECT
+                cluster_id,
+                count(*) FILTER (WHERE app_type = 'amnezia_vpn') AS vpn,
+                count(*) FILTER (WHERE app_type = 'amnezia_wg') AS wg,
+                count(DISTINCT client_id) AS clients
+            FROM peers GROUP BY cluster_id
+        ) AS counts
+        WHERE clusters.id = counts.cluster_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER peers_maintain_counters ON peers")
+    op.execute("DROP FUNCTION peers_maintain_counters()")
+    op.drop_column('clusters', 'unique_clients_count')
+    op.drop_column('clusters', 'amnezia_wg_peers_count')
+    op.drop_column('clusters', 'amnezia_vpn_peers_count')
+    op.drop_column('clients', 'peers_count')
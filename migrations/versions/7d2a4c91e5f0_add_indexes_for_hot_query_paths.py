@@ -0,0 +1,49 @@
+"""add indexes for hot query paths
+
+Revision ID: 7d2a4c91e5f0
+Revises: 3c8e1f7a9b42
+Create Date: 2026-10-19 11:04:27.730915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d2a4c91e5f0'
+down_revision: Union[str, Sequence[str], None] = '3c8e1f7a9b42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_clusters_api_key'), 'clusters', ['api_key'], unique=False)
+    op.create_index(
+        'ix_clients_expires_at_expirable',
+        'clients',
+        ['expires_at'],
+        unique=False,
+        postgresql_where=sa.text("is_admin = false AND subscription_status <> 'expired'"),
+    )
+    op.create_index('ix_peers_cluster_id_app_type', 'peers', ['cluster_id', 'app_type'], unique=False)
+    op.create_index('ix_peers_cluster_id_client_id', 'peers', ['cluster_id', 'client_id'], unique=False)
+    # Covered by the composite indexes above and by uq_peer_client_cluster_apptype.
+    op.drop_index(op.f('ix_peers_cluster_id'), table_name='peers')
+    op.drop_index(op.f('ix_peers_client_id'), table_name='peers')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_peers_client_id'), 'peers', ['client_id'], unique=False)
+    op.create_index(op.f('ix_peers_cluster_id'), 'peers', ['cluster_id'], unique=False)
+    op.drop_index('ix_peers_cluster_id_client_id', table_name='peers')
+    op.drop_index('ix_peers_cluster_id_app_type', table_name='peers')
+    op.drop_index(
+        'ix_clients_expires_at_expirable',
+        table_name='clients',
+        postgresql_where=sa.text("is_admin = false AND subscription_status <> 'expired'"),
+    )
+    op.drop_index(op.f('ix_clusters_api_key'), table_name='clusters')
@@ -0,0 +1,53 @@
+"""add resource version sequences
+
+Revision ID: b91f0d3e6a27
+Revises: 7d2a4c91e5f0
+Create Date: 2026-10-19 12:31:08.204417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b91f0d3e6a27'
+down_revision: Union[str, Sequence[str], None] = '7d2a4c91e5f0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VERSIONED_TABLES = ("clients", "clusters", "peers", "tariffs")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Statement-level triggers bump a per-table sequence on every write. nextval()
+    # takes no row locks, so concurrent writers never wait on each other.
+    op.execute(
+        """
+        CREATE FUNCTION bump_resource_version() RETURNS trigger AS $$
+        BEGIN
+            PERFORM nextval(TG_ARGV[0]::regclass);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for table in VERSIONED_TABLES:
+        op.execute(f"CREATE SEQUENCE {table}_version_seq")
+        op.execute(
+            f"""
+            CREATE TRIGGER {table}_bump_version
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_resource_version('{table}_version_seq')
+            """
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in VERSIONED_TABLES:
+        op.execute(f"DROP TRIGGER {table}_bump_version ON {table}")
+        op.execute(f"DROP SEQUENCE {table}_version_seq")
+    op.execute("DROP FUNCTION bump_resource_version()")
@@ -0,0 +1,114 @@
+"""commit-bound resource versions
+
+Revision ID: c6f1a8e3d720
+Revises: 4e7b2d9c1a53
+Create Date: 2026-10-20 09:12:40.381522
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6f1a8e3d720'
+down_revision: Union[str, Sequence[str], None] = '4e7b2d9c1a53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VERSIONED_TABLES = ("clients", "clusters", "peers", "tariffs")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # nextval() is visible to other sessions before the writing transaction
+    # commits, so a reader could pair the new version with the old rows. The
+    # versions now live in a table row updated by the writing transaction itself.
+    op.create_table(
+        'resource_versions',
+        sa.Column('table_name', sa.String(length=63), nullable=False),
+        sa.Column('version', sa.BigInteger(), server_default='0', nullable=False),
+        sa.PrimaryKeyConstraint('table_name'),
+    )
+    for table in VERSIONED_TABLES:
+        # Continue past the sequence so an ETag computed before the upgrade never comes back.
+        op.execute(
+            f"""
+            INSERT INTO resource_versions (table_name, version)
+            SELECT '{table}', last_value + 1 FROM {table}_version_seq
+            """
+        )
+        op.execute(f"DROP TRIGGER {table}_bump_version ON {table}")
+        op.execute(f"DROP SEQUENCE {table}_version_seq")
+    op.execute("DROP FUNCTION bump_resource_version()")
+
+    # Deferred to commit time, so the version row is locked only while the
+    # transaction commits, and bumped once per table per transaction: the
+    # transaction-local setting skips the remaining row events.
+    op.execute(
+        """
+        CREATE FUNCTION bump_resource_version() RETURNS trigger AS $$
+        BEGIN
+            IF current_setting('resource_versions.' || TG_TABLE_NAME, true) = 'bumped' THEN
+                RETURN NULL;
+            END IF;
+            PERFORM set_config('resource_versions.' || TG_TABLE_NAME, 'bumped', true);
+            UPDATE resource_versions SET version = version + 1 WHERE table_name = TG_TABLE_NAME;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for table in VERSIONED_TABLES:
+        op.execute(
+            f"""
+            CREATE CONSTRAINT TRIGGER {table}_bump_version
+            AFTER INSERT OR UPDATE OR DELETE ON {table}
+            DEFERRABLE INITIALLY DEFERRED
+            FOR EACH ROW EXECUTE FUNCTION bump_resource_version()
+            """
+        )
+        # Constraint triggers are row-level only.
+        op.execute(
+            f"""
+            CREATE TRIGGER {table}_bump_version_truncate
+            AFTER TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_resource_version()
+            """
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in VERSIONED_TABLES:
+        op.execute(f"DROP TRIGGER {table}_bump_version_truncate ON {table}")
+        op.execute(f"DROP TRIGGER {table}_bump_version ON {table}")
+    op.execute("DROP FUNCTION bump_resource_version()")
+
+    op.execute(
+        """
+        CREATE FUNCTION bump_resource_version() RETURNS trigger AS $$
+        BEGIN
+            PERFORM nextval(TG_ARGV[0]::regclass);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for table in VERSIONED_TABLES:
+        op.execute(f"CREATE SEQUENCE {table}_version_seq")
+        op.execute(
+            f"""
+            SELECT setval('{table}_version_seq', version + 1)
+            FROM resource_versions WHERE table_name = '{table}'
+            """
+        )
+        op.execute(
+            f"""
+            CREATE TRIGGER {table}_bump_version
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_resource_version('{table}_version_seq')
+            """
+        )
+    op.drop_table('resource_versions')
@@ -0,0 +1,211 @@
+"""statement-level peer counters
+
+Revision ID: e3b9d5f27c14
+Revises: c6f1a8e3d720
+Create Date: 2026-10-20 15:27:09.640318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3b9d5f27c14'
+down_revision: Union[str, Sequence[str], None] = 'c6f1a8e3d720'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The row trigger decided whether a client was new or gone on a cluster by
+    # looking for its other peers there, but an AFTER ROW trigger already sees
+    # every row of its statement: deleting two peers of one client/cluster pair
+    # subtracted it twice, inserting them never added it. The statement-level
+    # triggers below get all changed rows at once through transition tables and
+    # compare the pair's peers before and after the statement.
+    op.execute("DROP TRIGGER peers_maintain_counters ON peers")
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION peers_maintain_counters() RETURNS trigger AS $$
+        DECLARE
+            changes jsonb;
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                SELECT jsonb_agg(jsonb_build_object(
+                    'client_id', client_id, 'cluster_id', cluster_id, 'app_type', app_type, 'delta', 1
+                )) INTO changes FROM new_peers;
+            ELSIF TG_OP = 'DELETE' THEN
+                SELECT jsonb_agg(jsonb_build_object(
+                    'client_id', client_id, 'cluster_id', cluster_id, 'app_type', app_type, 'delta', -1
+                )) INTO changes FROM old_peers;
+            ELSE
+                SELECT jsonb_agg(change) INTO changes FROM (
+                    SELECT jsonb_build_object(
+                        'client_id', o.client_id, 'cluster_id', o.cluster_id, 'app_type', o.app_type, 'delta', -1
+                    ) AS change
+                    FROM old_peers AS o JOIN new_peers AS n USING (id)
+                    WHERE (o.client_id, o.cluster_id, o.app_type) IS DISTINCT FROM (n.client_id, n.cluster_id, n.app_type)
+                    UNION ALL
+                    SELECT jsonb_build_object(
+                        'client_id', n.client_id, 'cluster_id', n.cluster_id, 'app_type', n.app_type, 'delta', 1
+                    )
+                    FROM old_peers AS o JOIN new_peers AS n USING (id)
+                    WHERE (o.client_id, o.cluster_id, o.app_type) IS DISTINCT FROM (n.client_id, n.cluster_id, n.app_type)
+                ) AS moved;
+            END IF;
+            IF changes IS NULL THEN
+                RETURN NULL;
+            END IF;
+
+            -- The clients rows are locked first, in id order: the lock serializes
+            -- concurrent peer changes of one client, so the pair counts below see
+            -- committed state, and two bulk statements cannot deadlock on it.
+            PERFORM 1 FROM clients
+            WHERE id IN (SELECT (change->>'client_id')::uuid FROM jsonb_array_elements(changes) AS change)
+            ORDER BY id
+            FOR NO KEY UPDATE;
+
+            UPDATE clients SET peers_count = peers_count + counts.delta
+            FROM (
+                SELECT client_id, sum(delta) AS delta
+                FROM jsonb_to_recordset(changes) AS c(client_id uuid, delta int)
+                GROUP BY client_id
+            ) AS counts
+            WHERE clients.id = counts.client_id AND counts.delta <> 0;
+
+            UPDATE clusters SET
+                amnezia_vpn_peers_count = amnezia_vpn_peers_count + counts.vpn,
+                amnezia_wg_peers_count = amnezia_wg_peers_count + counts.wg,
+                unique_clients_count = unique_clients_count + counts.clients
+            FROM (
+                SELECT
+                    pair.cluster_id,
+                    sum(pair.vpn) AS vpn,
+                    sum(pair.wg) AS wg,
+                    sum((present.total > 0)::int - (present.total - pair.delta > 0)::int) AS clients
+                FROM (
+                    SELECT
+                        cluster_id,
+                        client_id,
+                        coalesce(sum(delta) FILTER (WHERE app_type = 'amnezia_vpn'), 0) AS vpn,
+                        coalesce(sum(delta) FILTER (WHERE app_type = 'amnezia_wg'), 0) AS wg,
+                        sum(delta) AS delta
+                    FROM jsonb_to_recordset(changes) AS c(client_id uuid, cluster_id uuid, app_type text, delta int)
+                    GROUP BY cluster_id, client_id
+                ) AS pair
+                CROSS JOIN LATERAL (
+                    SELECT count(*) AS total FROM peers
+                    WHERE peers.cluster_id = pair.cluster_id AND peers.client_id = pair.client_id
+                ) AS present
+                GROUP BY pair.cluster_id
+            ) AS counts
+            WHERE clusters.id = counts.cluster_id AND (counts.vpn, counts.wg, counts.clients) <> (0, 0, 0);
+
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    # Transition tables need one trigger per event, and an UPDATE trigger with
+    # them cannot be limited to columns; unchanged rows are filtered above.
+    op.execute(
+        """
+        CREATE TRIGGER peers_maintain_counters_insert
+        AFTER INSERT ON peers REFERENCING NEW TABLE AS new_peers
+        FOR EACH STATEMENT EXECUTE FUNCTION peers_maintain_counters()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER peers_maintain_counters_update
+        AFTER UPDATE ON peers REFERENCING OLD TABLE AS old_peers NEW TABLE AS new_peers
+        FOR EACH STATEMENT EXECUTE FUNCTION peers_maintain_counters()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER peers_maintain_counters_delete
+        AFTER DELETE ON peers REFERENCING OLD TABLE AS old_peers
+        FOR EACH STATEMENT EXECUTE FUNCTION peers_maintain_counters()
+        """
+    )
+
+    # Counters that the row trigger already got wrong.
+    op.execute("LOCK TABLE peers IN SHARE MODE")
+    op.execute(
+        """
+        UPDATE clients SET peers_count = coalesce(counts.total, 0)
+        FROM clients AS c
+        LEFT JOIN (SELECT client_id, count(*) AS total FROM peers GROUP BY client_id) AS counts
+            ON counts.client_id = c.id
+        WHERE clients.id = c.id AND clients.peers_count <> coalesce(counts.total, 0)
+        """
+    )
+    op.execute(
+        """
+        UPDATE clusters SET
+            amnezia_vpn_peers_count = coalesce(counts.vpn, 0),
+            amnezia_wg_peers_count = coalesce(counts.wg, 0),
+            unique_clients_count = coalesce(counts.clients, 0)
+        FROM clusters AS c
+        LEFT JOIN (
+            SELECT
+                cluster_id,
+                count(*) FILTER (WHERE app_type = 'amnezia_vpn') AS vpn,
+                count(*) FILTER (WHERE app_type = 'amnezia_wg') AS wg,
+                count(DISTINCT client_id) AS clients
+            FROM peers GROUP BY cluster_id
+        ) AS counts ON counts.cluster_id = c.id
+        WHERE clusters.id = c.id
+          AND (clusters.amnezia_vpn_peers_count, clusters.amnezia_wg_peers_count, clusters.unique_clients_count)
+              <> (coalesce(counts.vpn, 0), coalesce(counts.wg, 0), coalesce(counts.clients, 0))
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER peers_maintain_counters_delete ON peers")
+    op.execute("DROP TRIGGER peers_maintain_counters_update ON peers")
+    op.execute("DROP TRIGGER peers_maintain_counters_insert ON peers")
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION peers_maintain_counters() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('DELETE', 'UPDATE') THEN
+                UPDATE clients SET peers_count = peers_count - 1 WHERE id = OLD.client_id;
+                UPDATE clusters SET
+                    amnezia_vpn_peers_count = amnezia_vpn_peers_count - (OLD.app_type = 'amnezia_vpn')::int,
+                    amnezia_wg_peers_count = amnezia_wg_peers_count - (OLD.app_type = 'amnezia_wg')::int,
+                    unique_clients_count = unique_clients_count - (NOT EXISTS (
+                        SELECT 1 FROM peers
+                        WHERE cluster_id = OLD.cluster_id AND client_id = OLD.client_id AND id <> OLD.id
+                    ))::int
+                WHERE id = OLD.cluster_id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                UPDATE clients SET peers_count = peers_count + 1 WHERE id = NEW.client_id;
+                UPDATE clusters SET
+                    amnezia_vpn_peers_count = amnezia_vpn_peers_count + (NEW.app_type = 'amnezia_vpn')::int,
+                    amnezia_wg_peers_count = amnezia_wg_peers_count + (NEW.app_type = 'amnezia_wg')::int,
+                    unique_clients_count = unique_clients_count + (NOT EXISTS (
+                        SELECT 1 FROM peers
+                        WHERE cluster_id = NEW.cluster_id AND client_id = NEW.client_id AND id <> NEW.id
+                    ))::int
+                WHERE id = NEW.cluster_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER peers_maintain_counters
+        AFTER INSERT OR DELETE OR UPDATE OF client_id, cluster_id, app_type ON peers
+        FOR EACH ROW EXECUTE FUNCTION peers_maintain_counters()
+        """
+    )
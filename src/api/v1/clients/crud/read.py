@@ -1,29 +1,23 @@
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Response, status
 
-from src.database.connection import SessionDep
-from src.database.management.operations.client import get_client_by_id, get_all_clients
+from src.database.connection import ReadSessionDep
+from src.database.management.operations.client import get_client_row, get_all_client_rows
 from src.api.v1.clients.logger import logger
-from src.api.v1.clients.schemas import ClientWithPeersResponse
+from src.api.v1.clients.schemas import ClientWithPeersResponse, client_rows_adapter
 from src.api.v1.management.exceptions.client import ClientNotFoundException
 
 router = APIRouter()
 
 
 @router.get("/", response_model=list[ClientWithPeersResponse])
-async def list_clients(session: SessionDep) -> list[ClientWithPeersResponse]:
+async def list_clients(session: ReadSessionDep) -> Response:
     try:
-        clients = await get_all_clients(session)
-        result = []
+        clients = await get_all_client_rows(session)
 
-        for client in clients:
-            response = ClientWithPeersResponse.model_validate(client)
-            response.peers_count = len(client.peers)
-            result.append(response)
-
-        logger.info(f"Retrieved {len(result)} clients")
-        return result
+        logger.info(f"Retrieved {len(clients)} clients")
+        return Response(content=client_rows_adapter.dump_json(clients), media_type="application/json")
 
     except Exception as e:
         logger.error(f"Error listing clients: {e}")
@@ -35,19 +29,16 @@ async def list_clients(session: SessionDep) -> list[ClientWithPeersResponse]:
 
 @router.get("/{client_id}", response_model=ClientWithPeersResponse)
 async def get_client(
-    session: SessionDep,
+    session: ReadSessionDep,
     client_id: UUID,
 ) -> ClientWithPeersResponse:
     try:
-        client = await get_client_by_id(session, client_id)
+        client = await get_client_row(session, client_id)
         if not client:
             raise ClientNotFoundException()
 
-        response = ClientWithPeersResponse.model_validate(client)
-        response.peers_count = len(client.peers)
-
-        logger.info(f"Retrieved client: {client.username}")
-        return response
+        logger.info(f"Retrieved client: {client['username']}")
+        return ClientWithPeersResponse.model_validate(client)
 
     except ClientNotFoundException:
         raise
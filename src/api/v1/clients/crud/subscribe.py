@@ -4,12 +4,12 @@ from fastapi import APIRouter, HTTPException, status
 from src.database.connection import SessionDep
 from src.database.management.operations.client import get_client_by_id, subscribe_client
 from src.database.management.operations.peer import get_peers_by_client_id
-from src.database.management.operations.cluster import get_cluster_by_id
+from src.database.management.operations.outbox import enqueue_peer_deletion
 from src.api.v1.clients.logger import logger
 from src.api.v1.clients.schemas import SubscribeRequest, ClientResponse
 from src.api.v1.management.exceptions.client import ClientNotFoundException
-from src.api.v1.management.http_client import ClusterAPIClient
 from src.database.models import SubscriptionStatus
+from src.services.tariff_catalog import tariff_catalog
 
 router = APIRouter()
 
@@ -25,6 +25,10 @@ async def subscribe_client_endpoint(
         if not client:
             raise ClientNotFoundException()
 
+        tariff = await tariff_catalog.get_by_code(payload.tariff_code)
+        if not tariff or not tariff.is_active:
+            raise ValueError(f"Tariff {payload.tariff_code} is not available")
+
         should_delete_peers = (
             client.subscription_status == SubscriptionStatus.EXPIRED.value or
             client.subscription_status == SubscriptionStatus.TRIAL.value
@@ -34,16 +38,11 @@ async def subscribe_client_endpoint(
             peers = await get_peers_by_client_id(session, client_id)
 
             for peer in peers:
-                try:
-                    cluster = await get_cluster_by_id(session, peer.cluster_id)
-                    if cluster:
-                        cluster_client = ClusterAPIClient(cluster.endpoint, cluster.api_key)
-                        await cluster_client.delete_peer(peer.public_key)
-                        logger.info(f"Peer deleted from cluster during subscription: {peer.public_key}")
-                except Exception as e:
-                    logger.warning(f"Failed to delete peer {peer.id} from cluster (may already be deleted): {e}")
+                await enqueue_peer_deletion(session, peer.cluster_id, peer.public_key)
+                logger.info(f"Peer deletion queued during subscription: {peer.public_key}")
 
-        updated_client = await subscribe_client(session, client_id, payload.tariff_code)
+        # Queued deletions are committed together with the subscription change.
+        updated_client = await subscribe_client(session, client_id, tariff.days)
 
         logger.info(f"Client subscribed: {updated_client.username} ({client_id}) - tariff: {payload.tariff_code}")
         return ClientResponse.model_validate(updated_client)
@@ -1,5 +1,6 @@
 import uuid
-from pydantic import BaseModel, Field
+from typing_extensions import TypedDict
+from pydantic import BaseModel, Field, TypeAdapter
 from datetime import datetime
 
 
@@ -33,3 +34,20 @@ class ClientResponse(BaseModel):
 
 class ClientWithPeersResponse(ClientResponse):
     peers_count: int = 0
+
+
+class ClientWithPeersRow(TypedDict):
+    """ClientWithPeersResponse as a plain dict, serialized without building a model per row."""
+    id: uuid.UUID
+    username: str
+    expires_at: datetime | None
+    subscription_status: str
+    trial_used: bool
+    is_admin: bool
+    last_subscription_at: datetime | None
+    created_at: datetime
+    updated_at: datetime
+    peers_count: int
+
+
+client_rows_adapter = TypeAdapter(list[ClientWithPeersRow])
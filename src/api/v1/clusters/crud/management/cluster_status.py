@@ -1,22 +1,19 @@
-import uuid
 from datetime import datetime, timezone
 
 from src.api.v1.clusters.schemas import ClusterWithStatusResponse
 from src.management.settings import get_settings
-from src.redis.management.cluster_status import ClusterStatusCache
+from src.redis.management.cluster_status import ClusterStatusSummary
 
 
-cache = ClusterStatusCache()
 settings = get_settings()
 
 
-async def enrich_cluster_status(
+def enrich_cluster_status(
     response: ClusterWithStatusResponse,
-    cluster_id: uuid.UUID,
+    summary: ClusterStatusSummary,
 ) -> None:
-    cluster_id_str = str(cluster_id)
-    traffic = await cache.get_traffic(cluster_id_str)
-    protocol = await cache.get_protocol(cluster_id_str)
+    traffic = summary.traffic
+    protocol = summary.protocol
 
     if traffic is not None:
         response.peers_count = traffic.get("total_peers", response.peers_count)
@@ -2,7 +2,7 @@ from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, status
 
-from src.database.connection import SessionDep
+from src.database.connection import ReadSessionDep
 from src.database.management.operations.cluster import (
     get_cluster_by_id,
     get_all_clusters,
@@ -11,19 +11,22 @@ from src.api.v1.clusters.logger import logger
 from src.api.v1.clusters.crud.management.cluster_status import enrich_cluster_status
 from src.api.v1.clusters.schemas import ClusterWithStatusResponse
 from src.api.v1.management.exceptions.cluster import ClusterNotFoundException
+from src.redis.management.cluster_status import ClusterStatusCache
 
 router = APIRouter()
+cache = ClusterStatusCache()
 
 
 @router.get("/", response_model=list[ClusterWithStatusResponse])
-async def list_clusters(session: SessionDep) -> list[ClusterWithStatusResponse]:
+async def list_clusters(session: ReadSessionDep) -> list[ClusterWithStatusResponse]:
     try:
         clusters = await get_all_clusters(session)
+        summaries = await cache.get_cluster_summaries([str(cluster.id) for cluster in clusters])
         result = []
 
         for cluster in clusters:
             response = ClusterWithStatusResponse.model_validate(cluster)
-            await enrich_cluster_status(response, cluster.id)
+            enrich_cluster_status(response, summaries[str(cluster.id)])
             result.append(response)
 
         logger.info(f"Retrieved {len(result)} clusters")
@@ -39,7 +42,7 @@ async def list_clusters(session: SessionDep) -> list[ClusterWithStatusResponse]:
 
 @router.get("/{cluster_id}", response_model=ClusterWithStatusResponse)
 async def get_cluster(
-    session: SessionDep,
+    session: ReadSessionDep,
     cluster_id: UUID,
 ) -> ClusterWithStatusResponse:
     try:
@@ -48,7 +51,8 @@ async def get_cluster(
             raise ClusterNotFoundException()
 
         response = ClusterWithStatusResponse.model_validate(cluster)
-        await enrich_cluster_status(response, cluster_id)
+        summaries = await cache.get_cluster_summaries([str(cluster_id)])
+        enrich_cluster_status(response, summaries[str(cluster_id)])
 
         logger.info(f"Retrieved cluster: {cluster.name}")
         return response
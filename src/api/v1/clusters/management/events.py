@@ -0,0 +1,79 @@
+import asyncio
+from itertools import count
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+
+from src.api.v1.clusters.logger import logger
+from src.api.v1.clusters.schemas import StreamTokenResponse
+from src.api.v1.management.middlewares.auth import get_current_admin, get_stream_reader
+from src.management.security import create_stream_token
+from src.management.settings import get_settings
+from src.services.status_stream import LAGGED, status_stream
+
+router = APIRouter()
+settings = get_settings()
+
+
+async def _event_source(cluster_id: UUID | None):
+    async with status_stream.subscribe(str(cluster_id) if cluster_id else None) as subscription:
+        logger.info(f"Status stream opened ({status_stream.subscribers} subscribers)")
+        yield "retry: 3000\n\n"
+        event_ids = count(1)
+        try:
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        subscription.queue.get(),
+                        timeout=settings.status_stream_heartbeat_seconds,
+                    )
+                except asyncio.TimeoutError:
+                    # keeps proxies from closing an idle connection
+                    yield ": keepalive\n\n"
+                    continue
+                if event is LAGGED:
+                    yield "event: lagged\ndata: {}\n\n"
+                    return
+                yield f"id: {next(event_ids)}\nevent: {event.type}\ndata: {event.raw}\n\n"
+        finally:
+            logger.info("Status stream closed")
+
+
+@router.post("/events/token", response_model=StreamTokenResponse)
+async def create_status_events_token(
+    request: Request,
+    admin: str = Depends(get_current_admin),
+) -> StreamTokenResponse:
+    """
+    Short-lived token for opening /clusters/events from a browser, where
+    EventSource cannot send an Authorization header. It is only checked when the
+    stream is opened, so fetch a new one before every (re)connect.
+    """
+    token = create_stream_token(admin)
+    return StreamTokenResponse(
+        token=token,
+        expires_in=settings.status_stream_token_expires_seconds,
+        url=f"{request.url_for('stream_status_events')}?token={token}",
+    )
+
+
+@router.get("/events", dependencies=[Depends(get_stream_reader)])
+async def stream_status_events(cluster_id: UUID | None = Query(None)) -> StreamingResponse:
+    """
+    Server-sent events with cluster and peer status changes as nodes sync.
+
+    "cluster" events carry the runtime state and traffic totals, "peers" events
+    the peers whose status changed (or only their count when there are more than
+    status_stream_max_peers_per_event). After a "lagged" event the stream ends;
+    reconnect and refetch.
+
+    Authenticates with the admin access token, or with ?token= from
+    POST /clusters/events/token for EventSource. EventSource retries with the
+    same URL, which fails once that token expires: reconnect with a new token.
+    """
+    return StreamingResponse(
+        _event_source(cluster_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
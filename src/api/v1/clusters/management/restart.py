@@ -24,7 +24,7 @@ async def restart_cluster(
 
         logger.info(f"Initiating restart for cluster: {cluster.name}")
 
-        client = ClusterAPIClient(cluster.endpoint, cluster.api_key)
+        client = ClusterAPIClient(cluster.endpoint, cluster.api_key, cluster.name)
         await client.restart_server()
 
         logger.info(f"Cluster restarted: {cluster.name}")
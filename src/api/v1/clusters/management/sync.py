@@ -12,8 +12,12 @@ from src.api.v1.clusters.schemas import ClusterSyncRequest, ClusterSyncResponse
 from src.api.v1.management.exceptions.cluster import ClusterAuthException
 from src.api.v1.management.http_client import ClusterAPIClient
 from src.redis.management.cluster_status import ClusterStatusCache
+from src.management.metrics import CLUSTER_PEERS, SYNC_PAYLOAD_PEERS, SYNC_PEER_CACHE_UPDATES
+from src.management.settings import get_settings
+from src.services.status_stream import status_stream
 
 router = APIRouter()
+settings = get_settings()
 cache = ClusterStatusCache()
 
 
@@ -38,7 +42,7 @@ async def sync_cluster(
 
         if runtime_container_name is None or runtime_container_status is None:
             try:
-                client = ClusterAPIClient(cluster.endpoint, cluster.api_key)
+                client = ClusterAPIClient(cluster.endpoint, cluster.api_key, cluster.name)
                 server_status = await client.get_server_status()
                 runtime_container_name = runtime_container_name or server_status.get("container_name")
                 runtime_container_status = runtime_container_status or server_status.get("status")
@@ -64,20 +68,41 @@ async def sync_cluster(
         protocol_cache_changed = await cache.save_protocol_if_changed(cluster_id_str, runtime_protocol)
         traffic_cache_changed = await cache.save_traffic_if_changed(cluster_id_str, traffic_data)
 
-        peer_cache_updates = 0
-        for peer in payload.peers:
-            peer_data = {
+        peer_statuses = {
+            peer.public_key: {
                 "public_key": peer.public_key,
                 "endpoint": peer.endpoint,
                 "allowed_ips": peer.allowed_ips,
-                "last_handshake": peer.last_handshake.isoformat() if peer.last_handshake else None,
+                "last_handshake": peer.last_handshake,
                 "rx_bytes": peer.rx_bytes,
                 "tx_bytes": peer.tx_bytes,
                 "online": peer.online,
                 "persistent_keepalive": peer.persistent_keepalive,
             }
-            if await cache.save_peer_status_if_changed(cluster_id_str, peer.public_key, peer_data):
-                peer_cache_updates += 1
+            for peer in payload.peers
+        }
+        changed_peers = await cache.save_peer_statuses_if_changed(cluster_id_str, peer_statuses)
+        peer_cache_updates = len(changed_peers)
+
+        if db_runtime_changed or protocol_cache_changed or traffic_cache_changed:
+            await status_stream.publish("cluster", cluster_id_str, {
+                "name": cluster.name,
+                "protocol": runtime_protocol,
+                "container_name": runtime_container_name,
+                "container_status": runtime_container_status,
+                "traffic": traffic_data,
+            })
+        if changed_peers:
+            if len(changed_peers) <= settings.status_stream_max_peers_per_event:
+                peers_event = {"changed": len(changed_peers), "peers": [peer_statuses[key] for key in changed_peers]}
+            else:
+                peers_event = {"changed": len(changed_peers), "peers": None}
+            await status_stream.publish("peers", cluster_id_str, peers_event)
+
+        SYNC_PAYLOAD_PEERS.observe(len(payload.peers))
+        SYNC_PEER_CACHE_UPDATES.inc(peer_cache_updates)
+        CLUSTER_PEERS.labels(cluster=cluster.name, state="total").set(payload.server_traffic.total_peers)
+        CLUSTER_PEERS.labels(cluster=cluster.name, state="online").set(payload.server_traffic.online_peers)
 
         logger.info(
             f"Synced cluster {cluster.name}: {payload.server_traffic.total_peers} peers, "
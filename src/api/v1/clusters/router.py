@@ -1,7 +1,7 @@
 from fastapi import APIRouter
 
 from src.api.v1.clusters.crud import create, read, update, delete
-from src.api.v1.clusters.management import sync, restart
+from src.api.v1.clusters.management import sync, restart, events
 
 router = APIRouter()
 
@@ -14,3 +14,7 @@ router.include_router(restart.router)
 # Отдельный роутер для синхронизации, нужен для отдельного управления правами доступа
 sync_router = APIRouter()
 sync_router.include_router(sync.router)
+
+# Долгоживущий SSE-поток, без условных GET и кэша ответов
+events_router = APIRouter()
+events_router.include_router(events.router)
@@ -70,6 +70,12 @@ class RestartClusterResponse(BaseModel):
     message: str
 
 
+class StreamTokenResponse(BaseModel):
+    token: str
+    expires_in: int
+    url: str
+
+
 class ClusterSyncResponse(BaseModel):
     status: str
     timestamp: datetime
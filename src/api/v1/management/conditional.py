@@ -0,0 +1,95 @@
+import hashlib
+import time
+
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+
+from src.database.connection import ReadSessionDep
+from src.database.management.operations.versions import get_resource_versions
+from src.api.v1.management.exceptions.cache import NotModifiedException, CachedResponseException
+from src.management.logger import configure_logger
+from src.management.settings import get_settings
+from src.redis.management.response_cache import ResponseCache
+from src.services.tariff_catalog import tariff_catalog
+
+logger = configure_logger("CONDITIONAL", "blue")
+settings = get_settings()
+response_cache = ResponseCache()
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+class _ConditionalGet:
+    def __init__(self, bucket_seconds: int | None = None, shared_cache: bool = True):
+        self.bucket_seconds = bucket_seconds
+        self.shared_cache = shared_cache
+
+    async def _respond(self, request: Request, response: Response, watermark: str) -> None:
+        parts = [request.url.path, request.url.query, watermark]
+        if self.bucket_seconds:
+            # Responses that also depend on wall-clock time (TTL-based status, expiring download links).
+            parts.append(str(int(time.time() // self.bucket_seconds)))
+        digest = hashlib.sha1("|".join(parts).encode()).hexdigest()
+        etag = f'"{digest}"'
+
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            raise NotModifiedException(etag)
+
+        if self.shared_cache and settings.response_cache_enabled:
+            body = await response_cache.get(etag)
+            if body is not None:
+                raise CachedResponseException(body, etag)
+            request.state.response_cache_etag = etag
+
+        response.headers["ETag"] = etag
+
+
+class ConditionalGet(_ConditionalGet):
+    """
+    Router dependency for GET endpoints backed by the given tables.
+
+    The ETag is derived from the tables' write counters, so checking it costs one
+    query. The counters commit together with the rows, so the read replica can
+    serve them too.
+    """
+
+    def __init__(self, *tables: str, bucket_seconds: int | None = None, shared_cache: bool = True):
+        super().__init__(bucket_seconds=bucket_seconds, shared_cache=shared_cache)
+        self.tables = tables
+
+    async def __call__(self, request: Request, response: Response, session: ReadSessionDep) -> None:
+        if request.method != "GET":
+            return
+
+        try:
+            versions = await get_resource_versions(session, self.tables)
+        except Exception as e:
+            logger.error(f"Failed to read resource versions for {self.tables}: {e}")
+            return
+
+        await self._respond(request, response, ":".join(map(str, versions)))
+
+
+class TariffCatalogConditionalGet(_ConditionalGet):
+    """Router dependency for tariff endpoints, versioned by the in-process tariff catalog."""
+
+    async def __call__(self, request: Request, response: Response) -> None:
+        if request.method != "GET":
+            return
+        await self._respond(request, response, await tariff_catalog.get_fingerprint())
+
+
+async def cached_response_handler(request: Request, exc: CachedResponseException) -> Response:
+    return Response(
+        content=exc.body,
+        media_type=JSONResponse.media_type,
+        headers={"ETag": exc.etag, "X-Cache": "HIT"},
+    )
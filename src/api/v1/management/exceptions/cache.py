@@ -0,0 +1,26 @@
+from fastapi import HTTPException, status
+
+
+class NotModifiedException(HTTPException):
+    def __init__(self, etag: str):
+        super().__init__(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag},
+        )
+
+
+class CachedResponseException(Exception):
+    """Short-circuits a GET request with a body from the shared response cache."""
+
+    def __init__(self, body: str, etag: str):
+        self.body = body
+        self.etag = etag
+
+
+class CacheUnavailableException(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Cache service unavailable",
+            headers={"Retry-After": "1"},
+        )
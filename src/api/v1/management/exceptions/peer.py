@@ -23,3 +23,11 @@ class PeerDuplicateAppTypeException(HTTPException):
             status_code=status.HTTP_409_CONFLICT,
             detail="Peer with this app_type already exists for this client on this cluster",
         )
+
+
+class PeerConfigNotFoundException(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Peer config not found",
+        )
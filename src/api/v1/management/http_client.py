@@ -4,6 +4,8 @@ from typing import Any
 
 from src.management.logger import configure_logger
 from src.management.settings import get_settings
+from src.management.metrics import cluster_call
+from src.management.tracing import inject_trace_headers
 from src.api.v1.management.exceptions.cluster import ClusterAPIException
 
 logger = configure_logger("ClusterAPIClient", "cyan")
@@ -11,21 +13,24 @@ settings = get_settings()
 
 
 class ClusterAPIClient:
-    def __init__(self, endpoint: str, api_key: str, timeout: int | None = None):
+    def __init__(self, endpoint: str, api_key: str, name: str, timeout: int | None = None):
+        # Metrics are labelled with the cluster name, never with its address.
+        self.name = name
         self.protocol = "http" if settings.development else "http"
         self.endpoint = f"{self.protocol}://{endpoint.rstrip('/')}"
         self.api_key = api_key
         self.timeout = timeout if timeout is not None else settings.cluster_api_timeout
         self.headers = {"X-API-Key": api_key}
 
+    @cluster_call("get_server_status")
     async def get_server_status(self) -> dict[str, Any]:
         url = f"{self.endpoint}/api/v1/server/status"
 
         try:
             async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, headers=self.headers)
+                response = await client.get(url, headers=inject_trace_headers(self.headers))
                 response.raise_for_status()
-                logger.debug(f"Server status retrieved from {self.endpoint}")
+                logger.debug("Server status retrieved from {}", self.endpoint)
                 return response.json()
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error getting server status from {self.endpoint}: {e}")
@@ -37,12 +42,13 @@ class ClusterAPIClient:
             logger.error(f"Error getting server status from {self.endpoint}: {e}")
             raise ClusterAPIException(f"Failed to get server status: {str(e)}")
 
+    @cluster_call("restart_server")
     async def restart_server(self) -> dict[str, Any]:
         url = f"{self.endpoint}/api/v1/server/restart"
 
         try:
             async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(url, headers=self.headers)
+                response = await client.post(url, headers=inject_trace_headers(self.headers))
                 response.raise_for_status()
                 logger.info(f"Server restart initiated on {self.endpoint}")
                 return response.json()
@@ -56,6 +62,7 @@ class ClusterAPIClient:
             logger.error(f"Error restarting server on {self.endpoint}: {e}")
             raise ClusterAPIException(f"Failed to restart server: {str(e)}")
 
+    @cluster_call("create_peer")
     async def create_peer(self, app_type: str, protocol: str) -> dict[str, Any]:
         """Create a new peer on cluster. Cluster generates keys, IP, and endpoint."""
         url = f"{self.endpoint}/api/v1/peers/"
@@ -66,7 +73,7 @@ class ClusterAPIClient:
 
         try:
             async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(url, headers=self.headers, json=peer_data)
+                response = await client.post(url, headers=inject_trace_headers(self.headers), json=peer_data)
                 response.raise_for_status()
                 logger.info(f"Peer created on {self.endpoint}")
                 return response.json()
@@ -80,13 +87,14 @@ class ClusterAPIClient:
             logger.error(f"Error creating peer on {self.endpoint}: {e}")
             raise ClusterAPIException(f"Failed to create peer: {str(e)}")
 
+    @cluster_call("recreate_peer")
     async def recreate_peer(self, peer_data: dict[str, Any]) -> dict[str, Any]:
         """Recreate an existing peer on cluster with provided data (for updates)."""
         url = f"{self.endpoint}/api/v1/peers/"
 
         try:
             async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(url, headers=self.headers, json=peer_data)
+                response = await client.post(url, headers=inject_trace_headers(self.headers), json=peer_data)
                 response.raise_for_status()
                 logger.info(f"Peer recreated on {self.endpoint}")
                 return response.json()
@@ -100,17 +108,21 @@ class ClusterAPIClient:
             logger.error(f"Error recreating peer on {self.endpoint}: {e}")
             raise ClusterAPIException(f"Failed to recreate peer: {str(e)}")
 
+    @cluster_call("delete_peer")
     async def delete_peer(self, public_key: str) -> dict[str, Any]:
         url = f"{self.endpoint}/api/v1/peers/"
         payload = {"public_key": public_key}
 
         try:
             async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.request("DELETE", url, headers=self.headers, json=payload)
+                response = await client.request("DELETE", url, headers=inject_trace_headers(self.headers), json=payload)
                 response.raise_for_status()
                 logger.info(f"Peer {public_key} deleted on {self.endpoint}")
                 return response.json()
         except httpx.HTTPStatusError as e:
+            if e.response.status_code == httpx.codes.NOT_FOUND:
+                logger.info(f"Peer {public_key} is already absent on {self.endpoint}")
+                return {}
             logger.error(f"HTTP error deleting peer on {self.endpoint}: {e}")
             raise ClusterAPIException(f"Server returned status {e.response.status_code}")
         except httpx.TimeoutException:
@@ -120,14 +132,15 @@ class ClusterAPIClient:
             logger.error(f"Error deleting peer on {self.endpoint}: {e}")
             raise ClusterAPIException(f"Failed to delete peer: {str(e)}")
 
+    @cluster_call("get_peer")
     async def get_peer(self, peer_id: uuid.UUID) -> dict[str, Any]:
         url = f"{self.endpoint}/api/v1/peers/{peer_id}"
 
         try:
             async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, headers=self.headers)
+                response = await client.get(url, headers=inject_trace_headers(self.headers))
                 response.raise_for_status()
-                logger.debug(f"Peer {peer_id} retrieved from {self.endpoint}")
+                logger.debug("Peer {} retrieved from {}", peer_id, self.endpoint)
                 return response.json()
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error getting peer from {self.endpoint}: {e}")
@@ -139,14 +152,15 @@ class ClusterAPIClient:
             logger.error(f"Error getting peer from {self.endpoint}: {e}")
             raise ClusterAPIException(f"Failed to get peer: {str(e)}")
 
+    @cluster_call("get_all_peers")
     async def get_all_peers(self) -> list[dict[str, Any]]:
         url = f"{self.endpoint}/api/v1/peers/"
 
         try:
             async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, headers=self.headers)
+                response = await client.get(url, headers=inject_trace_headers(self.headers))
                 response.raise_for_status()
-                logger.debug(f"All peers retrieved from {self.endpoint}")
+                logger.debug("All peers retrieved from {}", self.endpoint)
                 return response.json()
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error getting peers from {self.endpoint}: {e}")
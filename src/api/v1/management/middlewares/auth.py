@@ -1,10 +1,14 @@
+import hmac
+
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from fastapi import Depends
+from fastapi import Depends, Query
 import jwt
+from redis.exceptions import RedisError
 
 from src.management.settings import get_settings
 from src.management.security import decode_token
 from src.api.v1.management.exceptions.auth import InvalidTokenException, TokenNotProvidedException
+from src.api.v1.management.exceptions.cache import CacheUnavailableException
 from src.redis.client import RedisClient
 
 settings = get_settings()
@@ -21,11 +25,20 @@ async def get_current_admin(
     token = credentials.credentials
     redis_client = RedisClient()
 
-    if await redis_client.is_token_blacklisted(token):
+    try:
+        blacklisted = await redis_client.is_token_blacklisted(token)
+    except RedisError:
+        # Fail closed: a logged-out token must not work while Redis is down,
+        # but callers should retry rather than see a server error.
+        raise CacheUnavailableException()
+    if blacklisted:
         raise InvalidTokenException()
 
     try:
         payload = decode_token(token)
+        # Refresh, config download and stream tokens share the signing key.
+        if payload.get("type") != "access":
+            raise InvalidTokenException()
         username: str = payload.get("sub")
         if username is None:
             raise InvalidTokenException()
@@ -34,3 +47,36 @@ async def get_current_admin(
         raise InvalidTokenException()
     except jwt.InvalidTokenError:
         raise InvalidTokenException()
+
+
+async def get_metrics_reader(
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+) -> str:
+    """Prometheus authenticates with METRICS_TOKEN, admins with their access token."""
+    if (
+        settings.metrics_token
+        and credentials
+        and hmac.compare_digest(credentials.credentials.encode(), settings.metrics_token.encode())
+    ):
+        return "metrics"
+    return await get_current_admin(credentials)
+
+
+async def get_stream_reader(
+    token: str | None = Query(None),
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+) -> str:
+    """
+    Browsers open the event stream with a ?token= from /clusters/events/token,
+    since EventSource cannot send headers; other clients use their access token.
+    """
+    if token is None:
+        return await get_current_admin(credentials)
+    try:
+        payload = decode_token(token)
+    except jwt.InvalidTokenError:
+        raise InvalidTokenException()
+    username = payload.get("sub")
+    if payload.get("type") != "stream" or username is None:
+        raise InvalidTokenException()
+    return username
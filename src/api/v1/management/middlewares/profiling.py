@@ -0,0 +1,114 @@
+import asyncio
+import random
+import re
+import time
+import uuid
+from datetime import datetime, timezone
+
+import jwt
+from redis.exceptions import RedisError
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.api.v1.management.middlewares.streaming import is_streaming_request
+from src.management.logger import configure_logger
+from src.management.profiling import RequestProfile
+from src.management.security import decode_token
+from src.management.settings import get_settings
+from src.minio.client import MinioClient
+from src.redis.client import RedisClient
+
+logger = configure_logger("PROFILING", "magenta")
+settings = get_settings()
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_OBJECT_HEADER = b"x-profile-object"
+
+
+class ProfilingMiddleware:
+    """
+    Profiles a request and stores the report in MinIO under profiling_prefix
+    when one of these holds:
+
+    - the caller sends "X-Profile: 1" with a valid admin bearer token
+      (the object name comes back in X-Profile-Object);
+    - the request falls into profiling_sample_rate;
+    - profiling_slow_threshold_ms is set and the request took longer. Every
+      request is then profiled and the report dropped when it was fast.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.minio = MinioClient()
+        self._uploads: set[asyncio.Task] = set()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or is_streaming_request(scope):
+            await self.app(scope, receive, send)
+            return
+
+        requested = await self._admin_requested(scope)
+        sampled = random.random() < settings.profiling_sample_rate
+        slow_capture = settings.profiling_slow_threshold_ms is not None
+        if not (requested or sampled or slow_capture):
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile(settings.profiling_interval_seconds)
+        if not profile.start():
+            await self.app(scope, receive, send)
+            return
+
+        object_name = self._object_name(scope, profile.extension)
+
+        async def send_wrapper(message: Message) -> None:
+            if requested and message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), (PROFILE_OBJECT_HEADER, object_name.encode())]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            profile.stop()
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            slow = slow_capture and elapsed_ms >= settings.profiling_slow_threshold_ms
+            if requested or sampled or slow:
+                route = scope.get("route")
+                path = route.path if route is not None else scope["path"]
+                logger.info(f"Storing profile of {scope['method']} {path} ({elapsed_ms:.0f} ms) as {object_name}")
+                task = asyncio.create_task(self._store(object_name, profile))
+                self._uploads.add(task)
+                task.add_done_callback(self._uploads.discard)
+
+    async def _admin_requested(self, scope: Scope) -> bool:
+        headers = dict(scope["headers"])
+        if headers.get(PROFILE_HEADER) not in (b"1", b"true"):
+            return False
+        scheme, _, token = headers.get(b"authorization", b"").decode("latin-1").partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            return False
+        try:
+            if decode_token(token).get("type") != "access":
+                return False
+        except jwt.InvalidTokenError:
+            return False
+        try:
+            return not await RedisClient().is_token_blacklisted(token)
+        except RedisError:
+            return False
+
+    @staticmethod
+    def _object_name(scope: Scope, extension: str) -> str:
+        now = datetime.now(timezone.utc)
+        slug = re.sub(r"[^A-Za-z0-9]+", "-", scope["path"]).strip("-") or "root"
+        return (
+            f"{settings.profiling_prefix.rstrip('/')}/{now:%Y/%m/%d}/"
+            f"{now:%H%M%S}-{scope['method'].lower()}-{slug}-{uuid.uuid4().hex[:8]}.{extension}"
+        )
+
+    async def _store(self, object_name: str, profile: RequestProfile) -> None:
+        try:
+            content = await asyncio.to_thread(profile.render)
+            await self.minio.upload_bytes(object_name, content, content_type=profile.content_type)
+        except Exception as e:
+            logger.error(f"Failed to store profile {object_name}: {e}")
@@ -0,0 +1,36 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.management.settings import get_settings
+from src.redis.management.response_cache import ResponseCache
+
+settings = get_settings()
+response_cache = ResponseCache()
+
+
+class ResponseCacheMiddleware:
+    """Stores successful GET bodies of requests that ConditionalGet marked as cacheable."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET" or not settings.response_cache_enabled:
+            await self.app(scope, receive, send)
+            return
+
+        chunks: list[bytes] | None = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal chunks
+            if message["type"] == "http.response.start":
+                state = scope.get("state") or {}
+                if message["status"] == 200 and state.get("response_cache_etag"):
+                    chunks = []
+            elif message["type"] == "http.response.body" and chunks is not None:
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+        if chunks is not None:
+            await response_cache.save(scope["state"]["response_cache_etag"], b"".join(chunks).decode())
@@ -0,0 +1,13 @@
+from starlette.types import Scope
+
+# Long-lived server-sent event streams. Their duration is the connection
+# lifetime, not latency, so profiling, latency metrics and tracing skip them.
+STREAMING_PATHS = frozenset({"/clusters/events"})
+
+
+def is_streaming_request(scope: Scope) -> bool:
+    path = scope["path"]
+    root_path = scope.get("root_path", "")
+    if root_path and path.startswith(root_path):
+        path = path[len(root_path):]
+    return path.rstrip("/") in STREAMING_PATHS
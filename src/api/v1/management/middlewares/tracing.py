@@ -0,0 +1,43 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.api.v1.management.middlewares.streaming import is_streaming_request
+from src.management.tracing import mark_span_error, start_span
+
+
+class TracingMiddleware:
+    """
+    Server span per request, continuing the caller's trace when it sent a
+    traceparent header. Renamed to the route template once routing is done.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or is_streaming_request(scope):
+            await self.app(scope, receive, send)
+            return
+
+        headers = {key.decode("latin-1"): value.decode("latin-1") for key, value in scope["headers"]}
+        method = scope["method"]
+
+        with start_span(
+            method,
+            attributes={"http.request.method": method, "url.path": scope["path"]},
+            kind="server",
+            parent_headers=headers,
+        ) as span:
+            async def send_wrapper(message: Message) -> None:
+                if span is not None and message["type"] == "http.response.start":
+                    span.set_attribute("http.response.status_code", message["status"])
+                    if message["status"] >= 500:
+                        mark_span_error(span, f"HTTP {message['status']}")
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = scope.get("route")
+                if span is not None and route is not None:
+                    span.update_name(f"{method} {route.path}")
+                    span.set_attribute("http.route", route.path)
@@ -1,24 +1,27 @@
-from fastapi import APIRouter, HTTPException, status
+import time
+
+from fastapi import APIRouter, HTTPException, Request, status
 
 from src.database.connection import SessionDep
 from src.database.management.operations.peer import get_peer_by_public_key, get_peer_by_client_cluster_apptype, create_peer
 from src.database.management.operations.client import get_client_by_id
 from src.database.management.operations.cluster import get_cluster_by_id
 from src.api.v1.peers.logger import logger
+from src.api.v1.peers.management.download import config_download_url
 from src.api.v1.peers.schemas import CreatePeerRequest, PeerResponse, ClusterPeerResponse
 from src.api.v1.management.exceptions.peer import PeerAlreadyExistsException, PeerDuplicateAppTypeException
 from src.api.v1.management.exceptions.client import ClientNotFoundException
 from src.api.v1.management.exceptions.cluster import ClusterNotFoundException
 from src.api.v1.management.http_client import ClusterAPIClient
 from src.management.security import hash_password
-from src.minio import MinioClient
+from src.services.peer_configs import peer_configs
 
 router = APIRouter()
-minio_client = MinioClient()
 
 
 @router.post("/", response_model=PeerResponse)
 async def create_peer_endpoint(
+    request: Request,
     session: SessionDep,
     payload: CreatePeerRequest,
 ) -> PeerResponse:
@@ -42,7 +45,8 @@ async def create_peer_endpoint(
             raise PeerDuplicateAppTypeException()
 
         try:
-            cluster_client = ClusterAPIClient(cluster.endpoint, cluster.api_key)
+            cluster_client = ClusterAPIClient(cluster.endpoint, cluster.api_key, cluster.name)
+            requested_at = time.time()
             cluster_response = await cluster_client.create_peer(
                 app_type=payload.app_type.value,
                 protocol=payload.protocol,
@@ -74,12 +78,14 @@ async def create_peer_endpoint(
             app_type=payload.app_type.value,
             protocol=peer_data.protocol,
         )
-        config_download_url = await minio_client.save_peer_config(peer.id, peer_data.config)
+        await peer_configs.save(
+            peer.id, cluster.id, payload.app_type.value, peer_data.protocol, peer_data.config, requested_at
+        )
 
         logger.info(f"Peer created: {peer.public_key} ({peer.id})")
         response = PeerResponse.model_validate(peer)
         response.config = peer_data.config
-        response.config_download_url = config_download_url
+        response.config_download_url = config_download_url(request, peer.id)
         return response
 
     except (ClientNotFoundException, ClusterNotFoundException, PeerAlreadyExistsException, PeerDuplicateAppTypeException):
@@ -4,14 +4,12 @@ from fastapi import APIRouter, HTTPException, status
 
 from src.database.connection import SessionDep
 from src.database.management.operations.peer import get_peer_by_id, delete_peer
-from src.database.management.operations.cluster import get_cluster_by_id
+from src.database.management.operations.outbox import enqueue_peer_deletion
 from src.api.v1.peers.logger import logger
 from src.api.v1.management.exceptions.peer import PeerNotFoundException
-from src.api.v1.management.http_client import ClusterAPIClient
-from src.minio import MinioClient
+from src.services.peer_configs import peer_configs
 
 router = APIRouter()
-minio_client = MinioClient()
 
 
 @router.delete("/{peer_id}")
@@ -24,28 +22,12 @@ async def delete_peer_endpoint(
         if not peer:
             raise PeerNotFoundException()
 
-        cluster = await get_cluster_by_id(session, peer.cluster_id)
-        if not cluster:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Peer cluster is not available",
-            )
-
-        try:
-            cluster_client = ClusterAPIClient(cluster.endpoint, cluster.api_key)
-            await cluster_client.delete_peer(peer.public_key)
-            logger.info(f"Peer deleted from cluster: {cluster.name}")
-        except Exception as e:
-            logger.error(f"Failed to delete peer from cluster: {e}")
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="Failed to delete peer from cluster",
-            )
+        await enqueue_peer_deletion(session, peer.cluster_id, peer.public_key)
 
         success = await delete_peer(session, peer_id)
         if not success:
             raise PeerNotFoundException()
-        await minio_client.delete_peer_config(peer_id)
+        await peer_configs.delete(peer_id)
 
         logger.info(f"Peer deleted: {peer.public_key} ({peer_id})")
         return {"message": "Peer deleted successfully"}
@@ -1,31 +1,29 @@
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
 
-from src.database.connection import SessionDep
-from src.database.management.operations.peer import get_peer_by_id, get_all_peers
+from src.database.connection import ReadSessionDep
+from src.database.management.operations.peer import get_peer_by_id, get_all_peer_rows
 from src.api.v1.peers.logger import logger
-from src.api.v1.peers.schemas import PeerResponse
+from src.api.v1.peers.management.download import config_download_url
+from src.api.v1.peers.schemas import PeerResponse, peer_rows_adapter
 from src.api.v1.management.exceptions.peer import PeerNotFoundException
-from src.minio import MinioClient
+from src.services.peer_configs import peer_configs
 
 router = APIRouter()
-minio_client = MinioClient()
 
 
 @router.get("/", response_model=list[PeerResponse])
-async def list_peers(session: SessionDep) -> list[PeerResponse]:
+async def list_peers(request: Request, session: ReadSessionDep) -> Response:
+    """Peers with their download links; the configs themselves come from GET /peers/{peer_id}."""
     try:
-        peers = await get_all_peers(session)
-        result = []
+        peers = await get_all_peer_rows(session)
         for peer in peers:
-            response = PeerResponse.model_validate(peer)
-            response.config = await minio_client.get_peer_config(peer.id)
-            response.config_download_url = await minio_client.get_peer_config_url(peer.id)
-            result.append(response)
+            peer["config"] = None
+            peer["config_download_url"] = config_download_url(request, peer["id"])
 
-        logger.info(f"Retrieved {len(result)} peers")
-        return result
+        logger.info(f"Retrieved {len(peers)} peers")
+        return Response(content=peer_rows_adapter.dump_json(peers), media_type="application/json")
 
     except Exception as e:
         logger.error(f"Error listing peers: {e}")
@@ -37,7 +35,8 @@ async def list_peers(session: SessionDep) -> list[PeerResponse]:
 
 @router.get("/{peer_id}", response_model=PeerResponse)
 async def get_peer(
-    session: SessionDep,
+    request: Request,
+    session: ReadSessionDep,
     peer_id: UUID,
 ) -> PeerResponse:
     try:
@@ -47,8 +46,8 @@ async def get_peer(
 
         logger.info(f"Retrieved peer: {peer.public_key}")
         response = PeerResponse.model_validate(peer)
-        response.config = await minio_client.get_peer_config(peer.id)
-        response.config_download_url = await minio_client.get_peer_config_url(peer.id)
+        response.config = await peer_configs.render(peer.id)
+        response.config_download_url = config_download_url(request, peer.id)
         return response
 
     except PeerNotFoundException:
@@ -0,0 +1,3 @@
+from . import download, qr
+
+__all__ = ["download", "qr"]
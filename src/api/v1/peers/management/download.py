@@ -0,0 +1,57 @@
+from uuid import UUID
+
+import jwt
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.responses import PlainTextResponse
+
+from src.database.connection import ReadSessionDep
+from src.database.management.operations.peer import get_peer_by_id
+from src.api.v1.peers.logger import logger
+from src.api.v1.management.exceptions.peer import PeerConfigNotFoundException
+from src.management.security import create_config_token, decode_token
+from src.services.peer_configs import peer_configs
+
+router = APIRouter()
+
+
+def config_download_url(request: Request, peer_id: UUID) -> str:
+    return str(request.url_for("download_peer_config", token=create_config_token(str(peer_id))))
+
+
+@router.get("/configs/{token}", response_class=PlainTextResponse)
+async def download_peer_config(session: ReadSessionDep, token: str) -> PlainTextResponse:
+    """
+    Peer config by a signed link from config_download_url; no admin token, so
+    the link can be handed to the client. Expires after
+    peer_config_link_expires_seconds.
+    """
+    try:
+        payload = decode_token(token)
+        if payload.get("type") != "config":
+            raise PeerConfigNotFoundException()
+        peer_id = UUID(payload["sub"])
+    except (jwt.InvalidTokenError, KeyError, ValueError):
+        raise PeerConfigNotFoundException()
+
+    # Other workers may still hold the rendered config of a deleted peer.
+    if not await get_peer_by_id(session, peer_id):
+        raise PeerConfigNotFoundException()
+
+    try:
+        config = await peer_configs.render(peer_id)
+    except Exception as e:
+        logger.error(f"Error rendering config of peer {peer_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to get peer config",
+        )
+    if config is None:
+        raise PeerConfigNotFoundException()
+
+    return PlainTextResponse(
+        config,
+        headers={
+            "Content-Disposition": f'attachment; filename="{peer_id}.conf"',
+            "Cache-Control": "private, no-store",
+        },
+    )
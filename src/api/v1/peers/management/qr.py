@@ -0,0 +1,59 @@
+import hashlib
+from uuid import UUID
+
+from fastapi import APIRouter, HTTPException, Request, Response, status
+
+from src.database.connection import ReadSessionDep
+from src.database.management.operations.peer import get_peer_by_id
+from src.api.v1.peers.logger import logger
+from src.api.v1.management.conditional import etag_matches
+from src.api.v1.management.exceptions.cache import NotModifiedException
+from src.api.v1.management.exceptions.peer import PeerNotFoundException, PeerConfigNotFoundException
+from src.management.settings import get_settings
+from src.services.peer_configs import peer_configs
+
+router = APIRouter()
+settings = get_settings()
+
+
+@router.get("/{peer_id}/qr.png", response_class=Response)
+async def get_peer_qr_code(
+    request: Request,
+    session: ReadSessionDep,
+    peer_id: UUID,
+) -> Response:
+    """
+    Peer config as a QR code PNG, for scanning into the AmneziaVPN/WireGuard
+    apps. The ETag is the config digest, so a changed cluster template yields a
+    new image.
+    """
+    try:
+        peer = await get_peer_by_id(session, peer_id)
+        if not peer:
+            raise PeerNotFoundException()
+
+        png = await peer_configs.render_qr_png(peer.id)
+        if png is None:
+            raise PeerConfigNotFoundException()
+
+        etag = f'"{hashlib.sha1(png).hexdigest()}"'
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            raise NotModifiedException(etag)
+
+        return Response(
+            content=png,
+            media_type="image/png",
+            headers={
+                "Cache-Control": f"private, max-age={int(settings.peer_config_cache_ttl_seconds)}",
+                "ETag": etag,
+            },
+        )
+
+    except (PeerNotFoundException, PeerConfigNotFoundException, NotModifiedException):
+        raise
+    except Exception as e:
+        logger.error(f"Error rendering QR code of peer {peer_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to render peer QR code",
+        )
@@ -1,9 +1,18 @@
 from fastapi import APIRouter
 
 from src.api.v1.peers.crud import create, read, delete
+from src.api.v1.peers.management import download, qr
 
 router = APIRouter()
 
 router.include_router(create.router)
 router.include_router(read.router)
 router.include_router(delete.router)
+
+# Бинарный ответ, вне условных GET и общего кэша JSON-ответов
+qr_router = APIRouter()
+qr_router.include_router(qr.router)
+
+# Публичная выдача конфигов по подписанной ссылке, без токена администратора
+download_router = APIRouter()
+download_router.include_router(download.router)
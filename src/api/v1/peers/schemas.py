@@ -1,5 +1,6 @@
 import uuid
-from pydantic import BaseModel
+from typing_extensions import TypedDict
+from pydantic import BaseModel, TypeAdapter
 from datetime import datetime
 
 from src.database.models import AppType
@@ -40,3 +41,20 @@ class PeerResponse(BaseModel):
         from_attributes = True
 
 
+class PeerRow(TypedDict):
+    """PeerResponse as a plain dict, serialized without building a model per row."""
+    id: uuid.UUID
+    client_id: uuid.UUID
+    cluster_id: uuid.UUID
+    public_key: str
+    allocated_ip: str
+    endpoint: str
+    app_type: str
+    protocol: str
+    created_at: datetime
+    updated_at: datetime
+    config: str | None
+    config_download_url: str | None
+
+
+peer_rows_adapter = TypeAdapter(list[PeerRow])
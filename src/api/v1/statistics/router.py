@@ -2,15 +2,17 @@ from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, status
 
-from src.database.connection import SessionDep
+from src.database.connection import ReadSessionDep
 from src.database.management.operations.peer import get_peer_by_id
-from src.database.management.operations.cluster import get_cluster_by_id, get_all_clusters
+from src.database.management.operations.cluster import (
+    get_cluster_by_id,
+    get_cluster_ids,
+    get_online_peers_total,
+)
 from src.database.management.operations.statistics import (
     get_clusters_counts,
     get_clients_counts,
     get_peers_counts,
-    get_cluster_peers_counts,
-    get_cluster_unique_clients_count,
 )
 from src.api.v1.statistics.logger import logger
 from src.api.v1.statistics.schemas import (
@@ -35,20 +37,21 @@ cache = ClusterStatusCache()
 
 
 @router.get("/", response_model=GlobalStatsResponse)
-async def get_global_statistics(session: SessionDep) -> GlobalStatsResponse:
+async def get_global_statistics(session: ReadSessionDep) -> GlobalStatsResponse:
     try:
         clusters_data = await get_clusters_counts(session)
         clients_data = await get_clients_counts(session)
         peers_data = await get_peers_counts(session)
 
-        all_clusters = await get_all_clusters(session)
-        total_online = sum(c.online_peers_count for c in all_clusters)
+        cluster_ids = await get_cluster_ids(session)
+        total_online = await get_online_peers_total(session)
 
         total_rx = 0
         total_tx = 0
         has_traffic = False
-        for cluster in all_clusters:
-            traffic = await cache.get_traffic(str(cluster.id))
+        summaries = await cache.get_cluster_summaries([str(cluster_id) for cluster_id in cluster_ids])
+        for summary in summaries.values():
+            traffic = summary.traffic
             if traffic:
                 total_rx += traffic.get("total_rx_bytes", 0)
                 total_tx += traffic.get("total_tx_bytes", 0)
@@ -98,7 +101,7 @@ async def get_global_statistics(session: SessionDep) -> GlobalStatsResponse:
 
 @router.get("/clusters/{cluster_id}", response_model=ClusterStatsResponse)
 async def get_cluster_statistics(
-    session: SessionDep,
+    session: ReadSessionDep,
     cluster_id: UUID,
 ) -> ClusterStatsResponse:
     try:
@@ -106,12 +109,8 @@ async def get_cluster_statistics(
         if not cluster:
             raise ClusterNotFoundException()
 
-        peers_data = await get_cluster_peers_counts(session, cluster_id)
-        unique_clients = await get_cluster_unique_clients_count(session, cluster_id)
-
-        traffic = await cache.get_traffic(str(cluster_id))
-
-        by_app_type_raw = peers_data["by_app_type"]
+        summaries = await cache.get_cluster_summaries([str(cluster_id)])
+        traffic = summaries[str(cluster_id)].traffic
 
         response = ClusterStatsResponse(
             cluster=ClusterInfo(
@@ -121,13 +120,13 @@ async def get_cluster_statistics(
                 container_status=cluster.container_status,
                 is_active=cluster.is_active,
             ),
-            clients=ClusterClientsStats(total=unique_clients),
+            clients=ClusterClientsStats(total=cluster.unique_clients_count),
             peers=PeersStats(
-                total=peers_data["total"],
+                total=cluster.amnezia_vpn_peers_count + cluster.amnezia_wg_peers_count,
                 online=cluster.online_peers_count,
                 by_app_type=PeersByAppType(
-                    amnezia_vpn=by_app_type_raw.get("amnezia_vpn", 0),
-                    amnezia_wg=by_app_type_raw.get("amnezia_wg", 0),
+                    amnezia_vpn=cluster.amnezia_vpn_peers_count,
+                    amnezia_wg=cluster.amnezia_wg_peers_count,
                 ),
             ),
             traffic=TrafficStats(
@@ -151,7 +150,7 @@ async def get_cluster_statistics(
 
 @router.get("/peers/{peer_id}", response_model=PeerWithStatsResponse)
 async def get_peer_statistics(
-    session: SessionDep,
+    session: ReadSessionDep,
     peer_id: UUID,
 ) -> PeerWithStatsResponse:
     try:
@@ -5,6 +5,7 @@ from src.database.connection import SessionDep
 from src.database.management.operations.tariff import create_tariff, get_tariff_by_code
 from src.api.v1.tariffs.schemas import CreateTariffRequest, TariffResponse
 from src.api.v1.tariffs.logger import logger
+from src.services.tariff_catalog import tariff_catalog
 
 router = APIRouter()
 
@@ -33,6 +34,7 @@ async def create_tariff_endpoint(
             sort_order=payload.sort_order
         )
 
+        await tariff_catalog.publish_invalidation()
         logger.info(f"Tariff created: {tariff.code} - {tariff.name}")
         return TariffResponse.model_validate(tariff)
 
@@ -4,6 +4,7 @@ from fastapi import APIRouter, HTTPException, status
 from src.database.connection import SessionDep
 from src.database.management.operations.tariff import delete_tariff, get_tariff_by_id
 from src.api.v1.tariffs.logger import logger
+from src.services.tariff_catalog import tariff_catalog
 
 router = APIRouter()
 
@@ -20,6 +21,7 @@ async def delete_tariff_endpoint(session: SessionDep, tariff_id: UUID) -> None:
 
         success = await delete_tariff(session, tariff_id)
         if success:
+            await tariff_catalog.publish_invalidation()
             logger.info(f"Tariff deleted: {tariff.code} - {tariff.name}")
 
     except HTTPException:
@@ -5,6 +5,7 @@ from src.database.connection import SessionDep
 from src.database.management.operations.tariff import update_tariff
 from src.api.v1.tariffs.schemas import UpdateTariffRequest, TariffResponse
 from src.api.v1.tariffs.logger import logger
+from src.services.tariff_catalog import tariff_catalog
 
 
 router = APIRouter()
@@ -34,6 +35,7 @@ async def update_tariff_endpoint(
                 detail="Tariff not found"
             )
 
+        await tariff_catalog.publish_invalidation()
         logger.info(f"Tariff updated: {tariff.code} - {tariff.name}")
         return TariffResponse.model_validate(tariff)
 
@@ -1,16 +1,142 @@
+import asyncio
+import time
+import uuid
 from fastapi import Depends
-from typing import Annotated
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from typing import Annotated, Any
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+from sqlalchemy.util.queue import AsyncAdaptedQueue
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
+from src.management.logger import configure_logger
+from src.management.metrics import (
+    DB_POOL_CHECKED_IN,
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_CHECKOUTS,
+    DB_POOL_CONNECT_SECONDS,
+    DB_POOL_CONNECTS,
+    DB_POOL_OVERFLOW,
+    DB_POOL_SIZE,
+    DB_POOL_WAIT_SECONDS,
+)
 from src.management.settings import get_settings
 
 
+logger = configure_logger("DATABASE", "blue")
 settings = get_settings()
 
-engine = create_async_engine(
-    url=settings.async_postgres_url,
-    echo=False
-)
+
+class _TimedQueue(AsyncAdaptedQueue):
+    """Pool queue that times blocking gets, i.e. waits for a connection to be returned."""
+
+    pool_label = "primary"
+
+    def get(self, block: bool = True, timeout: float | None = None):
+        if not block:
+            entry = super().get(block, timeout)
+            DB_POOL_CHECKOUTS.labels(pool=self.pool_label).inc()
+            return entry
+
+        started = time.perf_counter()
+        try:
+            entry = super().get(block, timeout)
+            DB_POOL_CHECKOUTS.labels(pool=self.pool_label).inc()
+            return entry
+        finally:
+            DB_POOL_WAIT_SECONDS.labels(pool=self.pool_label).inc(time.perf_counter() - started)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that records how long checkouts wait for a free connection and,
+    separately, how long opening new connections takes. Pool occupancy gauges
+    are refreshed on checkout and checkin, so they can be summed across worker
+    processes.
+    """
+
+    _queue_class = _TimedQueue
+    pool_label = "primary"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pool.pool_label = self.pool_label
+        self._update_gauges()
+
+    def _create_connection(self):
+        started = time.perf_counter()
+        entry = super()._create_connection()
+        DB_POOL_CONNECTS.labels(pool=self.pool_label).inc()
+        DB_POOL_CONNECT_SECONDS.labels(pool=self.pool_label).inc(time.perf_counter() - started)
+        DB_POOL_CHECKOUTS.labels(pool=self.pool_label).inc()
+        return entry
+
+    def _do_get(self):
+        entry = super()._do_get()
+        self._update_gauges()
+        return entry
+
+    def _do_return_conn(self, record):
+        super()._do_return_conn(record)
+        self._update_gauges()
+
+    def _update_gauges(self) -> None:
+        DB_POOL_SIZE.labels(pool=self.pool_label).set(self.size())
+        DB_POOL_CHECKED_OUT.labels(pool=self.pool_label).set(self.checkedout())
+        DB_POOL_CHECKED_IN.labels(pool=self.pool_label).set(self.checkedin())
+        DB_POOL_OVERFLOW.labels(pool=self.pool_label).set(max(self.overflow(), 0))
+
+
+class ReplicaInstrumentedQueuePool(InstrumentedQueuePool):
+    pool_label = "replica"
+
+
+def _connect_args() -> dict[str, Any]:
+    if settings.db_pgbouncer_mode:
+        # Transaction pooling can hand every statement a different server connection,
+        # so named prepared statements must be unique and never reused.
+        # statement_timeout is expected to be set on the PgBouncer/role level.
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+        }
+
+    return {
+        "statement_cache_size": settings.db_statement_cache_size,
+        "server_settings": {
+            "statement_timeout": str(settings.db_statement_timeout_ms),
+            "application_name": settings.db_application_name,
+        },
+    }
+
+
+def create_engine(url: str, poolclass: type[InstrumentedQueuePool] = InstrumentedQueuePool) -> AsyncEngine:
+    prepared_statement_cache_size = 0 if settings.db_pgbouncer_mode else settings.db_prepared_statement_cache_size
+    engine_url = make_url(url).update_query_dict(
+        {"prepared_statement_cache_size": str(prepared_statement_cache_size)}
+    )
+
+    if settings.db_pgbouncer_mode:
+        pool_options = {"poolclass": NullPool}
+    else:
+        pool_options = {
+            "poolclass": poolclass,
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_timeout": settings.db_pool_timeout,
+            "pool_recycle": settings.db_pool_recycle,
+            "pool_pre_ping": settings.db_pool_pre_ping,
+        }
+
+    return create_async_engine(
+        url=engine_url,
+        echo=False,
+        connect_args=_connect_args(),
+        **pool_options,
+    )
+
+
+engine = create_engine(settings.async_postgres_url)
 
 sessionmaker = async_sessionmaker(
     bind=engine,
@@ -19,9 +145,83 @@ sessionmaker = async_sessionmaker(
 )
 
 
+replica_engine = (
+    create_engine(settings.async_postgres_replica_url, ReplicaInstrumentedQueuePool)
+    if settings.async_postgres_replica_url
+    else None
+)
+
+read_sessionmaker = async_sessionmaker(
+    bind=replica_engine,
+    class_=AsyncSession,
+    expire_on_commit=False
+) if replica_engine is not None else sessionmaker
+
+
+class ReplicaLagMonitor:
+    """Periodically measures replication lag and reports whether the replica may serve reads."""
+
+    _LAG_QUERY = text(
+        "SELECT CASE "
+        "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+        "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) "
+        "END"
+    )
+
+    def __init__(self, target: AsyncEngine):
+        self._engine = target
+        self._lock = asyncio.Lock()
+        self._checked_at = float("-inf")
+        self._fresh = False
+        self.lag_seconds: float | None = None
+
+    def _check_due(self) -> bool:
+        return time.monotonic() - self._checked_at >= settings.replica_lag_check_interval_seconds
+
+    async def is_fresh(self) -> bool:
+        if not self._check_due():
+            return self._fresh
+
+        async with self._lock:
+            if not self._check_due():
+                return self._fresh
+
+            try:
+                async with self._engine.connect() as connection:
+                    result = await connection.execute(self._LAG_QUERY)
+                    self.lag_seconds = float(result.scalar_one())
+                fresh = self.lag_seconds <= settings.replica_max_lag_seconds
+            except Exception as e:
+                logger.error(f"Replica lag check failed: {e}")
+                self.lag_seconds = None
+                fresh = False
+
+            if fresh != self._fresh:
+                state = "serving reads" if fresh else "behind, reads go to primary"
+                logger.warning(f"Read replica is {state} (lag: {self.lag_seconds})")
+
+            self._fresh = fresh
+            self._checked_at = time.monotonic()
+            return self._fresh
+
+
+replica_monitor = ReplicaLagMonitor(replica_engine) if replica_engine is not None else None
+
+
 async def get_session() -> AsyncSession:
     async with sessionmaker() as new_session:
         yield new_session
 
 
+async def get_read_session() -> AsyncSession:
+    """Session for read-only endpoints: the replica when it is caught up, the primary otherwise."""
+    maker = sessionmaker
+    if replica_monitor is not None and await replica_monitor.is_fresh():
+        maker = read_sessionmaker
+
+    async with maker() as new_session:
+        yield new_session
+
+
 SessionDep = Annotated[AsyncSession, Depends(get_session)]
+ReadSessionDep = Annotated[AsyncSession, Depends(get_read_session)]
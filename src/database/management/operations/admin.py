@@ -2,8 +2,10 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.database.models import AdminModel
 from src.management.security import hash_password
+from src.management.tracing import db_operation
 
 
+@db_operation
 async def get_admin_by_username(session: AsyncSession, username: str):
     """Get admin by username."""
     result = await session.execute(
@@ -12,6 +14,7 @@ async def get_admin_by_username(session: AsyncSession, username: str):
     return result.scalar_one_or_none()
 
 
+@db_operation
 async def create_admin(session: AsyncSession, username: str, password: str) -> AdminModel:
     """Create admin user with hashed password."""
     admin = AdminModel(
@@ -1,16 +1,19 @@
 import uuid
+from typing import Any
 import pytz
 from datetime import datetime, timedelta
-from sqlalchemy import select
+from sqlalchemy import select, update, literal
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.database.models import ClientModel, SubscriptionStatus
-from src.database.management.operations.tariff import get_tariff_by_code
 from src.management.settings import get_settings
+from src.management.tracing import db_operation
 
 settings = get_settings()
 
 
+@db_operation
 async def get_client_by_id(session: AsyncSession, client_id: uuid.UUID) -> ClientModel | None:
     result = await session.execute(
         select(ClientModel).options(selectinload(ClientModel.peers)).where(ClientModel.id == client_id)
@@ -18,6 +21,7 @@ async def get_client_by_id(session: AsyncSession, client_id: uuid.UUID) -> Clien
     return result.scalar_one_or_none()
 
 
+@db_operation
 async def get_client_by_username(session: AsyncSession, username: str):
     result = await session.execute(
         select(ClientModel).where(ClientModel.username == username)
@@ -25,11 +29,79 @@ async def get_client_by_username(session: AsyncSession, username: str):
     return result.scalar_one_or_none()
 
 
-async def get_all_clients(session: AsyncSession):
-    result = await session.execute(select(ClientModel).options(selectinload(ClientModel.peers)))
-    return result.scalars().all()
+def _client_rows_query():
+    return select(
+        ClientModel.id,
+        ClientModel.username,
+        ClientModel.expires_at,
+        ClientModel.subscription_status,
+        ClientModel.trial_used,
+        ClientModel.is_admin,
+        ClientModel.last_subscription_at,
+        ClientModel.created_at,
+        ClientModel.updated_at,
+        ClientModel.peers_count,
+    )
+
+
+@db_operation
+async def get_all_client_rows(session: AsyncSession) -> list[dict[str, Any]]:
+    """Client columns with peers_count, without loading ORM objects."""
+    result = await session.execute(_client_rows_query())
+    return [dict(row) for row in result.mappings()]
+
 
+@db_operation
+async def get_client_row(session: AsyncSession, client_id: uuid.UUID) -> dict[str, Any] | None:
+    result = await session.execute(_client_rows_query().where(ClientModel.id == client_id))
+    row = result.mappings().one_or_none()
+    return dict(row) if row is not None else None
 
+
+@db_operation
+async def get_expired_clients(session: AsyncSession, now: datetime, limit: int) -> list[Row]:
+    """
+    Lock up to limit non-admin clients past expires_at that are not marked expired yet.
+
+    Returns (id, username, expires_at) rows, earliest deadline first.
+    """
+    # Literal status keeps the predicate provable against ix_clients_expires_at_expirable.
+    result = await session.execute(
+        select(
+            ClientModel.id,
+            ClientModel.username,
+            ClientModel.expires_at,
+        )
+        .where(
+            ClientModel.is_admin == False,
+            ClientModel.subscription_status != literal(SubscriptionStatus.EXPIRED.value, literal_execute=True),
+            ClientModel.expires_at < now,
+        )
+        .order_by(ClientModel.expires_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    return result.all()
+
+
+@db_operation
+async def expire_clients(session: AsyncSession, client_ids: list[uuid.UUID]) -> int:
+    """Mark clients expired; a client expiring out of trial has used its trial. Committed by the caller."""
+    if not client_ids:
+        return 0
+    result = await session.execute(
+        update(ClientModel)
+        .where(ClientModel.id.in_(client_ids))
+        .values(
+            trial_used=ClientModel.trial_used | (ClientModel.subscription_status == SubscriptionStatus.TRIAL.value),
+            subscription_status=SubscriptionStatus.EXPIRED.value,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+@db_operation
 async def create_client(
     session: AsyncSession,
     username: str,
@@ -69,6 +141,7 @@ async def create_client(
     return client
 
 
+@db_operation
 async def update_client(
     session: AsyncSession,
     client_id: uuid.UUID,
@@ -84,6 +157,7 @@ async def update_client(
     return client
 
 
+@db_operation
 async def update_client_subscription_status(
     session: AsyncSession,
     client_id: uuid.UUID,
@@ -99,11 +173,13 @@ async def update_client_subscription_status(
     return client
 
 
+@db_operation
 async def subscribe_client(
     session: AsyncSession,
     client_id: uuid.UUID,
-    tariff_code: str
+    days: int
 ) -> ClientModel:
+    """Extend or start the client's subscription by days. The caller resolves the tariff."""
     if not settings.subscription_enabled:
         raise ValueError("Subscriptions are disabled")
 
@@ -111,13 +187,8 @@ async def subscribe_client(
     if not client:
         raise ValueError(f"Client with id {client_id} not found")
 
-    tariff = await get_tariff_by_code(session, tariff_code)
-    if not tariff or not tariff.is_active:
-        raise ValueError(f"Tariff {tariff_code} is not available")
-
     tz = pytz.timezone(settings.timezone)
     now = datetime.now(tz)
-    days = tariff.days
 
     if client.subscription_status == SubscriptionStatus.ACTIVE.value and client.expires_at > now:
         new_expires_at = client.expires_at + timedelta(days=days)
@@ -135,6 +206,7 @@ async def subscribe_client(
     return client
 
 
+@db_operation
 async def expire_client_subscription(
     session: AsyncSession,
     client_id: uuid.UUID
@@ -152,6 +224,7 @@ async def expire_client_subscription(
     return client
 
 
+@db_operation
 async def delete_client(session: AsyncSession, client_id: uuid.UUID) -> bool:
     client = await get_client_by_id(session, client_id)
     if not client:
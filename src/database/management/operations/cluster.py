@@ -1,10 +1,12 @@
 import uuid
-from sqlalchemy import select
+from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timezone
 from src.database.models import ClusterModel
+from src.management.tracing import db_operation
 
 
+@db_operation
 async def get_cluster_by_id(session: AsyncSession, cluster_id: uuid.UUID) -> ClusterModel | None:
     result = await session.execute(
         select(ClusterModel).where(ClusterModel.id == cluster_id)
@@ -12,6 +14,7 @@ async def get_cluster_by_id(session: AsyncSession, cluster_id: uuid.UUID) -> Clu
     return result.scalar_one_or_none()
 
 
+@db_operation
 async def get_cluster_by_name(session: AsyncSession, name: str) -> ClusterModel | None:
     result = await session.execute(
         select(ClusterModel).where(ClusterModel.name == name)
@@ -19,6 +22,7 @@ async def get_cluster_by_name(session: AsyncSession, name: str) -> ClusterModel
     return result.scalar_one_or_none()
 
 
+@db_operation
 async def get_cluster_by_api_key(session: AsyncSession, api_key: str) -> ClusterModel | None:
     result = await session.execute(
         select(ClusterModel).where(ClusterModel.api_key == api_key)
@@ -26,11 +30,33 @@ async def get_cluster_by_api_key(session: AsyncSession, api_key: str) -> Cluster
     return result.scalar_one_or_none()
 
 
+@db_operation
 async def get_all_clusters(session: AsyncSession) -> list[ClusterModel]:
     result = await session.execute(select(ClusterModel))
     return result.scalars().all()
 
 
+@db_operation
+async def get_cluster_ids(session: AsyncSession) -> list[uuid.UUID]:
+    result = await session.execute(select(ClusterModel.id))
+    return result.scalars().all()
+
+
+@db_operation
+async def get_online_peers_total(session: AsyncSession) -> int:
+    result = await session.execute(select(func.coalesce(func.sum(ClusterModel.online_peers_count), 0)))
+    return result.scalar_one()
+
+
+@db_operation
+async def get_active_clusters(session: AsyncSession) -> list[ClusterModel]:
+    result = await session.execute(
+        select(ClusterModel).where(ClusterModel.is_active == True)
+    )
+    return result.scalars().all()
+
+
+@db_operation
 async def create_cluster(session: AsyncSession, name: str, endpoint: str, api_key: str) -> ClusterModel:
     cluster = ClusterModel(
         name=name,
@@ -43,6 +69,7 @@ async def create_cluster(session: AsyncSession, name: str, endpoint: str, api_ke
     return cluster
 
 
+@db_operation
 async def update_cluster(
     session: AsyncSession,
     cluster_id: uuid.UUID,
@@ -69,6 +96,7 @@ async def update_cluster(
     return cluster
 
 
+@db_operation
 async def delete_cluster(session: AsyncSession, cluster_id: uuid.UUID) -> bool:
     cluster = await get_cluster_by_id(session, cluster_id)
     if not cluster:
@@ -79,6 +107,7 @@ async def delete_cluster(session: AsyncSession, cluster_id: uuid.UUID) -> bool:
     return True
 
 
+@db_operation
 async def update_last_handshake(session: AsyncSession, cluster_id: uuid.UUID) -> bool:
     cluster = await get_cluster_by_id(session, cluster_id)
     if not cluster:
@@ -89,6 +118,7 @@ async def update_last_handshake(session: AsyncSession, cluster_id: uuid.UUID) ->
     return True
 
 
+@db_operation
 async def update_cluster_runtime(
     session: AsyncSession,
     cluster_id: uuid.UUID,
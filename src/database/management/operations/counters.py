@@ -0,0 +1,66 @@
+from sqlalchemy import select, update, func, distinct, or_, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models import ClientModel, ClusterModel, PeerModel, AppType
+from src.management.tracing import db_operation
+
+
+@db_operation
+async def lock_peers_for_counting(session: AsyncSession) -> None:
+    """Block peer writes until the end of the transaction so recomputed counters are exact."""
+    await session.execute(text("LOCK TABLE peers IN SHARE MODE"))
+
+
+@db_operation
+async def repair_client_counters(session: AsyncSession) -> int:
+    """Recompute clients.peers_count where it drifted. Returns the number of fixed rows."""
+    peers_total = (
+        select(func.count())
+        .where(PeerModel.client_id == ClientModel.id)
+        .scalar_subquery()
+    )
+    result = await session.execute(
+        update(ClientModel)
+        .where(ClientModel.peers_count != peers_total)
+        .values(peers_count=peers_total, updated_at=ClientModel.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+@db_operation
+async def repair_cluster_counters(session: AsyncSession) -> int:
+    """Recompute per-app peer counts and unique clients of clusters. Returns the number of fixed rows."""
+    def _count(*criteria):
+        return (
+            select(func.count())
+            .where(PeerModel.cluster_id == ClusterModel.id, *criteria)
+            .scalar_subquery()
+        )
+
+    vpn_total = _count(PeerModel.app_type == AppType.AMNEZIA_VPN.value)
+    wg_total = _count(PeerModel.app_type == AppType.AMNEZIA_WG.value)
+    unique_clients = (
+        select(func.count(distinct(PeerModel.client_id)))
+        .where(PeerModel.cluster_id == ClusterModel.id)
+        .scalar_subquery()
+    )
+
+    result = await session.execute(
+        update(ClusterModel)
+        .where(
+            or_(
+                ClusterModel.amnezia_vpn_peers_count != vpn_total,
+                ClusterModel.amnezia_wg_peers_count != wg_total,
+                ClusterModel.unique_clients_count != unique_clients,
+            )
+        )
+        .values(
+            amnezia_vpn_peers_count=vpn_total,
+            amnezia_wg_peers_count=wg_total,
+            unique_clients_count=unique_clients,
+            updated_at=ClusterModel.updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
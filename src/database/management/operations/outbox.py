@@ -0,0 +1,98 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import select, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.database.models import PeerOutboxModel, PeerOperation, OutboxStatus
+from src.management.settings import get_settings
+from src.management.tracing import db_operation
+
+settings = get_settings()
+
+
+@db_operation
+async def enqueue_peer_deletion(
+    session: AsyncSession,
+    cluster_id: uuid.UUID,
+    public_key: str,
+) -> PeerOutboxModel:
+    """Add node-side peer deletion to the outbox. Committed by the caller's transaction."""
+    entry = PeerOutboxModel(
+        cluster_id=cluster_id,
+        operation=PeerOperation.DELETE_PEER.value,
+        public_key=public_key,
+        status=OutboxStatus.PENDING.value,
+        attempts=0,
+        next_attempt_at=datetime.now(timezone.utc),
+    )
+    session.add(entry)
+    return entry
+
+
+@db_operation
+async def get_pending_outbox_cluster_ids(session: AsyncSession) -> list[uuid.UUID]:
+    result = await session.execute(
+        select(PeerOutboxModel.cluster_id)
+        .where(
+            PeerOutboxModel.status == OutboxStatus.PENDING.value,
+            PeerOutboxModel.next_attempt_at <= datetime.now(timezone.utc),
+        )
+        .distinct()
+    )
+    return result.scalars().all()
+
+
+@db_operation
+async def claim_outbox_batch(
+    session: AsyncSession,
+    cluster_id: uuid.UUID,
+    limit: int,
+) -> list[PeerOutboxModel]:
+    """
+    Claim due outbox entries of a cluster, skipping entries locked by other
+    workers. Claimed entries are leased by moving next_attempt_at
+    outbox_lease_seconds ahead; the caller commits right away, so the row locks
+    are not held while the node calls run, and an entry whose worker died is
+    picked up again once the lease runs out.
+    """
+    result = await session.execute(
+        select(PeerOutboxModel)
+        .where(
+            PeerOutboxModel.cluster_id == cluster_id,
+            PeerOutboxModel.status == OutboxStatus.PENDING.value,
+            PeerOutboxModel.next_attempt_at <= datetime.now(timezone.utc),
+        )
+        .order_by(PeerOutboxModel.next_attempt_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    entries = result.scalars().all()
+    leased_until = datetime.now(timezone.utc) + timedelta(seconds=settings.outbox_lease_seconds)
+    for entry in entries:
+        entry.next_attempt_at = leased_until
+    return entries
+
+
+@db_operation
+async def complete_outbox_entries(session: AsyncSession, entry_ids: list[uuid.UUID]) -> int:
+    if not entry_ids:
+        return 0
+    result = await session.execute(
+        delete(PeerOutboxModel).where(PeerOutboxModel.id.in_(entry_ids))
+    )
+    return result.rowcount
+
+
+def reschedule_outbox_entry(entry: PeerOutboxModel, error: str) -> None:
+    """Schedule the next attempt with exponential backoff or give up after the last one."""
+    entry.attempts += 1
+    entry.last_error = error[:1000]
+
+    if entry.attempts >= settings.outbox_max_attempts:
+        entry.status = OutboxStatus.FAILED.value
+        return
+
+    delay = min(
+        settings.outbox_retry_base_seconds * 2 ** (entry.attempts - 1),
+        settings.outbox_retry_max_seconds,
+    )
+    entry.next_attempt_at = datetime.now(timezone.utc) + timedelta(seconds=delay)
@@ -1,9 +1,13 @@
 import uuid
-from sqlalchemy import select
+from typing import Any
+from sqlalchemy import select, delete
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.database.models import PeerModel
+from src.management.tracing import db_operation
 
 
+@db_operation
 async def get_peer_by_id(session: AsyncSession, peer_id: uuid.UUID) -> PeerModel | None:
     result = await session.execute(
         select(PeerModel).where(PeerModel.id == peer_id)
@@ -11,6 +15,7 @@ async def get_peer_by_id(session: AsyncSession, peer_id: uuid.UUID) -> PeerModel
     return result.scalar_one_or_none()
 
 
+@db_operation
 async def get_peer_by_public_key(session: AsyncSession, public_key: str) -> PeerModel | None:
     result = await session.execute(
         select(PeerModel).where(PeerModel.public_key == public_key)
@@ -18,11 +23,26 @@ async def get_peer_by_public_key(session: AsyncSession, public_key: str) -> Peer
     return result.scalar_one_or_none()
 
 
-async def get_all_peers(session: AsyncSession) -> list[PeerModel]:
-    result = await session.execute(select(PeerModel))
-    return result.scalars().all()
+@db_operation
+async def get_all_peer_rows(session: AsyncSession) -> list[dict[str, Any]]:
+    result = await session.execute(
+        select(
+            PeerModel.id,
+            PeerModel.client_id,
+            PeerModel.cluster_id,
+            PeerModel.public_key,
+            PeerModel.allocated_ip,
+            PeerModel.endpoint,
+            PeerModel.app_type,
+            PeerModel.protocol,
+            PeerModel.created_at,
+            PeerModel.updated_at,
+        )
+    )
+    return [dict(row) for row in result.mappings()]
 
 
+@db_operation
 async def get_peers_by_client_id(session: AsyncSession, client_id: uuid.UUID) -> list[PeerModel]:
     result = await session.execute(
         select(PeerModel).where(PeerModel.client_id == client_id)
@@ -30,6 +50,46 @@ async def get_peers_by_client_id(session: AsyncSession, client_id: uuid.UUID) ->
     return result.scalars().all()
 
 
+@db_operation
+async def get_peer_keys_by_client_ids(session: AsyncSession, client_ids: list[uuid.UUID]) -> list[Row]:
+    """(id, cluster_id, public_key) of the clients' peers, enough to queue their node-side deletion."""
+    if not client_ids:
+        return []
+    result = await session.execute(
+        select(PeerModel.id, PeerModel.cluster_id, PeerModel.public_key)
+        .where(PeerModel.client_id.in_(client_ids))
+    )
+    return result.all()
+
+
+@db_operation
+async def delete_peers_by_ids(session: AsyncSession, peer_ids: list[uuid.UUID]) -> int:
+    """Bulk delete peers without loading them. Committed by the caller."""
+    if not peer_ids:
+        return 0
+    result = await session.execute(delete(PeerModel).where(PeerModel.id.in_(peer_ids)))
+    return result.rowcount
+
+
+@db_operation
+async def get_cluster_public_keys(session: AsyncSession, cluster_id: uuid.UUID) -> set[str]:
+    result = await session.execute(
+        select(PeerModel.public_key).where(PeerModel.cluster_id == cluster_id)
+    )
+    return set(result.scalars().all())
+
+
+@db_operation
+async def get_existing_public_keys(session: AsyncSession, public_keys: list[str]) -> set[str]:
+    if not public_keys:
+        return set()
+    result = await session.execute(
+        select(PeerModel.public_key).where(PeerModel.public_key.in_(public_keys))
+    )
+    return set(result.scalars().all())
+
+
+@db_operation
 async def get_peer_by_client_cluster_apptype(
     session: AsyncSession,
     client_id: uuid.UUID,
@@ -46,6 +106,7 @@ async def get_peer_by_client_cluster_apptype(
     return result.scalar_one_or_none()
 
 
+@db_operation
 async def create_peer(
     session: AsyncSession,
     client_id: uuid.UUID,
@@ -74,6 +135,7 @@ async def create_peer(
 
 
 
+@db_operation
 async def delete_peer(session: AsyncSession, peer_id: uuid.UUID) -> bool:
     peer = await get_peer_by_id(session, peer_id)
     if not peer:
@@ -84,6 +146,7 @@ async def delete_peer(session: AsyncSession, peer_id: uuid.UUID) -> bool:
     return True
 
 
+@db_operation
 async def delete_peers_by_client_id(session: AsyncSession, client_id: uuid.UUID) -> int:
     peers = await get_peers_by_client_id(session, client_id)
     count = len(peers)
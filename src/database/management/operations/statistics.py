@@ -1,10 +1,11 @@
-import uuid
-from sqlalchemy import select, func, distinct
+from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database.models import ClusterModel, ClientModel, PeerModel
+from src.database.models import ClusterModel, ClientModel, AppType
+from src.management.tracing import db_operation
 
 
+@db_operation
 async def get_clusters_counts(session: AsyncSession) -> dict:
     result = await session.execute(
         select(ClusterModel.is_active, func.count().label("count"))
@@ -21,6 +22,7 @@ async def get_clusters_counts(session: AsyncSession) -> dict:
     return {"total": active + inactive, "active": active, "inactive": inactive}
 
 
+@db_operation
 async def get_clients_counts(session: AsyncSession) -> dict:
     result = await session.execute(
         select(ClientModel.subscription_status, func.count().label("count"))
@@ -34,42 +36,12 @@ async def get_clients_counts(session: AsyncSession) -> dict:
     return {"total": total, "by_status": by_status}
 
 
+@db_operation
 async def get_peers_counts(session: AsyncSession) -> dict:
-    result = await session.execute(
-        select(PeerModel.app_type, func.count().label("count"))
-        .group_by(PeerModel.app_type)
-    )
-    rows = result.all()
-    by_app_type = {}
-    for app_type, count in rows:
-        by_app_type[app_type] = count
-    total = sum(by_app_type.values())
-    return {"total": total, "by_app_type": by_app_type}
+    vpn_total = func.coalesce(func.sum(ClusterModel.amnezia_vpn_peers_count), 0)
+    wg_total = func.coalesce(func.sum(ClusterModel.amnezia_wg_peers_count), 0)
+    result = await session.execute(select(vpn_total, wg_total))
+    vpn, wg = result.one()
+    by_app_type = {AppType.AMNEZIA_VPN.value: vpn, AppType.AMNEZIA_WG.value: wg}
+    return {"total": vpn + wg, "by_app_type": by_app_type}
 
-
-async def get_cluster_peers_counts(
-    session: AsyncSession,
-    cluster_id: uuid.UUID,
-) -> dict:
-    result = await session.execute(
-        select(PeerModel.app_type, func.count().label("count"))
-        .where(PeerModel.cluster_id == cluster_id)
-        .group_by(PeerModel.app_type)
-    )
-    rows = result.all()
-    by_app_type = {}
-    for app_type, count in rows:
-        by_app_type[app_type] = count
-    total = sum(by_app_type.values())
-    return {"total": total, "by_app_type": by_app_type}
-
-
-async def get_cluster_unique_clients_count(
-    session: AsyncSession,
-    cluster_id: uuid.UUID,
-) -> int:
-    result = await session.execute(
-        select(func.count(distinct(PeerModel.client_id)))
-        .where(PeerModel.cluster_id == cluster_id)
-    )
-    return result.scalar_one()
@@ -2,8 +2,10 @@ import uuid
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.database.models import TariffModel
+from src.management.tracing import db_operation
 
 
+@db_operation
 async def get_tariff_by_id(session: AsyncSession, tariff_id: uuid.UUID) -> TariffModel | None:
     result = await session.execute(
         select(TariffModel).where(TariffModel.id == tariff_id)
@@ -11,6 +13,7 @@ async def get_tariff_by_id(session: AsyncSession, tariff_id: uuid.UUID) -> Tarif
     return result.scalar_one_or_none()
 
 
+@db_operation
 async def get_tariff_by_code(session: AsyncSession, code: str) -> TariffModel | None:
     result = await session.execute(
         select(TariffModel).where(TariffModel.code == code)
@@ -18,6 +21,7 @@ async def get_tariff_by_code(session: AsyncSession, code: str) -> TariffModel |
     return result.scalar_one_or_none()
 
 
+@db_operation
 async def get_all_tariffs(session: AsyncSession) -> list[TariffModel]:
     result = await session.execute(
         select(TariffModel).order_by(TariffModel.sort_order, TariffModel.created_at)
@@ -25,6 +29,7 @@ async def get_all_tariffs(session: AsyncSession) -> list[TariffModel]:
     return result.scalars().all()
 
 
+@db_operation
 async def get_active_tariffs(session: AsyncSession) -> list[TariffModel]:
     result = await session.execute(
         select(TariffModel)
@@ -34,6 +39,7 @@ async def get_active_tariffs(session: AsyncSession) -> list[TariffModel]:
     return result.scalars().all()
 
 
+@db_operation
 async def create_tariff(
     session: AsyncSession,
     code: str,
@@ -59,6 +65,7 @@ async def create_tariff(
     return tariff
 
 
+@db_operation
 async def update_tariff(
     session: AsyncSession,
     tariff_id: uuid.UUID,
@@ -91,6 +98,7 @@ async def update_tariff(
     return tariff
 
 
+@db_operation
 async def delete_tariff(session: AsyncSession, tariff_id: uuid.UUID) -> bool:
     tariff = await get_tariff_by_id(session, tariff_id)
     if not tariff:
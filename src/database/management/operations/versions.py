@@ -0,0 +1,27 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.database.models import ResourceVersionModel
+from src.management.tracing import db_operation
+
+# Tables with a resource_versions row bumped by their <table>_bump_version trigger.
+VERSIONED_TABLES = frozenset({"clients", "clusters", "peers", "tariffs"})
+
+
+@db_operation
+async def get_resource_versions(session: AsyncSession, tables: tuple[str, ...]) -> tuple[int, ...]:
+    """
+    Read the write counters of the given tables in one round trip.
+
+    A counter changes in the same commit as the rows, so it never runs ahead
+    of the data a later query in this session can see.
+    """
+    unknown = set(tables) - VERSIONED_TABLES
+    if unknown:
+        raise ValueError(f"Tables are not versioned: {', '.join(sorted(unknown))}")
+
+    result = await session.execute(
+        select(ResourceVersionModel.table_name, ResourceVersionModel.version)
+        .where(ResourceVersionModel.table_name.in_(tables))
+    )
+    versions = dict(result.all())
+    return tuple(versions.get(table, 0) for table in tables)
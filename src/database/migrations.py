@@ -0,0 +1,100 @@
+import re
+from pathlib import Path
+
+from sqlalchemy import text
+
+from src.database.connection import engine
+from src.management.logger import configure_logger
+from src.management.settings import get_settings
+
+logger = configure_logger("MIGRATIONS", "blue")
+settings = get_settings()
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+VERSIONS_DIR = Path(__file__).resolve().parents[2] / "migrations" / "versions"
+
+# Arbitrary application-wide key for pg_advisory_lock.
+MIGRATIONS_LOCK_ID = 727031604
+
+_REVISION_RE = re.compile(r"^revision\b[^=]*=\s*['\"](\w+)['\"]", re.MULTILINE)
+_DOWN_REVISION_RE = re.compile(r"^down_revision\b[^=]*=(.*)$", re.MULTILINE)
+_QUOTED_RE = re.compile(r"['\"](\w+)['\"]")
+
+
+class SchemaOutdatedError(RuntimeError):
+    pass
+
+
+def get_expected_heads() -> set[str]:
+    """
+    Head revisions of migrations/versions, read from the files as text.
+
+    Avoids importing Alembic and executing every migration module just to
+    compare one revision id.
+    """
+    revisions = set()
+    parents = set()
+    for path in VERSIONS_DIR.glob("*.py"):
+        source = path.read_text()
+        revision = _REVISION_RE.search(source)
+        if revision is None:
+            continue
+        revisions.add(revision.group(1))
+        down_revision = _DOWN_REVISION_RE.search(source)
+        if down_revision is not None:
+            parents.update(_QUOTED_RE.findall(down_revision.group(1)))
+    return revisions - parents
+
+
+async def get_current_heads() -> set[str]:
+    async with engine.connect() as connection:
+        exists = await connection.scalar(text("SELECT to_regclass('alembic_version') IS NOT NULL"))
+        if not exists:
+            return set()
+        result = await connection.execute(text("SELECT version_num FROM alembic_version"))
+        return set(result.scalars().all())
+
+
+async def is_schema_current() -> bool:
+    expected = get_expected_heads()
+    current = await get_current_heads()
+    if current != expected:
+        logger.warning(f"Database schema is at {sorted(current) or 'base'}, expected {sorted(expected)}")
+        return False
+    return True
+
+
+async def check_schema() -> None:
+    if not await is_schema_current():
+        raise SchemaOutdatedError("Database schema is not up to date, run `python -m src.migrate`")
+
+
+def run_migrations() -> None:
+    """
+    Upgrade the database to head.
+
+    Holds a Postgres advisory lock for the whole upgrade, so workers or
+    replicas starting together run migrations one at a time; the ones that
+    wait find nothing left to apply.
+    """
+    from alembic import command
+    from alembic.config import Config
+    from sqlalchemy import create_engine, pool
+
+    migrations_engine = create_engine(settings.sync_postgres_url, poolclass=pool.NullPool)
+    try:
+        with migrations_engine.connect() as connection:
+            logger.info("Waiting for migrations lock...")
+            connection.execute(text("SELECT pg_advisory_lock(:id)"), {"id": MIGRATIONS_LOCK_ID})
+            try:
+                logger.info("Running migrations...")
+                alembic_cfg = Config(str(ALEMBIC_INI))
+                alembic_cfg.attributes["connection"] = connection
+                command.upgrade(alembic_cfg, "head")
+                connection.commit()
+                logger.info("Migrations applied successfully.")
+            finally:
+                connection.execute(text("SELECT pg_advisory_unlock(:id)"), {"id": MIGRATIONS_LOCK_ID})
+                connection.commit()
+    finally:
+        migrations_engine.dispose()
@@ -2,7 +2,7 @@ import uuid
 from enum import Enum
 from datetime import datetime
 from sqlalchemy.orm import mapped_column, Mapped, relationship
-from sqlalchemy import func, String, DateTime, UUID, ForeignKey, UniqueConstraint
+from sqlalchemy import func, text, BigInteger, String, Text, DateTime, UUID, ForeignKey, UniqueConstraint, Index
 
 from src.database.base import Base
 
@@ -41,6 +41,15 @@ class SubscriptionStatus(Enum):
     EXPIRED = "expired"
 
 
+class OutboxStatus(Enum):
+    PENDING = "pending"
+    FAILED = "failed"
+
+
+class PeerOperation(Enum):
+    DELETE_PEER = "delete_peer"
+
+
 class AdminModel(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "admins"
 
@@ -54,7 +63,7 @@ class ClusterModel(Base, UUIDMixin, TimestampMixin):
 
     name: Mapped[str] = mapped_column(String(255), index=True, unique=True, nullable=False)
     endpoint: Mapped[str] = mapped_column(String(255), nullable=False)
-    api_key: Mapped[str] = mapped_column(String(255), nullable=False)
+    api_key: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     is_active: Mapped[bool] = mapped_column(nullable=False, default=True)
     last_handshake: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
     container_status: Mapped[str | None] = mapped_column(String(50), nullable=True)
@@ -62,12 +71,24 @@ class ClusterModel(Base, UUIDMixin, TimestampMixin):
     protocol: Mapped[str | None] = mapped_column(String(50), nullable=True)
     peers_count: Mapped[int] = mapped_column(nullable=False, default=0)
     online_peers_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    # Maintained by the peers_maintain_counters triggers, see repair_peer_counters.
+    amnezia_vpn_peers_count: Mapped[int] = mapped_column(nullable=False, default=0, server_default='0')
+    amnezia_wg_peers_count: Mapped[int] = mapped_column(nullable=False, default=0, server_default='0')
+    unique_clients_count: Mapped[int] = mapped_column(nullable=False, default=0, server_default='0')
 
     peers: Mapped[list["PeerModel"]] = relationship("PeerModel", back_populates="cluster", cascade="all, delete-orphan", uselist=True)
 
 
 class ClientModel(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "clients"
+    __table_args__ = (
+        # Serves the expiry sweep: only clients that can still expire are indexed.
+        Index(
+            "ix_clients_expires_at_expirable",
+            "expires_at",
+            postgresql_where=text("is_admin = false AND subscription_status <> 'expired'"),
+        ),
+    )
 
     username: Mapped[str] = mapped_column(String(255), index=True, unique=True, nullable=False)
     expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -75,6 +96,8 @@ class ClientModel(Base, UUIDMixin, TimestampMixin):
     trial_used: Mapped[bool] = mapped_column(nullable=False, default=False)
     last_subscription_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     is_admin: Mapped[bool] = mapped_column(nullable=False, default=False, server_default='false')
+    # Maintained by the peers_maintain_counters triggers, see repair_peer_counters.
+    peers_count: Mapped[int] = mapped_column(nullable=False, default=0, server_default='0')
 
     peers: Mapped[list["PeerModel"]] = relationship("PeerModel", back_populates="client", cascade="all, delete-orphan", uselist=True)
 
@@ -87,11 +110,14 @@ class AppType(Enum):
 class PeerModel(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "peers"
     __table_args__ = (
+        # Its unique index also serves lookups by client_id alone.
         UniqueConstraint("client_id", "cluster_id", "app_type", name="uq_peer_client_cluster_apptype"),
+        Index("ix_peers_cluster_id_app_type", "cluster_id", "app_type"),
+        Index("ix_peers_cluster_id_client_id", "cluster_id", "client_id"),
     )
 
-    client_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("clients.id"), nullable=False, index=True)
-    cluster_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("clusters.id"), nullable=False, index=True)
+    client_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("clients.id"), nullable=False)
+    cluster_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("clusters.id"), nullable=False)
     public_key: Mapped[str] = mapped_column(String(500), unique=True, nullable=False, index=True)
     private_key_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     allocated_ip: Mapped[str] = mapped_column(String(50), nullable=False)
@@ -113,3 +139,31 @@ class TariffModel(Base, UUIDMixin, TimestampMixin):
     price_stars: Mapped[int] = mapped_column(nullable=False)
     is_active: Mapped[bool] = mapped_column(nullable=False, default=True)
     sort_order: Mapped[int] = mapped_column(nullable=False, default=0, index=True)
+
+
+class PeerOutboxModel(Base, UUIDMixin, TimestampMixin):
+    __tablename__ = "peer_outbox"
+    __table_args__ = (
+        Index(
+            "ix_peer_outbox_pending",
+            "cluster_id",
+            "next_attempt_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
+
+    cluster_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("clusters.id", ondelete="CASCADE"), nullable=False)
+    operation: Mapped[PeerOperation] = mapped_column(String(50), nullable=False)
+    public_key: Mapped[str] = mapped_column(String(500), nullable=False)
+    status: Mapped[OutboxStatus] = mapped_column(String(50), default=OutboxStatus.PENDING.value, nullable=False)
+    attempts: Mapped[int] = mapped_column(nullable=False, default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+
+class ResourceVersionModel(Base):
+    """Write counter per table, bumped at commit by the <table>_bump_version triggers."""
+    __tablename__ = "resource_versions"
+
+    table_name: Mapped[str] = mapped_column(String(63), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default='0')
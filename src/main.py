@@ -1,64 +1,149 @@
+import asyncio
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Depends
-from alembic import command
-from alembic.config import Config
+from fastapi import FastAPI, Depends, Response
+from fastapi.responses import ORJSONResponse
+from prometheus_client import CONTENT_TYPE_LATEST
 
 from src.management.logger import configure_logger
 from src.database.management.default.admin_data import create_default_admin_user
 from src.api.v1.auth.router import router as auth_router
 from src.api.v1.clients.router import router as clients_router
-from src.api.v1.clusters.router import router as clusters_router, sync_router as clusters_sync_router
-from src.api.v1.peers.router import router as peers_router
+from src.api.v1.clusters.router import (
+    router as clusters_router,
+    sync_router as clusters_sync_router,
+    events_router as clusters_events_router,
+)
+from src.api.v1.peers.router import (
+    router as peers_router,
+    qr_router as peers_qr_router,
+    download_router as peers_download_router,
+)
 from src.api.v1.tariffs.router import router as tariffs_router
 from src.api.v1.statistics.router import router as statistics_router
-from src.api.v1.management.middlewares.auth import get_current_admin
-from src.services.scheduler import scheduler, start_scheduler, stop_scheduler
+from src.api.v1.management.middlewares.auth import get_current_admin, get_metrics_reader
+from src.api.v1.management.middlewares.response_cache import ResponseCacheMiddleware
+from src.api.v1.management.middlewares.metrics import MetricsMiddleware
+from src.api.v1.management.middlewares.tracing import TracingMiddleware
+from src.api.v1.management.middlewares.profiling import ProfilingMiddleware
+from src.api.v1.management.conditional import (
+    ConditionalGet,
+    TariffCatalogConditionalGet,
+    cached_response_handler,
+)
+from src.api.v1.management.exceptions.cache import CachedResponseException
+from src.services.tariff_catalog import tariff_catalog
+from src.redis.management.cluster_status import ClusterStatusCache
+from src.services.scheduler import scheduler, leader_only, start_scheduler, stop_scheduler
+from src.services.leader import leader_elector
+from src.services.loop_watchdog import loop_watchdog
+from src.services.status_stream import status_stream
 from src.services.tasks.cleanup_clients import cleanup_expired_clients
+from src.services.tasks.reconcile_peers import reconcile_peers
+from src.services.tasks.drain_outbox import drain_peer_outbox
+from src.services.tasks.repair_counters import repair_peer_counters
 from src.management.settings import get_settings
+from src.management.tracing import setup_tracing, shutdown_tracing
+from src.management.metrics import mark_worker_dead, render_metrics
+from src.redis.connection import close_redis
+from src.database.migrations import check_schema, is_schema_current, run_migrations
 
 logger = configure_logger("MAIN", "cyan")
 settings = get_settings()
-
-
-def run_migrations():
-    logger.info("Running migrations...")
-    alembic_cfg = Config("alembic.ini")
-    command.upgrade(alembic_cfg, "head")
-    logger.info("Migrations applied successfully.")
+cluster_status_cache = ClusterStatusCache()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    run_migrations()
+    if settings.loop_watchdog_enabled:
+        loop_watchdog.start()
+
+    if settings.migrations_mode == "auto":
+        if not await is_schema_current():
+            await asyncio.to_thread(run_migrations)
+    elif settings.migrations_mode == "check":
+        await check_schema()
+
     logger.info("Creating default admin user...")
     await create_default_admin_user()
 
+    await tariff_catalog.load()
+    tariff_catalog_listener = asyncio.create_task(tariff_catalog.listen())
+    logger.info("Tariff catalog loaded")
+    cluster_status_listener = asyncio.create_task(cluster_status_cache.listen_invalidations())
+    status_stream_listener = asyncio.create_task(status_stream.listen())
+
     if settings.subscription_enabled:
         scheduler.add_job(
-            cleanup_expired_clients,
-            trigger="cron",
-            hour=settings.cleanup_schedule_hour,
-            minute=settings.cleanup_schedule_minute,
+            leader_only("cleanup_expired_clients", cleanup_expired_clients),
+            trigger="interval",
+            seconds=settings.expiry_poll_interval_seconds,
             id="cleanup_expired_clients",
             replace_existing=True,
+            max_instances=1,
+            coalesce=True,
         )
-        logger.info("Cleanup scheduler registered")
+        logger.info("Expiry worker registered")
     else:
-        logger.info("Subscription system is disabled, cleanup scheduler skipped")
-
+        logger.info("Subscription system is disabled, expiry worker skipped")
+
+    scheduler.add_job(
+        leader_only("repair_peer_counters", repair_peer_counters),
+        trigger="cron",
+        hour=settings.counters_repair_schedule_hour,
+        minute=settings.counters_repair_schedule_minute,
+        id="repair_peer_counters",
+        replace_existing=True,
+    )
+    logger.info("Peer counters repair scheduler registered")
+
+    if settings.reconcile_enabled:
+        scheduler.add_job(
+            leader_only("reconcile_peers", reconcile_peers),
+            trigger="interval",
+            minutes=settings.reconcile_interval_minutes,
+            id="reconcile_peers",
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+        )
+        logger.info("Peers reconciliation scheduler registered")
+
+    scheduler.add_job(
+        leader_only("drain_peer_outbox", drain_peer_outbox),
+        trigger="interval",
+        seconds=settings.outbox_poll_interval_seconds,
+        id="drain_peer_outbox",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+    logger.info("Peer outbox worker registered")
+
+    leader_election = asyncio.create_task(leader_elector.run())
     start_scheduler()
 
     logger.info("Application initialized successfully.")
     yield
 
     stop_scheduler()
+    leader_election.cancel()
+    loop_watchdog.stop()
+    await leader_elector.resign()
+    tariff_catalog_listener.cancel()
+    cluster_status_listener.cancel()
+    status_stream_listener.cancel()
+    await close_redis()
+    shutdown_tracing()
+    mark_worker_dead()
     logger.info("Application shutdown complete.")
+    await logger.complete()
 
 
 app = FastAPI(
     title="Amnezia Central API",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     root_path="/api/v1",
     docs_url="/docs" if settings.development else None,
     redoc_url="/redoc" if settings.development else None,
@@ -66,6 +151,20 @@ app = FastAPI(
     swagger_ui_parameters={"persistAuthorization": True},
 )
 
+app.add_middleware(ResponseCacheMiddleware)
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+if settings.profiling_enabled:
+    app.add_middleware(ProfilingMiddleware)
+if setup_tracing():
+    app.add_middleware(TracingMiddleware)
+app.add_exception_handler(CachedResponseException, cached_response_handler)
+
+# Cluster status goes stale by TTL and config download links expire without any
+# write, so those ETags also roll over with time.
+status_bucket_seconds = max(settings.peer_status_ttl // 4, 1)
+config_link_bucket_seconds = max(settings.peer_config_link_expires_seconds // 2, 1)
+
 app.include_router(
     auth_router,
     prefix="/auth",
@@ -76,14 +175,22 @@ app.include_router(
     clients_router,
     prefix="/clients",
     tags=["Clients"],
-    dependencies=[Depends(get_current_admin)]
+    dependencies=[Depends(get_current_admin), Depends(ConditionalGet("clients", "peers"))]
+)
+
+# Before clusters_router, whose /{cluster_id} would otherwise capture /events.
+# Auth is per route: the stream also accepts a signed ?token= for EventSource.
+app.include_router(
+    clusters_events_router,
+    prefix="/clusters",
+    tags=["Clusters"]
 )
 
 app.include_router(
     clusters_router,
     prefix="/clusters",
     tags=["Clusters"],
-    dependencies=[Depends(get_current_admin)]
+    dependencies=[Depends(get_current_admin), Depends(ConditionalGet("clusters", bucket_seconds=status_bucket_seconds))]
 )
 
 app.include_router(
@@ -96,21 +203,34 @@ app.include_router(
     peers_router,
     prefix="/peers",
     tags=["Peers"],
+    dependencies=[Depends(get_current_admin), Depends(ConditionalGet("peers", bucket_seconds=config_link_bucket_seconds))]
+)
+
+app.include_router(
+    peers_qr_router,
+    prefix="/peers",
+    tags=["Peers"],
     dependencies=[Depends(get_current_admin)]
 )
 
+app.include_router(
+    peers_download_router,
+    prefix="/peers",
+    tags=["Peers"]
+)
+
 app.include_router(
     tariffs_router,
     prefix="/tariffs",
     tags=["Tariffs"],
-    dependencies=[Depends(get_current_admin)]
+    dependencies=[Depends(get_current_admin), Depends(TariffCatalogConditionalGet(shared_cache=False))]
 )
 
 app.include_router(
     statistics_router,
     prefix="/statistics",
     tags=["Statistics"],
-    dependencies=[Depends(get_current_admin)]
+    dependencies=[Depends(get_current_admin), Depends(ConditionalGet("clusters", "clients", "peers", bucket_seconds=status_bucket_seconds))]
 )
 
 
@@ -118,5 +238,13 @@ app.include_router(
 async def health_check():
     return {
         "app": "Amnezia Central API",
-        "status": "running"
+        "status": "running",
+        "scheduler": leader_elector.describe(),
     }
+
+
+@app.get("/metrics", include_in_schema=False, dependencies=[Depends(get_metrics_reader)])
+async def metrics():
+    if not settings.metrics_enabled:
+        return Response(status_code=404)
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE_LATEST)
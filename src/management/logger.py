@@ -1,17 +1,61 @@
+import sys
+from collections import defaultdict
+from itertools import count
+
 from loguru import logger
 
+from src.management.settings import get_settings
+
+settings = get_settings()
+
+_TEXT_FORMAT = (
+    "<{color}>{{time:YYYY-MM-DD HH:mm:ss.SSS}}</{color}> | "
+    "<b>{{level:<8}}</b> | "
+    "<cyan>{{name}}:{{function}}:{{line}}</cyan> | "
+    "{{extra[prefix]}} <b>{{message}}</b>\n{{exception}}"
+)
+
+_sample_counters: defaultdict[tuple[str, int], count] = defaultdict(count)
+
+
+def _text_format(record) -> str:
+    return _TEXT_FORMAT.format(color=record["extra"]["color"])
+
+
+def _sampling_filter(record) -> bool:
+    """Pass every N-th record of a call site that was logged through sampled()."""
+    every = record["extra"].get("sample_every")
+    if not every or every <= 1:
+        return True
+    return next(_sample_counters[(record["name"], record["line"])]) % every == 0
+
+
+def _setup() -> None:
+    json_output = settings.log_format == "json" or (settings.log_format is None and not settings.development)
+
+    logger.remove()
+    logger.configure(extra={"prefix": "", "color": "white"})
+    logger.add(
+        sys.stdout,
+        level=settings.log_level,
+        format="{message}" if json_output else _text_format,
+        serialize=json_output,
+        colorize=settings.development and not json_output,
+        filter=_sampling_filter,
+        # Records are written by a background thread; the event loop only enqueues them.
+        enqueue=True,
+        backtrace=settings.development,
+        diagnose=settings.development,
+    )
+
+
+_setup()
+
 
 def configure_logger(prefix: str, color: str):
-    if not logger._core.handlers:
-        logger.add(
-            lambda msg: print(msg, end=""),
-            level="DEBUG",
-            format=(
-                f"<{color}>{{time:YYYY-MM-DD HH:mm:ss.SSS}}</{color}> | "
-                "<b>{level:<8}</b> | "
-                "<cyan>{name}:{function}:{line}</cyan> | "
-                f"{prefix} <b>{{message}}</b>"
-            ),
-            colorize=True
-        )
-    return logger
+    return logger.bind(prefix=prefix, color=color)
+
+
+def sampled(bound_logger, every: int | None = None):
+    """Logger for per-item lines on hot paths: keeps one record in `every` per call site."""
+    return bound_logger.bind(sample_every=every or settings.log_sample_every)
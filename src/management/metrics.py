@@ -0,0 +1,237 @@
+import os
+import time
+from functools import wraps
+from typing import Any, Callable
+
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess
+from prometheus_client.core import REGISTRY
+
+from src.management.logger import configure_logger
+from src.management.settings import get_settings
+from src.management.tracing import traced
+
+logger = configure_logger("METRICS", "magenta")
+settings = get_settings()
+
+FAST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ["method", "route", "status"],
+)
+CLUSTER_API_SECONDS = Histogram(
+    "cluster_api_request_duration_seconds",
+    "Latency of calls to cluster nodes.",
+    ["cluster", "operation"],
+)
+CLUSTER_API_ERRORS = Counter(
+    "cluster_api_errors_total",
+    "Failed calls to cluster nodes.",
+    ["cluster", "operation"],
+)
+REDIS_OPERATION_SECONDS = Histogram(
+    "redis_operation_duration_seconds",
+    "Latency of cache operations.",
+    ["operation"],
+    buckets=FAST_BUCKETS,
+)
+REDIS_OPERATION_ERRORS = Counter(
+    "redis_operation_errors_total",
+    "Failed cache operations.",
+    ["operation"],
+)
+MINIO_OPERATION_SECONDS = Histogram(
+    "minio_operation_duration_seconds",
+    "Latency of object storage operations.",
+    ["operation"],
+)
+MINIO_OPERATION_ERRORS = Counter(
+    "minio_operation_errors_total",
+    "Failed object storage operations.",
+    ["operation"],
+)
+SYNC_PAYLOAD_PEERS = Histogram(
+    "cluster_sync_payload_peers",
+    "Number of peers in a cluster sync payload.",
+    buckets=(0, 10, 50, 100, 250, 500, 1000, 2500, 5000, 10000),
+)
+SYNC_PEER_CACHE_UPDATES = Counter(
+    "cluster_sync_peer_cache_updates_total",
+    "Peer statuses that changed and were written to the cache during syncs.",
+)
+CLUSTER_PEERS = Gauge(
+    "cluster_peers",
+    "Peers reported by the node in its last sync.",
+    ["cluster", "state"],
+    multiprocess_mode="mostrecent",
+)
+CLUSTER_PEER_DRIFT = Gauge(
+    "cluster_peer_drift",
+    "Peers found out of sync by the last reconciliation: orphan (on the node only) or missing (in the database only).",
+    ["cluster", "kind"],
+    multiprocess_mode="mostrecent",
+)
+RECONCILE_ORPHANS_DELETED = Counter(
+    "reconcile_orphans_deleted_total",
+    "Orphan peers deleted from nodes by reconciliation.",
+    ["cluster"],
+)
+RECONCILE_ORPHAN_DELETE_FAILURES = Counter(
+    "reconcile_orphan_delete_failures_total",
+    "Orphan peers reconciliation failed to delete from nodes.",
+    ["cluster"],
+)
+JOB_DURATION_SECONDS = Histogram(
+    "scheduler_job_duration_seconds",
+    "Duration of scheduled job runs.",
+    ["job"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 300, 900),
+)
+JOB_FAILURES = Counter(
+    "scheduler_job_failures_total",
+    "Scheduled job runs that raised.",
+    ["job"],
+)
+DB_POOL_CHECKOUTS = Counter(
+    "db_pool_checkouts",
+    "Database pool checkouts.",
+    ["pool"],
+)
+DB_POOL_WAIT_SECONDS = Counter(
+    "db_pool_wait_seconds",
+    "Time spent waiting for a pooled connection to be returned.",
+    ["pool"],
+)
+DB_POOL_CONNECTS = Counter(
+    "db_pool_connects",
+    "New database connections opened by the pool.",
+    ["pool"],
+)
+DB_POOL_CONNECT_SECONDS = Counter(
+    "db_pool_connect_seconds",
+    "Time spent opening new database connections.",
+    ["pool"],
+)
+DB_POOL_SIZE = Gauge(
+    "db_pool_size",
+    "Database pool size, summed over live workers.",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Database connections in use, summed over live workers.",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKED_IN = Gauge(
+    "db_pool_checked_in",
+    "Idle pooled database connections, summed over live workers.",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "Database connections open beyond the pool size, summed over live workers.",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+EVENT_LOOP_LAG_SECONDS = Histogram(
+    "event_loop_lag_seconds",
+    "Delay between scheduling a watchdog probe on the event loop and it running.",
+    buckets=FAST_BUCKETS,
+)
+EVENT_LOOP_BLOCKS = Counter(
+    "event_loop_blocks_total",
+    "Times the event loop stayed blocked longer than the watchdog threshold.",
+)
+EVENT_LOOP_BLOCK_SECONDS = Histogram(
+    "event_loop_block_duration_seconds",
+    "How long the event loop stayed blocked once past the watchdog threshold.",
+    buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+
+
+def instrumented(
+    histogram: Histogram,
+    errors: Counter,
+    operation: str,
+    labels_from_self: Callable[[Any], dict[str, str]] | None = None,
+):
+    """Time an async method into histogram and count its exceptions into errors."""
+
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            labels = {"operation": operation}
+            if labels_from_self is not None:
+                labels.update(labels_from_self(args[0]))
+            started = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            except Exception:
+                errors.labels(**labels).inc()
+                raise
+            finally:
+                histogram.labels(**labels).observe(time.perf_counter() - started)
+
+        return wrapper
+
+    return decorator
+
+
+def _timed_and_traced(span_name: str, kind: str | None, timed):
+    span = traced(span_name, kind=kind)
+    return lambda func: span(timed(func))
+
+
+def cluster_call(operation: str):
+    return _timed_and_traced(
+        f"cluster.{operation}",
+        "client",
+        instrumented(
+            CLUSTER_API_SECONDS,
+            CLUSTER_API_ERRORS,
+            operation,
+            labels_from_self=lambda client: {"cluster": client.name},
+        ),
+    )
+
+
+def redis_operation(operation: str):
+    return _timed_and_traced(
+        f"redis.{operation}",
+        "client",
+        instrumented(REDIS_OPERATION_SECONDS, REDIS_OPERATION_ERRORS, operation),
+    )
+
+
+def minio_operation(operation: str):
+    return _timed_and_traced(
+        f"minio.{operation}",
+        "client",
+        instrumented(MINIO_OPERATION_SECONDS, MINIO_OPERATION_ERRORS, operation),
+    )
+
+
+def render_metrics() -> bytes:
+    """
+    Exposition of every worker's metrics.
+
+    With PROMETHEUS_MULTIPROC_DIR set, each worker writes its values to files
+    in that directory and the scrape aggregates them, so the numbers do not
+    depend on which worker answers. The directory must be emptied before the
+    workers start.
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return generate_latest(REGISTRY)
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry)
+
+
+def mark_worker_dead() -> None:
+    """Drop this worker's live gauges from the multiprocess aggregate on shutdown."""
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        multiprocess.mark_process_dead(os.getpid())
@@ -0,0 +1,57 @@
+import cProfile
+import marshal
+import threading
+
+try:
+    from pyinstrument import Profiler as PyinstrumentProfiler
+except ImportError:  # profiling extra not installed
+    PyinstrumentProfiler = None
+
+
+class RequestProfile:
+    """
+    Profile of one request. pyinstrument samples only the request's own task
+    (async_mode="enabled"), so concurrent requests can be profiled at once.
+    The cProfile fallback instruments the whole thread, so only one request
+    is profiled at a time and start() returns False when another one is.
+    """
+
+    _cprofile_lock = threading.Lock()
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._pyinstrument = None
+        self._cprofile = None
+
+    def start(self) -> bool:
+        if PyinstrumentProfiler is not None:
+            self._pyinstrument = PyinstrumentProfiler(interval=self.interval, async_mode="enabled")
+            self._pyinstrument.start()
+            return True
+        if not self._cprofile_lock.acquire(blocking=False):
+            return False
+        self._cprofile = cProfile.Profile()
+        self._cprofile.enable()
+        return True
+
+    def stop(self) -> None:
+        if self._pyinstrument is not None:
+            self._pyinstrument.stop()
+        elif self._cprofile is not None:
+            self._cprofile.disable()
+            self._cprofile_lock.release()
+
+    @property
+    def extension(self) -> str:
+        return "html" if PyinstrumentProfiler is not None else "prof"
+
+    @property
+    def content_type(self) -> str:
+        return "text/html" if PyinstrumentProfiler is not None else "application/octet-stream"
+
+    def render(self) -> bytes:
+        """pyinstrument HTML report, or a pstats dump loadable with pstats.Stats(path)."""
+        if self._pyinstrument is not None:
+            return self._pyinstrument.output_html().encode()
+        self._cprofile.create_stats()
+        return marshal.dumps(self._cprofile.stats)
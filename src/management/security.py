@@ -3,16 +3,19 @@ from datetime import datetime, timedelta, timezone
 import jwt
 
 from src.management.settings import get_settings
+from src.management.tracing import traced
 
 
 settings = get_settings()
 
 
+@traced()
 def hash_password(password: str) -> str:
     salt = bcrypt.gensalt()
     return bcrypt.hashpw(password.encode(), salt).decode()
 
 
+@traced()
 def verify_password(password: str, password_hash: str) -> bool:
     return bcrypt.checkpw(password.encode(), password_hash.encode())
 
@@ -43,6 +46,32 @@ def create_refresh_token(subject: str) -> str:
     return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
 
 
+def create_config_token(peer_id: str) -> str:
+    """Create a signed link token for downloading one peer config."""
+    now = datetime.now(timezone.utc)
+    expire_at = now + timedelta(seconds=settings.peer_config_link_expires_seconds)
+    payload = {
+        "sub": peer_id,
+        "type": "config",
+        "iat": int(now.timestamp()),
+        "exp": int(expire_at.timestamp()),
+    }
+    return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+
+
+def create_stream_token(subject: str) -> str:
+    """Create a short-lived token for opening the status event stream."""
+    now = datetime.now(timezone.utc)
+    expire_at = now + timedelta(seconds=settings.status_stream_token_expires_seconds)
+    payload = {
+        "sub": subject,
+        "type": "stream",
+        "iat": int(now.timestamp()),
+        "exp": int(expire_at.timestamp()),
+    }
+    return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+
+
 def decode_token(token: str) -> dict:
     """Decode JWT token."""
     return jwt.decode(
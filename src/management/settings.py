@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Literal
 from urllib.parse import quote_plus
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -7,6 +8,35 @@ class Settings(BaseSettings):
 
     development: bool
 
+    log_level: str = "INFO"
+    # text or json; defaults to text in development and json otherwise.
+    log_format: Literal["text", "json"] | None = None
+    log_sample_every: int = 100
+
+    metrics_enabled: bool = True
+    # Bearer token for Prometheus scrapes of /metrics; admin access tokens work too.
+    metrics_token: str | None = None
+
+    loop_watchdog_enabled: bool = True
+    loop_watchdog_interval_seconds: float = 0.5
+    loop_watchdog_threshold_ms: int = 250
+
+    # Needs the "tracing" extra; the file exporter writes one JSON span per line.
+    tracing_enabled: bool = False
+    tracing_exporter: Literal["otlp", "file"] = "otlp"
+    tracing_otlp_endpoint: str | None = None
+    tracing_file_path: str = "traces.jsonl"
+    tracing_sample_ratio: float = 1.0
+    tracing_service_name: str = "amnezia-central-api"
+
+    # Reports go to MinIO under profiling_prefix; pyinstrument (the "profiling"
+    # extra) gives HTML, otherwise a cProfile pstats dump is stored.
+    profiling_enabled: bool = False
+    profiling_sample_rate: float = 0.0
+    profiling_slow_threshold_ms: int | None = None
+    profiling_interval_seconds: float = 0.001
+    profiling_prefix: str = "profiles"
+
     admin_username: str
     admin_password: str
 
@@ -16,18 +46,46 @@ class Settings(BaseSettings):
     postgres_port: int
     postgres_db: str
 
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    db_statement_cache_size: int = 100
+    db_prepared_statement_cache_size: int = 100
+    db_statement_timeout_ms: int = 30000
+    db_application_name: str = "amnezia-central-api"
+    db_pgbouncer_mode: bool = False
+
+    postgres_replica_host: str | None = None
+    postgres_replica_port: int | None = None
+    replica_max_lag_seconds: float = 5.0
+    replica_lag_check_interval_seconds: float = 5.0
+
     redis_password: str
     redis_host: str
     redis_port: int
     redis_db: int = 0
+    redis_max_connections: int = 50
+    redis_pool_timeout: float = 5.0
+    redis_socket_timeout: float = 5.0
+    redis_socket_connect_timeout: float = 2.0
+    redis_health_check_interval: int = 30
+    redis_retry_attempts: int = 3
+    redis_retry_backoff_base: float = 0.05
+    redis_retry_backoff_cap: float = 1.0
+    redis_protocol: Literal[2, 3] = 2
+    # Comma-separated host:port list; when set, the master is resolved through
+    # Sentinel and redis_host/redis_port are ignored.
+    redis_sentinels: str | None = None
+    redis_sentinel_master: str = "mymaster"
+    redis_sentinel_password: str | None = None
 
     minio_internal_host: str
-    minio_public_host: str
     minio_access_key: str
     minio_secret_key: str
     minio_bucket: str = "amnezia-configs"
     minio_secure: bool = False
-    minio_presigned_expires_seconds: int = 3600
 
     jwt_access_token_expire_minutes: int = 15
     jwt_refresh_token_expire_minutes: int = 43200
@@ -36,10 +94,54 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"
 
     peer_status_ttl: int = 120
+    # In-process copy of cluster traffic/protocol in front of Redis.
+    cluster_status_local_ttl_seconds: float = 2.0
+    cluster_status_local_max_entries: int = 10000
+
+    status_stream_heartbeat_seconds: int = 15
+    status_stream_queue_size: int = 100
+    status_stream_max_peers_per_event: int = 500
+    # Lifetime of the ?token= that browsers pass to /clusters/events, since
+    # EventSource cannot send an Authorization header. Only checked on connect.
+    status_stream_token_expires_seconds: int = 60
+
+    # Rendered peer configs, cluster templates and QR codes kept in process.
+    peer_config_cache_ttl_seconds: float = 300.0
+    peer_config_cache_max_entries: int = 10000
+    peer_config_qr_scale: int = 8
+    # Lifetime of the signed config_download_url links.
+    peer_config_link_expires_seconds: int = 3600
     cluster_api_timeout: int = 10
     timezone: str = "Europe/Moscow"
-    cleanup_schedule_hour: int = 3
-    cleanup_schedule_minute: int = 0
+    # auto: migrate at startup (under an advisory lock) when the schema is behind;
+    # check: refuse to start until `python -m src.migrate` has run; off: skip.
+    migrations_mode: Literal["auto", "check", "off"] = "auto"
+
+    expiry_poll_interval_seconds: int = 10
+    expiry_batch_size: int = 100
+    counters_repair_schedule_hour: int = 4
+    counters_repair_schedule_minute: int = 30
+
+    scheduler_leader_election: bool = True
+    scheduler_lease_seconds: int = 30
+    scheduler_renew_interval_seconds: int = 10
+    scheduler_job_record_ttl_seconds: int = 7 * 24 * 3600
+
+    reconcile_enabled: bool = True
+    reconcile_interval_minutes: int = 15
+    reconcile_concurrency: int = 10
+    reconcile_batch_size: int = 50
+    reconcile_orphan_grace_seconds: int = 30
+
+    outbox_poll_interval_seconds: int = 5
+    outbox_batch_size: int = 50
+    outbox_concurrency: int = 10
+    outbox_max_attempts: int = 10
+    outbox_retry_base_seconds: int = 5
+    outbox_retry_max_seconds: int = 600
+    # How long a claimed batch stays invisible to other workers; must exceed
+    # the node calls of one batch (cluster_api_timeout plus client retries).
+    outbox_lease_seconds: int = 120
 
     payment_provider: str = "rukassa"
     rukassa_api_key: str | None = None
@@ -52,6 +154,12 @@ class Settings(BaseSettings):
     trial_enabled: bool = True
     trial_period_days: int = 1
 
+    tariffs_catalog_ttl_seconds: int = 300
+    tariffs_cache_max_age: int = 60
+
+    response_cache_enabled: bool = False
+    response_cache_ttl_seconds: int = 5
+
     model_config = SettingsConfigDict(
         env_file=".env",
         extra="ignore"
@@ -62,6 +170,14 @@ class Settings(BaseSettings):
         encoded_password = quote_plus(self.postgres_password)
         return f"postgresql+asyncpg://{self.postgres_user}:{encoded_password}@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
 
+    @property
+    def async_postgres_replica_url(self) -> str | None:
+        if not self.postgres_replica_host:
+            return None
+        encoded_password = quote_plus(self.postgres_password)
+        port = self.postgres_replica_port or self.postgres_port
+        return f"postgresql+asyncpg://{self.postgres_user}:{encoded_password}@{self.postgres_replica_host}:{port}/{self.postgres_db}"
+
     @property
     def sync_postgres_url(self) -> str:
         encoded_password = quote_plus(self.postgres_password)
@@ -0,0 +1,147 @@
+import inspect
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Iterator
+
+from src.management.logger import configure_logger
+from src.management.settings import get_settings
+
+logger = configure_logger("TRACING", "magenta")
+settings = get_settings()
+
+try:
+    from opentelemetry import propagate, trace
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+except ImportError:  # tracing extra not installed
+    trace = None
+
+_tracer = None
+_provider = None
+
+
+def setup_tracing() -> bool:
+    """
+    Install the tracer provider when TRACING_ENABLED is set. Returns whether
+    tracing is active; without the tracing extra it logs and stays off.
+    """
+    global _tracer, _provider
+    if not settings.tracing_enabled or _tracer is not None:
+        return _tracer is not None
+    if trace is None:
+        logger.warning("TRACING_ENABLED is set but opentelemetry is not installed; tracing is off")
+        return False
+
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+    if settings.tracing_exporter == "otlp":
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        except ImportError:
+            logger.warning("TRACING_EXPORTER=otlp needs opentelemetry-exporter-otlp-proto-http; tracing is off")
+            return False
+        # endpoint None falls back to OTEL_EXPORTER_OTLP_* environment variables
+        exporter = OTLPSpanExporter(endpoint=settings.tracing_otlp_endpoint)
+    else:
+        from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+
+        exporter = ConsoleSpanExporter(
+            out=open(settings.tracing_file_path, "a", buffering=1),
+            formatter=lambda span: span.to_json(indent=None) + "\n",
+        )
+
+    _provider = TracerProvider(
+        resource=Resource.create({"service.name": settings.tracing_service_name}),
+        sampler=ParentBased(TraceIdRatioBased(settings.tracing_sample_ratio)),
+    )
+    _provider.add_span_processor(BatchSpanProcessor(exporter))
+    trace.set_tracer_provider(_provider)
+    _tracer = trace.get_tracer("amnezia-central-api")
+    logger.info(f"Tracing enabled, exporting to {settings.tracing_exporter}")
+    return True
+
+
+def shutdown_tracing() -> None:
+    global _tracer, _provider
+    if _provider is not None:
+        _provider.shutdown()
+    _tracer = None
+    _provider = None
+
+
+@contextmanager
+def start_span(
+    name: str,
+    attributes: dict[str, Any] | None = None,
+    kind: str | None = None,
+    parent_headers: dict[str, str] | None = None,
+) -> Iterator[Any]:
+    """
+    Span context manager; yields None and costs nothing while tracing is off.
+    parent_headers continues a trace propagated by the caller (traceparent).
+    """
+    if _tracer is None:
+        yield None
+        return
+    with _tracer.start_as_current_span(
+        name,
+        context=propagate.extract(parent_headers) if parent_headers is not None else None,
+        kind=getattr(SpanKind, kind.upper()) if kind else SpanKind.INTERNAL,
+        attributes=attributes,
+    ) as span:
+        yield span
+
+
+def traced(name: str | None = None, kind: str | None = None, prefix: str | None = None):
+    """
+    Run a sync or async function inside a span, named [prefix.]module.function
+    by default. The tracer is looked up per call, so decorating at import time
+    is fine even though setup_tracing() runs later.
+    """
+
+    def decorator(func):
+        span_name = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__qualname__}"
+        if prefix and not name:
+            span_name = f"{prefix}.{span_name}"
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if _tracer is None:
+                    return await func(*args, **kwargs)
+                with start_span(span_name, kind=kind):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return func(*args, **kwargs)
+            with start_span(span_name, kind=kind):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def db_operation(func):
+    """Span for a function in src.database.management.operations."""
+    return traced(prefix="db")(func)
+
+
+def inject_trace_headers(headers: dict[str, str]) -> dict[str, str]:
+    """Copy of headers with the W3C traceparent of the current span added."""
+    if _tracer is None:
+        return headers
+    carrier = dict(headers)
+    propagate.inject(carrier)
+    return carrier
+
+
+def mark_span_error(span, description: str) -> None:
+    if span is not None:
+        span.set_status(Status(StatusCode.ERROR, description))
@@ -0,0 +1,6 @@
+"""Apply database migrations: `python -m src.migrate`."""
+from src.database.migrations import run_migrations
+
+
+if __name__ == "__main__":
+    run_migrations()
@@ -1,4 +1,4 @@
 from .client import MinioClient
-from .connection import get_minio_client, get_minio_public_client
+from .connection import get_minio_client
 
-__all__ = ["MinioClient", "get_minio_client", "get_minio_public_client"]
+__all__ = ["MinioClient", "get_minio_client"]
@@ -1,26 +1,38 @@
 import asyncio
 import io
-from datetime import timedelta
-from typing import Optional
 from uuid import UUID
 
-from minio.error import S3Error
-
 from src.management.logger import configure_logger
 from src.management.settings import get_settings
-from src.minio.connection import get_minio_client, get_minio_public_client
+from src.management.metrics import minio_operation
+from src.minio.connection import get_minio_client
 
 settings = get_settings()
 logger = configure_logger("MinioClient", "cyan")
 
+_MISSING_OBJECT_CODES = {"NoSuchKey", "NoSuchObject"}
+
+
+def _is_s3_error(exc: Exception) -> bool:
+    # Imported here, not at module level, to keep the minio SDK out of worker startup.
+    from minio.error import S3Error
+
+    return isinstance(exc, S3Error)
+
+
+def _is_missing_object(exc: Exception) -> bool:
+    return _is_s3_error(exc) and exc.code in _MISSING_OBJECT_CODES
+
 
 class MinioClient:
     def __init__(self) -> None:
-        self._client = get_minio_client()
-        self._public_client = get_minio_public_client()
         self._bucket_ready = False
         self.bucket_name = settings.minio_bucket
 
+    @property
+    def _client(self):
+        return get_minio_client()
+
     async def _run(self, func, *args, **kwargs):
         return await asyncio.to_thread(func, *args, **kwargs)
 
@@ -32,6 +44,7 @@ class MinioClient:
             await self._run(self._client.make_bucket, self.bucket_name)
         self._bucket_ready = True
 
+    @minio_operation("upload_text")
     async def upload_text(
         self,
         object_name: str,
@@ -50,6 +63,7 @@ class MinioClient:
         )
         logger.info(f"Text object '{object_name}' uploaded to '{self.bucket_name}'")
 
+    @minio_operation("upload_bytes")
     async def upload_bytes(
         self,
         object_name: str,
@@ -67,6 +81,7 @@ class MinioClient:
         )
         logger.info(f"Bytes object '{object_name}' uploaded to '{self.bucket_name}'")
 
+    @minio_operation("get_text")
     async def get_text(self, object_name: str, encoding: str = "utf-8") -> str:
         await self._ensure_bucket()
 
@@ -81,69 +96,73 @@ class MinioClient:
         data = await self._run(_read_object)
         return data.decode(encoding)
 
+    @minio_operation("delete_object")
     async def delete_object(self, object_name: str) -> None:
         await self._ensure_bucket()
         await self._run(self._client.remove_object, self.bucket_name, object_name)
         logger.info(f"Object '{object_name}' deleted from '{self.bucket_name}'")
 
-    async def presigned_get_url(
-        self,
-        object_name: str,
-        expires_seconds: Optional[int] = None,
-    ) -> str:
-        expires = timedelta(
-            seconds=expires_seconds or settings.minio_presigned_expires_seconds
-        )
-
-        presigned_url = await self._run(
-            self._public_client.presigned_get_object,
-            self.bucket_name,
-            object_name,
-            expires=expires,
-        )
-
-        logger.debug(f"Generated presigned URL for '{object_name}'")
-        return presigned_url
-
     async def is_available(self) -> bool:
         try:
             await self._ensure_bucket()
-        except S3Error:
-            return False
+        except Exception as exc:
+            if _is_s3_error(exc):
+                return False
+            raise
         return True
 
     @staticmethod
     def _peer_config_key(peer_id: UUID) -> str:
         return f"peers/{peer_id}.conf"
 
-    async def save_peer_config(self, peer_id: UUID, config: str) -> str:
-        object_name = self._peer_config_key(peer_id)
-        await self.upload_text(object_name, config, content_type="text/plain")
-        return await self.presigned_get_url(object_name)
-
     async def get_peer_config(self, peer_id: UUID) -> str | None:
         object_name = self._peer_config_key(peer_id)
         try:
             return await self.get_text(object_name)
-        except S3Error as exc:
-            if exc.code in {"NoSuchKey", "NoSuchObject"}:
+        except Exception as exc:
+            if _is_missing_object(exc):
                 return None
             raise
 
-    async def get_peer_config_url(self, peer_id: UUID) -> str | None:
+    async def delete_peer_config(self, peer_id: UUID) -> None:
         object_name = self._peer_config_key(peer_id)
         try:
-            return await self.presigned_get_url(object_name)
-        except S3Error as exc:
-            if exc.code in {"NoSuchKey", "NoSuchObject"}:
+            await self.delete_object(object_name)
+        except Exception as exc:
+            if _is_missing_object(exc):
+                return
+            raise
+
+    @staticmethod
+    def _peer_params_key(peer_id: UUID) -> str:
+        return f"peers/{peer_id}.json"
+
+    @staticmethod
+    def cluster_template_key(cluster_id: UUID, app_type: str, protocol: str, digest: str) -> str:
+        return f"templates/{cluster_id}/{app_type}-{protocol}/{digest}.conf"
+
+    @staticmethod
+    def cluster_template_pointer_key(cluster_id: UUID, app_type: str, protocol: str) -> str:
+        return f"templates/{cluster_id}/{app_type}-{protocol}/current.json"
+
+    async def get_text_if_exists(self, object_name: str) -> str | None:
+        try:
+            return await self.get_text(object_name)
+        except Exception as exc:
+            if _is_missing_object(exc):
                 return None
             raise
 
-    async def delete_peer_config(self, peer_id: UUID) -> None:
-        object_name = self._peer_config_key(peer_id)
+    async def save_peer_params(self, peer_id: UUID, params: str) -> None:
+        await self.upload_text(self._peer_params_key(peer_id), params, content_type="application/json")
+
+    async def get_peer_params(self, peer_id: UUID) -> str | None:
+        return await self.get_text_if_exists(self._peer_params_key(peer_id))
+
+    async def delete_peer_params(self, peer_id: UUID) -> None:
         try:
-            await self.delete_object(object_name)
-        except S3Error as exc:
-            if exc.code in {"NoSuchKey", "NoSuchObject"}:
+            await self.delete_object(self._peer_params_key(peer_id))
+        except Exception as exc:
+            if _is_missing_object(exc):
                 return
             raise
@@ -1,17 +1,22 @@
-from minio import Minio
-from urllib.parse import urlparse
+from typing import TYPE_CHECKING
 
 from src.management.settings import get_settings
 
+if TYPE_CHECKING:
+    from minio import Minio
+
 settings = get_settings()
 
-_minio_client: Minio | None = None
-_minio_public_client: Minio | None = None
+# The minio SDK takes about a quarter of a second to import, so it is loaded on
+# first use rather than at worker startup.
+_minio_client: "Minio | None" = None
 
 
-def get_minio_client() -> Minio:
+def get_minio_client() -> "Minio":
     global _minio_client
     if _minio_client is None:
+        from minio import Minio
+
         _minio_client = Minio(
             settings.minio_internal_host,
             access_key=settings.minio_access_key,
@@ -20,21 +25,3 @@ def get_minio_client() -> Minio:
         )
     return _minio_client
 
-
-def get_minio_public_client() -> Minio:
-    global _minio_public_client
-    if _minio_public_client is None:
-        host_str = settings.minio_public_host
-        parsed = urlparse(host_str if '://' in host_str else f'http://{host_str}')
-
-        is_secure = parsed.scheme == 'https'
-        public_endpoint = parsed.netloc
-
-        _minio_public_client = Minio(
-            public_endpoint,
-            access_key=settings.minio_access_key,
-            secret_key=settings.minio_secret_key,
-            secure=is_secure,
-            region="us-east-1",
-        )
-    return _minio_public_client
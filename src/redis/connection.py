@@ -1,18 +1,92 @@
 import redis.asyncio as redis
+from redis.asyncio.retry import Retry
+from redis.asyncio.sentinel import Sentinel
+from redis.backoff import EqualJitterBackoff
+from redis.exceptions import ConnectionError, TimeoutError
 
+from src.management.logger import configure_logger
 from src.management.settings import get_settings
 
+logger = configure_logger("REDIS", "blue")
 settings = get_settings()
 
 _redis_client: redis.Redis | None = None
+_binary_redis_client: redis.Redis | None = None
+
+
+def _connection_kwargs(decode_responses: bool) -> dict:
+    # hiredis is picked up automatically when installed (the "hiredis" extra).
+    return {
+        "password": settings.redis_password,
+        "db": settings.redis_db,
+        "encoding": "utf8",
+        "decode_responses": decode_responses,
+        "protocol": settings.redis_protocol,
+        "socket_timeout": settings.redis_socket_timeout,
+        "socket_connect_timeout": settings.redis_socket_connect_timeout,
+        "socket_keepalive": True,
+        "health_check_interval": settings.redis_health_check_interval,
+        "retry": Retry(
+            EqualJitterBackoff(cap=settings.redis_retry_backoff_cap, base=settings.redis_retry_backoff_base),
+            settings.redis_retry_attempts,
+        ),
+        "retry_on_error": [ConnectionError, TimeoutError],
+    }
+
+
+def _parse_sentinels(value: str) -> list[tuple[str, int]]:
+    sentinels = []
+    for item in value.split(","):
+        host, _, port = item.strip().rpartition(":")
+        sentinels.append((host, int(port)))
+    return sentinels
+
+
+def _create_client(decode_responses: bool = True) -> redis.Redis:
+    if settings.redis_sentinels:
+        sentinel = Sentinel(
+            _parse_sentinels(settings.redis_sentinels),
+            sentinel_kwargs={
+                "password": settings.redis_sentinel_password,
+                "socket_timeout": settings.redis_socket_timeout,
+                "socket_connect_timeout": settings.redis_socket_connect_timeout,
+            },
+            **_connection_kwargs(decode_responses),
+        )
+        logger.info(f"Using Redis master '{settings.redis_sentinel_master}' via Sentinel")
+        return sentinel.master_for(
+            settings.redis_sentinel_master,
+            max_connections=settings.redis_max_connections,
+        )
+
+    pool = redis.BlockingConnectionPool(
+        host=settings.redis_host,
+        port=settings.redis_port,
+        max_connections=settings.redis_max_connections,
+        timeout=settings.redis_pool_timeout,
+        **_connection_kwargs(decode_responses),
+    )
+    return redis.Redis(connection_pool=pool)
 
 
 async def get_redis() -> redis.Redis:
     global _redis_client
     if _redis_client is None:
-        _redis_client = await redis.from_url(
-            f"redis://:{settings.redis_password}@{settings.redis_host}:{settings.redis_port}/{settings.redis_db}",
-            encoding="utf8",
-            decode_responses=True
-        )
+        _redis_client = _create_client()
     return _redis_client
+
+
+async def get_binary_redis() -> redis.Redis:
+    """Client returning raw bytes, for values stored in a binary encoding."""
+    global _binary_redis_client
+    if _binary_redis_client is None:
+        _binary_redis_client = _create_client(decode_responses=False)
+    return _binary_redis_client
+
+
+async def close_redis() -> None:
+    global _redis_client, _binary_redis_client
+    clients = [client for client in (_redis_client, _binary_redis_client) if client is not None]
+    _redis_client = _binary_redis_client = None
+    for client in clients:
+        await client.aclose(close_connection_pool=True)
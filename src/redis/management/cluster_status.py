@@ -1,155 +1,288 @@
-import json
+from dataclasses import dataclass
 from typing import Any
 
-from src.redis.connection import get_redis
-from src.management.logger import configure_logger
+from src.redis.connection import get_binary_redis
+from src.redis.management.encoding import decode_peer_status, decode_traffic, encode_peer_status, encode_traffic
+from src.redis.management.local_cache import LocalTTLCache
+from src.redis.management.pubsub import listen, publish
+from src.management.logger import configure_logger, sampled
 from src.management.settings import get_settings
+from src.management.metrics import redis_operation
 
 logger = configure_logger("CLUSTER_CACHE", "blue")
+
+BULK_CHUNK_SIZE = 1000
+INVALIDATION_CHANNEL = "cluster_status:invalidate"
+peer_logger = sampled(logger)
 settings = get_settings()
 
+# Shared by every ClusterStatusCache instance in the worker.
+_local_summaries = LocalTTLCache(
+    settings.cluster_status_local_max_entries,
+    settings.cluster_status_local_ttl_seconds,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ClusterStatusSummary:
+    traffic: dict[str, Any] | None = None
+    protocol: str | None = None
+
 
 class ClusterStatusCache:
+    @redis_operation("save_peer_status")
     async def save_peer_status(self, cluster_id: str, public_key: str, peer_data: dict[str, Any]) -> None:
-        redis = await get_redis()
+        redis = await get_binary_redis()
         key = f"cluster:{cluster_id}:peer:{public_key}:status"
 
         try:
-            await redis.setex(key, settings.peer_status_ttl, json.dumps(peer_data, sort_keys=True))
-            logger.debug(f"Saved peer status: {key}")
+            await redis.setex(key, settings.peer_status_ttl, encode_peer_status(peer_data))
+            peer_logger.debug("Saved peer status: {}", key)
         except Exception as e:
             logger.error(f"Error saving peer status {key}: {e}")
             raise
 
+    @redis_operation("save_peer_status_if_changed")
     async def save_peer_status_if_changed(self, cluster_id: str, public_key: str, peer_data: dict[str, Any]) -> bool:
-        redis = await get_redis()
+        redis = await get_binary_redis()
         key = f"cluster:{cluster_id}:peer:{public_key}:status"
 
         try:
-            payload = json.dumps(peer_data, sort_keys=True)
+            payload = encode_peer_status(peer_data)
             existing = await redis.get(key)
             if existing == payload:
                 return False
             await redis.setex(key, settings.peer_status_ttl, payload)
-            logger.debug(f"Saved peer status: {key}")
+            peer_logger.debug("Saved peer status: {}", key)
             return True
         except Exception as e:
             logger.error(f"Error saving peer status {key}: {e}")
             raise
 
+    @redis_operation("save_peer_statuses_if_changed")
+    async def save_peer_statuses_if_changed(self, cluster_id: str, statuses: dict[str, dict[str, Any]]) -> list[str]:
+        """
+        Bulk save_peer_status_if_changed: one MGET and one pipelined batch of SETEX
+        per BULK_CHUNK_SIZE peers instead of two round trips per peer. Returns the
+        public keys whose status was written.
+        """
+        redis = await get_binary_redis()
+        items = [
+            (public_key, f"cluster:{cluster_id}:peer:{public_key}:status", encode_peer_status(peer_data))
+            for public_key, peer_data in statuses.items()
+        ]
+        written = []
+
+        try:
+            for start in range(0, len(items), BULK_CHUNK_SIZE):
+                chunk = items[start:start + BULK_CHUNK_SIZE]
+                existing = await redis.mget([key for _, key, _ in chunk])
+                changed = [item for item, current in zip(chunk, existing) if current != item[2]]
+                if not changed:
+                    continue
+                async with redis.pipeline(transaction=False) as pipe:
+                    for _, key, payload in changed:
+                        pipe.setex(key, settings.peer_status_ttl, payload)
+                    await pipe.execute()
+                written.extend(public_key for public_key, _, _ in changed)
+            peer_logger.debug("Saved {} peer statuses for cluster {}", len(written), cluster_id)
+            return written
+        except Exception as e:
+            logger.error(f"Error saving peer statuses for cluster {cluster_id}: {e}")
+            raise
+
+    @redis_operation("get_peer_status")
     async def get_peer_status(self, cluster_id: str, public_key: str) -> dict[str, Any] | None:
-        redis = await get_redis()
+        redis = await get_binary_redis()
         key = f"cluster:{cluster_id}:peer:{public_key}:status"
 
         try:
             data = await redis.get(key)
             if data:
-                return json.loads(data)
+                return decode_peer_status(public_key, data)
             return None
         except Exception as e:
             logger.error(f"Error getting peer status {key}: {e}")
             return None
 
+    @redis_operation("get_all_peers_status")
     async def get_all_peers_status(self, cluster_id: str) -> list[dict[str, Any]]:
-        redis = await get_redis()
+        redis = await get_binary_redis()
         pattern = f"cluster:{cluster_id}:peer:*:status"
 
         try:
             keys = await redis.keys(pattern)
+            values = await redis.mget(keys) if keys else []
             peers = []
 
-            for key in keys:
-                data = await redis.get(key)
+            for key, data in zip(keys, values):
                 if data:
+                    key = key.decode()
                     try:
-                        peers.append(json.loads(data))
-                    except json.JSONDecodeError:
+                        peers.append(decode_peer_status(key.split(":")[3], data))
+                    except ValueError:
                         logger.warning(f"Failed to decode peer data from key: {key}")
 
-            logger.debug(f"Retrieved {len(peers)} peers for cluster {cluster_id}")
+            logger.debug("Retrieved {} peers for cluster {}", len(peers), cluster_id)
             return peers
         except Exception as e:
             logger.error(f"Error getting all peers status for cluster {cluster_id}: {e}")
             return []
 
+    @redis_operation("save_traffic")
     async def save_traffic(self, cluster_id: str, traffic_data: dict[str, Any]) -> None:
-        redis = await get_redis()
+        redis = await get_binary_redis()
         key = f"cluster:{cluster_id}:traffic"
 
         try:
-            await redis.setex(key, settings.peer_status_ttl, json.dumps(traffic_data, sort_keys=True))
-            logger.debug(f"Saved traffic stats: {key}")
+            await redis.setex(key, settings.peer_status_ttl, encode_traffic(traffic_data))
+            logger.debug("Saved traffic stats: {}", key)
+            await self._invalidate_summary(cluster_id)
         except Exception as e:
             logger.error(f"Error saving traffic stats {key}: {e}")
             raise
 
+    @redis_operation("save_traffic_if_changed")
     async def save_traffic_if_changed(self, cluster_id: str, traffic_data: dict[str, Any]) -> bool:
-        redis = await get_redis()
+        redis = await get_binary_redis()
         key = f"cluster:{cluster_id}:traffic"
 
         try:
-            payload = json.dumps(traffic_data, sort_keys=True)
+            payload = encode_traffic(traffic_data)
             existing = await redis.get(key)
             if existing == payload:
                 return False
             await redis.setex(key, settings.peer_status_ttl, payload)
-            logger.debug(f"Saved traffic stats: {key}")
+            logger.debug("Saved traffic stats: {}", key)
+            await self._invalidate_summary(cluster_id)
             return True
         except Exception as e:
             logger.error(f"Error saving traffic stats {key}: {e}")
             raise
 
+    @redis_operation("get_traffic")
     async def get_traffic(self, cluster_id: str) -> dict[str, Any] | None:
-        redis = await get_redis()
+        redis = await get_binary_redis()
         key = f"cluster:{cluster_id}:traffic"
 
         try:
             data = await redis.get(key)
             if data:
-                return json.loads(data)
+                return decode_traffic(data)
             return None
         except Exception as e:
             logger.error(f"Error getting traffic stats {key}: {e}")
             return None
 
+    @redis_operation("save_protocol")
     async def save_protocol(self, cluster_id: str, protocol: str) -> None:
-        redis = await get_redis()
+        redis = await get_binary_redis()
         key = f"cluster:{cluster_id}:protocol"
 
         try:
             await redis.setex(key, settings.peer_status_ttl, protocol)
-            logger.debug(f"Saved protocol: {key}")
+            logger.debug("Saved protocol: {}", key)
+            await self._invalidate_summary(cluster_id)
         except Exception as e:
             logger.error(f"Error saving protocol {key}: {e}")
             raise
 
+    @redis_operation("save_protocol_if_changed")
     async def save_protocol_if_changed(self, cluster_id: str, protocol: str) -> bool:
-        redis = await get_redis()
+        redis = await get_binary_redis()
         key = f"cluster:{cluster_id}:protocol"
 
         try:
             existing = await redis.get(key)
-            if existing == protocol:
+            if existing == protocol.encode():
                 return False
             await redis.setex(key, settings.peer_status_ttl, protocol)
-            logger.debug(f"Saved protocol: {key}")
+            logger.debug("Saved protocol: {}", key)
+            await self._invalidate_summary(cluster_id)
             return True
         except Exception as e:
             logger.error(f"Error saving protocol {key}: {e}")
             raise
 
+    @redis_operation("get_protocol")
     async def get_protocol(self, cluster_id: str) -> str | None:
-        redis = await get_redis()
+        redis = await get_binary_redis()
         key = f"cluster:{cluster_id}:protocol"
 
         try:
-            return await redis.get(key)
+            protocol = await redis.get(key)
+            return protocol.decode() if protocol is not None else None
         except Exception as e:
             logger.error(f"Error getting protocol {key}: {e}")
             return None
 
+    @redis_operation("get_cluster_summaries")
+    async def get_cluster_summaries(self, cluster_ids: list[str]) -> dict[str, ClusterStatusSummary]:
+        """
+        Traffic and protocol of many clusters: served from the in-process L1
+        when fresh, otherwise one MGET for all the misses.
+        """
+        summaries = {}
+        misses = []
+        for cluster_id in cluster_ids:
+            cached = _local_summaries.get(cluster_id)
+            if LocalTTLCache.is_missing(cached):
+                misses.append(cluster_id)
+            else:
+                summaries[cluster_id] = cached
+        if not misses:
+            return summaries
+
+        redis = await get_binary_redis()
+        generation = _local_summaries.generation
+        keys = []
+        for cluster_id in misses:
+            keys.append(f"cluster:{cluster_id}:traffic")
+            keys.append(f"cluster:{cluster_id}:protocol")
+
+        try:
+            values = await redis.mget(keys)
+        except Exception as e:
+            logger.error(f"Error getting status summaries for {len(misses)} clusters: {e}")
+            summaries.update({cluster_id: ClusterStatusSummary() for cluster_id in misses})
+            return summaries
+
+        for index, cluster_id in enumerate(misses):
+            raw_traffic, protocol = values[2 * index], values[2 * index + 1]
+            traffic = None
+            if raw_traffic:
+                try:
+                    traffic = decode_traffic(raw_traffic)
+                except ValueError:
+                    logger.warning(f"Failed to decode traffic data of cluster {cluster_id}")
+            summary = ClusterStatusSummary(
+                traffic=traffic,
+                protocol=protocol.decode() if protocol is not None else None,
+            )
+            _local_summaries.set(cluster_id, summary, generation)
+            summaries[cluster_id] = summary
+        return summaries
+
+    async def _invalidate_summary(self, cluster_id: str) -> None:
+        _local_summaries.discard(cluster_id)
+        try:
+            await publish(INVALIDATION_CHANNEL, cluster_id)
+        except Exception as e:
+            logger.error(f"Failed to publish status invalidation for cluster {cluster_id}: {e}")
+
+    async def listen_invalidations(self) -> None:
+        """Drop L1 entries that other workers changed; runs for the app lifetime."""
+        await listen(INVALIDATION_CHANNEL, self._on_invalidation, on_subscribe=self._on_subscribe)
+
+    async def _on_invalidation(self, cluster_id: str) -> None:
+        _local_summaries.discard(cluster_id)
+
+    async def _on_subscribe(self) -> None:
+        _local_summaries.clear()
+
+    @redis_operation("clear_cluster_cache")
     async def clear_cluster_cache(self, cluster_id: str) -> None:
-        redis = await get_redis()
+        redis = await get_binary_redis()
         pattern = f"cluster:{cluster_id}:*"
 
         try:
@@ -157,5 +290,6 @@ class ClusterStatusCache:
             if keys:
                 await redis.delete(*keys)
                 logger.info(f"Cleared {len(keys)} cache entries for cluster {cluster_id}")
+            await self._invalidate_summary(cluster_id)
         except Exception as e:
             logger.error(f"Error clearing cache for cluster {cluster_id}: {e}")
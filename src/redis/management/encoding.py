@@ -0,0 +1,108 @@
+"""
+Binary encoding of the cluster status values kept in Redis.
+
+Values are msgpack arrays with fixed field positions, prefixed by a format
+version, instead of JSON objects that repeat every field name. The public key
+is not stored (it is part of the Redis key) and handshakes are epoch seconds.
+
+Version 0 is the previous JSON format. Decoders still accept it, and writers
+always emit the current version. A legacy value never equals its re-encoded
+form, so the "if changed" writes replace it on the next sync, and anything left
+over expires after peer_status_ttl. No explicit migration step is needed.
+"""
+import json
+from datetime import datetime, timezone
+from typing import Any
+
+import msgpack
+
+PEER_STATUS_VERSION = 1
+TRAFFIC_VERSION = 1
+
+_LEGACY_JSON_PREFIX = b"{"
+
+
+class UnsupportedFormatError(ValueError):
+    pass
+
+
+def _to_epoch(value: datetime | str | None) -> int | None:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp())
+
+
+def _from_epoch(value: int | None) -> str | None:
+    if value is None:
+        return None
+    return datetime.fromtimestamp(value, tz=timezone.utc).isoformat()
+
+
+def _unpack_fields(data: bytes, kind: str) -> list:
+    """Field array of a stored value; anything else is reported as UnsupportedFormatError."""
+    fields = msgpack.unpackb(data)
+    if not isinstance(fields, list) or not fields:
+        raise UnsupportedFormatError(f"{kind} is not a versioned field array")
+    return fields
+
+
+def encode_peer_status(status: dict[str, Any]) -> bytes:
+    return msgpack.packb([
+        PEER_STATUS_VERSION,
+        status["endpoint"],
+        status["allowed_ips"],
+        _to_epoch(status["last_handshake"]),
+        status["rx_bytes"],
+        status["tx_bytes"],
+        status["online"],
+        status["persistent_keepalive"],
+    ])
+
+
+def decode_peer_status(public_key: str, data: bytes) -> dict[str, Any]:
+    """Peer status in the shape sync_cluster builds it, last_handshake as ISO 8601."""
+    if data.startswith(_LEGACY_JSON_PREFIX):
+        return json.loads(data)
+    fields = _unpack_fields(data, "peer status")
+    if fields[0] != PEER_STATUS_VERSION:
+        raise UnsupportedFormatError(f"peer status format version {fields[0]}")
+    _, endpoint, allowed_ips, last_handshake, rx_bytes, tx_bytes, online, persistent_keepalive = fields
+    return {
+        "public_key": public_key,
+        "endpoint": endpoint,
+        "allowed_ips": allowed_ips,
+        "last_handshake": _from_epoch(last_handshake),
+        "rx_bytes": rx_bytes,
+        "tx_bytes": tx_bytes,
+        "online": online,
+        "persistent_keepalive": persistent_keepalive,
+    }
+
+
+def encode_traffic(traffic: dict[str, Any]) -> bytes:
+    return msgpack.packb([
+        TRAFFIC_VERSION,
+        traffic["total_rx_bytes"],
+        traffic["total_tx_bytes"],
+        traffic["total_peers"],
+        traffic["online_peers"],
+    ])
+
+
+def decode_traffic(data: bytes) -> dict[str, Any]:
+    if data.startswith(_LEGACY_JSON_PREFIX):
+        return json.loads(data)
+    fields = _unpack_fields(data, "traffic")
+    if fields[0] != TRAFFIC_VERSION:
+        raise UnsupportedFormatError(f"traffic format version {fields[0]}")
+    _, total_rx_bytes, total_tx_bytes, total_peers, online_peers = fields
+    return {
+        "total_rx_bytes": total_rx_bytes,
+        "total_tx_bytes": total_tx_bytes,
+        "total_peers": total_peers,
+        "online_peers": online_peers,
+    }
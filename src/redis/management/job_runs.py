@@ -0,0 +1,52 @@
+from datetime import datetime, timezone
+from typing import Any
+
+from src.redis.connection import get_redis
+from src.management.logger import configure_logger
+from src.management.settings import get_settings
+
+logger = configure_logger("JOB_RUNS", "blue")
+settings = get_settings()
+
+
+class JobRunRecorder:
+    """Last execution of each scheduled job, shared by all instances."""
+
+    @staticmethod
+    def _key(job_id: str) -> str:
+        return f"scheduler:job:{job_id}"
+
+    async def record_start(self, job_id: str, instance_id: str) -> None:
+        await self._save(job_id, {
+            "instance": instance_id,
+            "status": "running",
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "finished_at": "",
+            "duration_seconds": "",
+            "error": "",
+        })
+
+    async def record_finish(self, job_id: str, duration: float, error: str | None = None) -> None:
+        await self._save(job_id, {
+            "status": "failed" if error else "succeeded",
+            "finished_at": datetime.now(timezone.utc).isoformat(),
+            "duration_seconds": f"{duration:.3f}",
+            "error": (error or "")[:1000],
+        })
+
+    async def get(self, job_id: str) -> dict[str, Any] | None:
+        redis = await get_redis()
+        try:
+            return await redis.hgetall(self._key(job_id)) or None
+        except Exception as e:
+            logger.error(f"Error getting job run {job_id}: {e}")
+            return None
+
+    async def _save(self, job_id: str, fields: dict[str, str]) -> None:
+        redis = await get_redis()
+        key = self._key(job_id)
+        try:
+            await redis.hset(key, mapping=fields)
+            await redis.expire(key, settings.scheduler_job_record_ttl_seconds)
+        except Exception as e:
+            logger.error(f"Error saving job run {key}: {e}")
@@ -0,0 +1,50 @@
+import redis.asyncio as redis
+
+from src.redis.connection import get_redis
+from src.management.logger import configure_logger
+
+logger = configure_logger("LEADER_LOCK", "blue")
+
+
+class LeaderLock:
+    """
+    Expiring Redis lock owned by a token.
+
+    Renewal and release check ownership inside WATCH/MULTI, so a holder whose
+    lease already expired can never extend or drop the lock of a new owner.
+    """
+
+    def __init__(self, name: str, token: str, ttl_seconds: int):
+        self.key = f"leader:{name}"
+        self.token = token
+        self.ttl_ms = ttl_seconds * 1000
+
+    async def acquire(self) -> bool:
+        client = await get_redis()
+        return bool(await client.set(self.key, self.token, nx=True, px=self.ttl_ms))
+
+    async def renew(self) -> bool:
+        return await self._if_owner(lambda pipe: pipe.pexpire(self.key, self.ttl_ms))
+
+    async def release(self) -> bool:
+        return await self._if_owner(lambda pipe: pipe.delete(self.key))
+
+    async def get_owner(self) -> str | None:
+        client = await get_redis()
+        return await client.get(self.key)
+
+    async def _if_owner(self, command) -> bool:
+        client = await get_redis()
+        async with client.pipeline(transaction=True) as pipe:
+            try:
+                await pipe.watch(self.key)
+                if await pipe.get(self.key) != self.token:
+                    await pipe.unwatch()
+                    return False
+                pipe.multi()
+                command(pipe)
+                await pipe.execute()
+                return True
+            except redis.WatchError:
+                logger.debug(f"Lock {self.key} changed while checking ownership")
+                return False
@@ -0,0 +1,55 @@
+import time
+from collections import OrderedDict
+from typing import Any
+
+_MISSING = object()
+
+
+class LocalTTLCache:
+    """
+    Bounded in-process LRU with a per-entry TTL, used as an L1 in front of Redis.
+
+    Not shared between workers: writers invalidate other workers' copies through
+    pub/sub, and the short TTL bounds staleness if a message is missed.
+    generation changes on every invalidation, so a reader that fetched from
+    Redis before an invalidation can tell its value may be stale (see set()).
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.generation = 0
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str, default: Any = _MISSING) -> Any:
+        """Cached value, or default (a module sentinel unless given) when absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, generation: int | None = None) -> None:
+        """Store value unless an invalidation happened since generation was read."""
+        if self.ttl_seconds <= 0 or (generation is not None and generation != self.generation):
+            return
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: str) -> None:
+        self.generation += 1
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+
+    @staticmethod
+    def is_missing(value: Any) -> bool:
+        return value is _MISSING
@@ -0,0 +1,46 @@
+import asyncio
+from typing import Awaitable, Callable
+
+from src.redis.connection import get_redis
+from src.management.logger import configure_logger
+
+logger = configure_logger("REDIS_PUBSUB", "blue")
+
+RECONNECT_DELAY_SECONDS = 1.0
+
+
+async def publish(channel: str, message: str) -> int:
+    redis = await get_redis()
+    return await redis.publish(channel, message)
+
+
+async def listen(
+    channel: str,
+    handler: Callable[[str], Awaitable[None]],
+    on_subscribe: Callable[[], Awaitable[None]] | None = None,
+) -> None:
+    """
+    Dispatch messages of a channel to handler until cancelled.
+
+    Reconnects after Redis errors. on_subscribe runs after every (re)subscription,
+    so listeners can resync state that may have changed while disconnected.
+    """
+    while True:
+        try:
+            redis = await get_redis()
+            pubsub = redis.pubsub()
+            await pubsub.subscribe(channel)
+            try:
+                if on_subscribe is not None:
+                    await on_subscribe()
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message is not None:
+                        await handler(message["data"])
+            finally:
+                await pubsub.aclose()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Subscription to {channel} failed, reconnecting: {e}")
+            await asyncio.sleep(RECONNECT_DELAY_SECONDS)
@@ -0,0 +1,34 @@
+from src.redis.connection import get_redis
+from src.management.logger import configure_logger
+from src.management.settings import get_settings
+
+logger = configure_logger("RESPONSE_CACHE", "blue")
+settings = get_settings()
+
+
+class ResponseCache:
+    """Short-lived shared cache of serialized GET responses, keyed by their ETag."""
+
+    @staticmethod
+    def _key(etag: str) -> str:
+        return "response:" + etag.strip('"')
+
+    async def get(self, etag: str) -> str | None:
+        redis = await get_redis()
+        key = self._key(etag)
+
+        try:
+            return await redis.get(key)
+        except Exception as e:
+            logger.error(f"Error getting cached response {key}: {e}")
+            return None
+
+    async def save(self, etag: str, body: str) -> None:
+        redis = await get_redis()
+        key = self._key(etag)
+
+        try:
+            await redis.setex(key, settings.response_cache_ttl_seconds, body)
+            logger.debug(f"Cached response: {key}")
+        except Exception as e:
+            logger.error(f"Error caching response {key}: {e}")
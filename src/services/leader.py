@@ -0,0 +1,72 @@
+import asyncio
+import os
+import socket
+
+from src.redis.management.leader_lock import LeaderLock
+from src.management.logger import configure_logger
+from src.management.settings import get_settings
+
+logger = configure_logger("LEADER", "yellow")
+settings = get_settings()
+
+
+class LeaderElector:
+    """
+    Elects one process among all workers and replicas to run scheduled jobs.
+
+    The leader renews its lease every scheduler_renew_interval_seconds. If it
+    dies or cannot reach Redis, the lease expires and another instance takes
+    over on its next attempt.
+    """
+
+    def __init__(self) -> None:
+        self.instance_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._lock = LeaderLock("scheduler", self.instance_id, settings.scheduler_lease_seconds)
+        self._is_leader = not settings.scheduler_leader_election
+
+    @property
+    def is_leader(self) -> bool:
+        return self._is_leader
+
+    async def _step(self) -> None:
+        if self._is_leader:
+            if not await self._lock.renew():
+                self._is_leader = False
+                logger.warning(f"Lost scheduler leadership: {self.instance_id}")
+        elif await self._lock.acquire():
+            self._is_leader = True
+            logger.info(f"Acquired scheduler leadership: {self.instance_id}")
+
+    async def run(self) -> None:
+        if not settings.scheduler_leader_election:
+            return
+
+        while True:
+            try:
+                await self._step()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Without Redis the lease cannot be confirmed, so stop acting as leader.
+                if self._is_leader:
+                    logger.error(f"Lease renewal failed, stepping down: {e}")
+                else:
+                    logger.error(f"Leader election attempt failed: {e}")
+                self._is_leader = False
+            await asyncio.sleep(settings.scheduler_renew_interval_seconds)
+
+    async def resign(self) -> None:
+        if not settings.scheduler_leader_election or not self._is_leader:
+            return
+        self._is_leader = False
+        try:
+            await self._lock.release()
+            logger.info(f"Released scheduler leadership: {self.instance_id}")
+        except Exception as e:
+            logger.error(f"Failed to release scheduler leadership: {e}")
+
+    def describe(self) -> dict[str, str | bool]:
+        return {"instance": self.instance_id, "leader": self._is_leader}
+
+
+leader_elector = LeaderElector()
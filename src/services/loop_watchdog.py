@@ -0,0 +1,97 @@
+import asyncio
+import sys
+import threading
+import time
+import traceback
+
+from src.management.logger import configure_logger
+from src.management.metrics import EVENT_LOOP_BLOCK_SECONDS, EVENT_LOOP_BLOCKS, EVENT_LOOP_LAG_SECONDS
+from src.management.settings import get_settings
+
+logger = configure_logger("LOOP_WATCHDOG", "red")
+settings = get_settings()
+
+
+class LoopWatchdog:
+    """
+    Detects a blocked event loop from a separate thread.
+
+    Every interval the thread schedules a callback on the loop and records how
+    long it took to run (the loop lag histogram). If it has not run within the
+    threshold, the loop is stuck in synchronous code: the watchdog logs the
+    loop thread's current stack and the task that was running, then keeps
+    waiting so the total block time is reported once the loop recovers.
+    Costs one call_soon_threadsafe per interval.
+    """
+
+    def __init__(self) -> None:
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._thread: threading.Thread | None = None
+        self._stopping = threading.Event()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._thread.start()
+        logger.info(
+            f"Watching event loop every {settings.loop_watchdog_interval_seconds}s, "
+            f"blocking threshold {settings.loop_watchdog_threshold_ms} ms"
+        )
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._thread.join(timeout=1)
+        self._thread = None
+
+    def _watch(self) -> None:
+        interval = settings.loop_watchdog_interval_seconds
+        threshold = settings.loop_watchdog_threshold_ms / 1000
+
+        while not self._stopping.wait(interval):
+            answered = threading.Event()
+            posted = time.perf_counter()
+            try:
+                self._loop.call_soon_threadsafe(self._answer, posted, answered)
+            except RuntimeError:
+                # loop closed under us during shutdown
+                return
+
+            if answered.wait(threshold):
+                continue
+
+            self._report_blocked()
+            while not answered.wait(interval):
+                if self._stopping.is_set():
+                    return
+            blocked_for = time.perf_counter() - posted
+            EVENT_LOOP_BLOCKS.inc()
+            EVENT_LOOP_BLOCK_SECONDS.observe(blocked_for)
+            logger.warning(f"Event loop unblocked, watchdog probe waited {blocked_for * 1000:.0f} ms")
+
+    @staticmethod
+    def _answer(posted: float, answered: threading.Event) -> None:
+        EVENT_LOOP_LAG_SECONDS.observe(time.perf_counter() - posted)
+        answered.set()
+
+    def _report_blocked(self) -> None:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        stack = "".join(traceback.format_stack(frame)) if frame is not None else "<no frame>"
+        try:
+            task = asyncio.current_task(self._loop)
+        except RuntimeError:
+            task = None
+        running = f"task {task.get_name()} ({task.get_coro()!r})" if task is not None else "a callback outside any task"
+        logger.warning(
+            f"Event loop blocked for more than {settings.loop_watchdog_threshold_ms} ms "
+            f"while running {running}:\n{stack}"
+        )
+
+
+loop_watchdog = LoopWatchdog()
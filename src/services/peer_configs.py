@@ -0,0 +1,219 @@
+import asyncio
+import hashlib
+import io
+import json
+import re
+import uuid
+
+import segno
+
+from src.management.logger import configure_logger
+from src.management.settings import get_settings
+from src.minio import MinioClient
+from src.redis.management.local_cache import LocalTTLCache
+
+logger = configure_logger("PEER_CONFIGS", "cyan")
+settings = get_settings()
+
+PARAMS_VERSION = 2
+
+# Values that differ between peers of one cluster; everything else in the
+# config (server key, endpoint, DNS, AWG obfuscation Jc/S1/H1...) is shared.
+PER_PEER_KEYS = {
+    "interface": {"privatekey", "address"},
+    "peer": {"presharedkey"},
+}
+
+_SECTION = re.compile(r"^\s*\[(?P<name>[^\]]+)\]\s*$")
+_ENTRY = re.compile(r"^(?P<indent>\s*)(?P<key>[A-Za-z0-9_]+)(?P<sep>\s*=\s*)(?P<value>.*?)\s*$")
+_PLACEHOLDER = re.compile(r"\{\{([A-Za-z0-9_.]+)\}\}")
+
+
+def split_config(config: str) -> tuple[str | None, dict[str, str]]:
+    """
+    Split a WireGuard/AWG INI config into a cluster template with
+    {{Section.Key}} placeholders and the per-peer values. Configs in any other
+    format (e.g. vpn:// links) return (None, {}) and are stored whole.
+    """
+    section = None
+    lines = []
+    params = {}
+    for line in config.splitlines(keepends=True):
+        header = _SECTION.match(line)
+        if header:
+            section = header["name"].strip()
+            lines.append(line)
+            continue
+        entry = _ENTRY.match(line.rstrip("\r\n"))
+        if section and entry and entry["key"].lower() in PER_PEER_KEYS.get(section.lower(), ()):
+            name = f"{section}.{entry['key']}"
+            if name in params:
+                return None, {}
+            params[name] = entry["value"]
+            newline = line[len(line.rstrip("\r\n")):]
+            lines.append(f"{entry['indent']}{entry['key']}{entry['sep']}{{{{{name}}}}}{newline}")
+            continue
+        lines.append(line)
+
+    if not params or _PLACEHOLDER.search(config):
+        return None, {}
+    return "".join(lines), params
+
+
+def render_config(template: str, params: dict[str, str]) -> str:
+    return _PLACEHOLDER.sub(lambda match: params[match[1]], template)
+
+
+class PeerConfigStore:
+    """
+    Peer configs stored as a per-cluster template plus small per-peer params.
+
+    peers/{id}.json holds the peer's own values (private key, address, PSK),
+    the template its config was created from and the cluster's template
+    pointer. Templates are stored under the SHA-256 of their content, and
+    templates/.../current.json points at the one of the newest node config.
+    A peer renders with the current template, so a change of the cluster-wide
+    part (server key, endpoint, AWG obfuscation params) reaches every peer by
+    saving one newer peer. The pointer only moves to configs requested later
+    than the one it holds, and a peer never renders with a template older than
+    its own, so a create racing a node change cannot roll peers back. Pointers,
+    rendered configs, templates and QR codes are cached in process for
+    peer_config_cache_ttl_seconds. Peers created before this layout still have
+    a full peers/{id}.conf, which is served as is.
+    """
+
+    def __init__(self) -> None:
+        self.minio = MinioClient()
+        self._templates = LocalTTLCache(settings.peer_config_cache_max_entries, settings.peer_config_cache_ttl_seconds)
+        self._pointers = LocalTTLCache(settings.peer_config_cache_max_entries, settings.peer_config_cache_ttl_seconds)
+        self._rendered = LocalTTLCache(settings.peer_config_cache_max_entries, settings.peer_config_cache_ttl_seconds)
+        self._qr_codes = LocalTTLCache(settings.peer_config_cache_max_entries, settings.peer_config_cache_ttl_seconds)
+
+    async def save(
+        self,
+        peer_id: uuid.UUID,
+        cluster_id: uuid.UUID,
+        app_type: str,
+        protocol: str,
+        config: str,
+        requested_at: float,
+    ) -> None:
+        """requested_at is the epoch time the node was asked for config; it orders templates."""
+        template, params = split_config(config)
+        document = {"version": PARAMS_VERSION}
+        if template is None:
+            document["raw"] = config
+        else:
+            digest = hashlib.sha256(template.encode()).hexdigest()
+            template_name = self.minio.cluster_template_key(cluster_id, app_type, protocol, digest)
+            pointer_name = self.minio.cluster_template_pointer_key(cluster_id, app_type, protocol)
+            if await self._get_template(template_name) is None:
+                await self.minio.upload_text(template_name, template, content_type="text/plain")
+                self._templates.set(template_name, template)
+            await self._set_current_template(pointer_name, template_name, requested_at)
+            document["template"] = template_name
+            document["current"] = pointer_name
+            document["requested_at"] = requested_at
+            document["params"] = params
+
+        await self.minio.save_peer_params(peer_id, json.dumps(document))
+        self._rendered.set(str(peer_id), config)
+
+    async def render(self, peer_id: uuid.UUID) -> str | None:
+        cached = self._rendered.get(str(peer_id))
+        if not LocalTTLCache.is_missing(cached):
+            return cached
+
+        generation = self._rendered.generation
+        raw_document = await self.minio.get_peer_params(peer_id)
+        if raw_document is None:
+            config = await self.minio.get_peer_config(peer_id)
+        else:
+            document = json.loads(raw_document)
+            if "raw" in document:
+                config = document["raw"]
+            else:
+                template_name = document["template"]
+                # Documents written before the pointer existed render with their own template.
+                if "current" in document:
+                    pointer = await self._get_pointer(document["current"])
+                    if pointer is not None and pointer["requested_at"] >= document["requested_at"]:
+                        template_name = pointer["template"]
+                template = await self._get_template(template_name)
+                config = render_config(template, document["params"]) if template is not None else None
+                if template is None:
+                    logger.error(f"Template {template_name} of peer {peer_id} is missing")
+
+        if config is not None:
+            self._rendered.set(str(peer_id), config, generation)
+        return config
+
+    async def render_qr_png(self, peer_id: uuid.UUID) -> bytes | None:
+        config = await self.render(peer_id)
+        if config is None:
+            return None
+        digest = hashlib.sha256(config.encode()).hexdigest()
+        png = self._qr_codes.get(digest)
+        if LocalTTLCache.is_missing(png):
+            png = await asyncio.to_thread(self._make_qr_png, config)
+            self._qr_codes.set(digest, png)
+        return png
+
+    async def delete(self, peer_id: uuid.UUID) -> None:
+        self._rendered.discard(str(peer_id))
+        await self.minio.delete_peer_params(peer_id)
+        await self.minio.delete_peer_config(peer_id)
+
+    async def _set_current_template(self, pointer_name: str, template_name: str, requested_at: float) -> None:
+        cached = self._pointers.get(pointer_name)
+        if not LocalTTLCache.is_missing(cached) and cached is not None and cached["template"] == template_name:
+            return
+
+        # Another worker may have moved the pointer since it was cached.
+        pointer = await self._read_pointer(pointer_name)
+        if pointer is not None and pointer["template"] == template_name:
+            self._pointers.set(pointer_name, pointer)
+            return
+        if pointer is not None and pointer["requested_at"] > requested_at:
+            logger.warning(
+                f"Kept {pointer_name} at {pointer['template']}: {template_name} "
+                f"comes from an older node config"
+            )
+            self._pointers.set(pointer_name, pointer)
+            return
+
+        current = {"template": template_name, "requested_at": requested_at}
+        await self.minio.upload_text(pointer_name, json.dumps(current), content_type="application/json")
+        self._pointers.set(pointer_name, current)
+        # Configs rendered here with the previous template are stale now.
+        self._rendered.clear()
+        if pointer is not None:
+            logger.info(f"Cluster template changed: {pointer['template']} -> {template_name}")
+
+    async def _get_pointer(self, pointer_name: str) -> dict | None:
+        pointer = self._pointers.get(pointer_name)
+        if LocalTTLCache.is_missing(pointer):
+            pointer = await self._read_pointer(pointer_name)
+            self._pointers.set(pointer_name, pointer)
+        return pointer
+
+    async def _read_pointer(self, pointer_name: str) -> dict | None:
+        raw_pointer = await self.minio.get_text_if_exists(pointer_name)
+        return json.loads(raw_pointer) if raw_pointer is not None else None
+
+    async def _get_template(self, template_name: str) -> str | None:
+        template = self._templates.get(template_name)
+        if LocalTTLCache.is_missing(template):
+            template = await self.minio.get_text_if_exists(template_name)
+            if template is not None:
+                self._templates.set(template_name, template)
+        return template
+
+    @staticmethod
+    def _make_qr_png(config: str) -> bytes:
+        buffer = io.BytesIO()
+        segno.make(config, error="m").save(buffer, kind="png", scale=settings.peer_config_qr_scale, border=2)
+        return buffer.getvalue()
+
+
+peer_configs = PeerConfigStore()
@@ -1,13 +1,43 @@
+import time
 import pytz
+from functools import wraps
+from typing import Awaitable, Callable
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 from src.management.logger import configure_logger
 from src.management.settings import get_settings
+from src.redis.management.job_runs import JobRunRecorder
+from src.management.metrics import JOB_DURATION_SECONDS, JOB_FAILURES
+from src.services.leader import leader_elector
 
 logger = configure_logger("SCHEDULER", "yellow")
 settings = get_settings()
 
 scheduler = AsyncIOScheduler(timezone=pytz.timezone(settings.timezone))
+job_runs = JobRunRecorder()
+
+
+def leader_only(job_id: str, job: Callable[[], Awaitable[None]]) -> Callable[[], Awaitable[None]]:
+    """Run the job only on the elected leader and record every execution."""
+
+    @wraps(job)
+    async def wrapper() -> None:
+        if not leader_elector.is_leader:
+            return
+
+        await job_runs.record_start(job_id, leader_elector.instance_id)
+        started = time.perf_counter()
+        try:
+            await job()
+        except Exception as e:
+            JOB_FAILURES.labels(job=job_id).inc()
+            await job_runs.record_finish(job_id, time.perf_counter() - started, str(e))
+            raise
+        finally:
+            JOB_DURATION_SECONDS.labels(job=job_id).observe(time.perf_counter() - started)
+        await job_runs.record_finish(job_id, time.perf_counter() - started)
+
+    return wrapper
 
 
 def start_scheduler():
@@ -0,0 +1,95 @@
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator
+
+import orjson
+
+from src.management.logger import configure_logger
+from src.management.settings import get_settings
+from src.redis.management.pubsub import listen, publish
+
+logger = configure_logger("STATUS_STREAM", "green")
+settings = get_settings()
+
+EVENTS_CHANNEL = "status:events"
+
+
+@dataclass(frozen=True, slots=True)
+class StatusEvent:
+    type: str
+    cluster_id: str
+    # Already-encoded JSON of the whole event, sent to clients as is.
+    raw: str
+
+
+# Put in a subscriber's queue when it fell too far behind; the stream then ends
+# so the dashboard reconnects and refetches instead of showing a gap.
+LAGGED = StatusEvent(type="lagged", cluster_id="", raw="{}")
+
+
+@dataclass(eq=False)
+class Subscription:
+    cluster_id: str | None
+    queue: asyncio.Queue = field(default_factory=lambda: asyncio.Queue(settings.status_stream_queue_size))
+
+
+class StatusStream:
+    """
+    Fan-out of cluster and peer status changes to live dashboards.
+
+    sync_cluster publishes events to Redis pub/sub; every worker keeps a
+    single subscription and copies each event into the queues of its own
+    connected clients, so the number of dashboards does not add Redis load.
+    """
+
+    def __init__(self) -> None:
+        self._subscriptions: set[Subscription] = set()
+
+    async def publish(self, event_type: str, cluster_id: str, data: dict[str, Any]) -> None:
+        message = orjson.dumps({"type": event_type, "cluster_id": cluster_id, "data": data}).decode()
+        try:
+            await publish(EVENTS_CHANNEL, message)
+        except Exception as e:
+            logger.error(f"Failed to publish {event_type} event for cluster {cluster_id}: {e}")
+
+    async def listen(self) -> None:
+        await listen(EVENTS_CHANNEL, self._on_message)
+
+    @asynccontextmanager
+    async def subscribe(self, cluster_id: str | None = None) -> AsyncIterator[Subscription]:
+        subscription = Subscription(cluster_id=cluster_id)
+        self._subscriptions.add(subscription)
+        try:
+            yield subscription
+        finally:
+            self._subscriptions.discard(subscription)
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subscriptions)
+
+    async def _on_message(self, message: str) -> None:
+        if not self._subscriptions:
+            return
+        try:
+            decoded = orjson.loads(message)
+            event = StatusEvent(type=decoded["type"], cluster_id=decoded["cluster_id"], raw=message)
+        except (orjson.JSONDecodeError, KeyError, TypeError):
+            logger.warning("Dropping malformed status event")
+            return
+
+        for subscription in list(self._subscriptions):
+            if subscription.cluster_id is not None and subscription.cluster_id != event.cluster_id:
+                continue
+            try:
+                subscription.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                self._subscriptions.discard(subscription)
+                while not subscription.queue.empty():
+                    subscription.queue.get_nowait()
+                subscription.queue.put_nowait(LAGGED)
+                logger.warning("Status stream subscriber fell behind and was disconnected")
+
+
+status_stream = StatusStream()
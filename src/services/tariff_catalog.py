@@ -0,0 +1,145 @@
+import asyncio
+import hashlib
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+
+from src.database.connection import sessionmaker
+from src.database.management.operations.tariff import get_all_tariffs
+from src.database.models import TariffModel
+from src.management.logger import configure_logger
+from src.management.settings import get_settings
+from src.redis.management.pubsub import listen, publish
+
+logger = configure_logger("TARIFF_CATALOG", "magenta")
+settings = get_settings()
+
+INVALIDATION_CHANNEL = "tariffs:invalidate"
+
+
+@dataclass(frozen=True, slots=True)
+class TariffSnapshot:
+    id: uuid.UUID
+    code: str
+    name: str
+    days: int
+    price_rub: int
+    price_stars: int
+    is_active: bool
+    sort_order: int
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_model(cls, tariff: TariffModel) -> "TariffSnapshot":
+        return cls(
+            id=tariff.id,
+            code=tariff.code,
+            name=tariff.name,
+            days=tariff.days,
+            price_rub=tariff.price_rub,
+            price_stars=tariff.price_stars,
+            is_active=tariff.is_active,
+            sort_order=tariff.sort_order,
+            created_at=tariff.created_at,
+            updated_at=tariff.updated_at,
+        )
+
+
+class TariffCatalog:
+    """
+    In-process copy of the tariffs table.
+
+    Loaded lazily (and at startup), invalidated across workers through Redis pub/sub
+    and reloaded after tariffs_catalog_ttl_seconds as a safety net for missed messages.
+    """
+
+    def __init__(self) -> None:
+        self._lock = asyncio.Lock()
+        self._generation = 0
+        self._loaded_at: float | None = None
+        self._tariffs: list[TariffSnapshot] = []
+        self._active: list[TariffSnapshot] = []
+        self._by_code: dict[str, TariffSnapshot] = {}
+        self._by_id: dict[uuid.UUID, TariffSnapshot] = {}
+        self._fingerprint = ""
+
+    def _is_loaded(self) -> bool:
+        return (
+            self._loaded_at is not None
+            and time.monotonic() - self._loaded_at < settings.tariffs_catalog_ttl_seconds
+        )
+
+    async def load(self) -> None:
+        generation = self._generation
+        async with sessionmaker() as session:
+            tariffs = [TariffSnapshot.from_model(t) for t in await get_all_tariffs(session)]
+
+        digest = hashlib.sha1(str(settings.subscription_enabled).encode())
+        for tariff in tariffs:
+            digest.update(f"{tariff.id}:{tariff.updated_at.isoformat()}".encode())
+
+        self._tariffs = tariffs
+        self._active = [t for t in tariffs if t.is_active]
+        self._by_code = {t.code: t for t in tariffs}
+        self._by_id = {t.id: t for t in tariffs}
+        self._fingerprint = digest.hexdigest()
+
+        # An invalidation that arrived while loading means the data may already be stale.
+        if generation == self._generation:
+            self._loaded_at = time.monotonic()
+        logger.debug(f"Tariff catalog loaded: {len(tariffs)} tariffs")
+
+    async def _ensure_loaded(self) -> None:
+        if self._is_loaded():
+            return
+        async with self._lock:
+            if not self._is_loaded():
+                await self.load()
+
+    async def get_all(self) -> list[TariffSnapshot]:
+        await self._ensure_loaded()
+        return self._tariffs
+
+    async def get_active(self) -> list[TariffSnapshot]:
+        await self._ensure_loaded()
+        return self._active
+
+    async def get_fingerprint(self) -> str:
+        """Changes whenever any tariff is created, updated or deleted."""
+        await self._ensure_loaded()
+        return self._fingerprint
+
+    async def get_by_code(self, code: str) -> TariffSnapshot | None:
+        await self._ensure_loaded()
+        return self._by_code.get(code)
+
+    async def get_by_id(self, tariff_id: uuid.UUID) -> TariffSnapshot | None:
+        await self._ensure_loaded()
+        return self._by_id.get(tariff_id)
+
+    def invalidate(self) -> None:
+        self._generation += 1
+        self._loaded_at = None
+
+    async def publish_invalidation(self) -> None:
+        """Drop the local copy and tell the other workers to drop theirs."""
+        self.invalidate()
+        try:
+            await publish(INVALIDATION_CHANNEL, "1")
+        except Exception as e:
+            logger.error(f"Failed to publish tariff catalog invalidation: {e}")
+
+    async def _on_message(self, _: str) -> None:
+        self.invalidate()
+        logger.debug("Tariff catalog invalidated")
+
+    async def _on_subscribe(self) -> None:
+        self.invalidate()
+
+    async def listen(self) -> None:
+        await listen(INVALIDATION_CHANNEL, self._on_message, on_subscribe=self._on_subscribe)
+
+
+tariff_catalog = TariffCatalog()
@@ -0,0 +1,98 @@
+import asyncio
+import uuid
+
+from src.database.connection import sessionmaker
+from src.database.management.operations.cluster import get_cluster_by_id
+from src.database.management.operations.outbox import (
+    get_pending_outbox_cluster_ids,
+    claim_outbox_batch,
+    complete_outbox_entries,
+    reschedule_outbox_entry,
+)
+from src.database.models import PeerOperation, PeerOutboxModel
+from src.api.v1.management.http_client import ClusterAPIClient
+from src.management.logger import configure_logger
+from src.management.settings import get_settings
+
+logger = configure_logger("OUTBOX_TASK", "yellow")
+settings = get_settings()
+
+
+async def _execute(cluster_client: ClusterAPIClient, entry: PeerOutboxModel) -> None:
+    if entry.operation == PeerOperation.DELETE_PEER.value:
+        await cluster_client.delete_peer(entry.public_key)
+    else:
+        raise ValueError(f"Unknown outbox operation: {entry.operation}")
+
+
+async def drain_cluster_outbox(cluster_id: uuid.UUID) -> tuple[int, int]:
+    """Process due outbox entries of one cluster batch by batch. Returns (completed, failed)."""
+    completed = 0
+    failed = 0
+
+    while True:
+        async with sessionmaker() as session:
+            cluster = await get_cluster_by_id(session, cluster_id)
+            if not cluster:
+                break
+            entries = await claim_outbox_batch(session, cluster_id, settings.outbox_batch_size)
+            await session.commit()
+        if not entries:
+            break
+
+        # No session or row lock is held while the node calls run.
+        cluster_client = ClusterAPIClient(cluster.endpoint, cluster.api_key, cluster.name)
+        results = await asyncio.gather(
+            *(_execute(cluster_client, entry) for entry in entries),
+            return_exceptions=True,
+        )
+
+        async with sessionmaker() as session:
+            done_ids = []
+            batch_failed = 0
+            for entry, result in zip(entries, results):
+                if isinstance(result, Exception):
+                    session.add(entry)
+                    reschedule_outbox_entry(entry, str(result))
+                    batch_failed += 1
+                    logger.warning(
+                        f"Outbox {entry.operation} for {entry.public_key} on {cluster.name} "
+                        f"failed (attempt {entry.attempts}): {result}"
+                    )
+                else:
+                    done_ids.append(entry.id)
+
+            await complete_outbox_entries(session, done_ids)
+            await session.commit()
+
+        completed += len(done_ids)
+        failed += batch_failed
+
+        # Stop on a short batch or when the node is failing; retries wait for backoff.
+        if batch_failed or len(entries) < settings.outbox_batch_size:
+            break
+
+    return completed, failed
+
+
+async def drain_peer_outbox() -> None:
+    async with sessionmaker() as session:
+        cluster_ids = await get_pending_outbox_cluster_ids(session)
+
+    if not cluster_ids:
+        return
+
+    semaphore = asyncio.Semaphore(settings.outbox_concurrency)
+
+    async def _drain(cluster_id: uuid.UUID) -> tuple[int, int]:
+        async with semaphore:
+            try:
+                return await drain_cluster_outbox(cluster_id)
+            except Exception as e:
+                logger.error(f"Failed to drain outbox for cluster {cluster_id}: {e}")
+                return 0, 0
+
+    results = await asyncio.gather(*(_drain(cluster_id) for cluster_id in cluster_ids))
+    completed = sum(r[0] for r in results)
+    failed = sum(r[1] for r in results)
+    logger.info(f"Outbox drained for {len(cluster_ids)} clusters: {completed} completed, {failed} failed")
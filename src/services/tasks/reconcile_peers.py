@@ -0,0 +1,116 @@
+import asyncio
+from typing import Any
+
+from src.database.connection import sessionmaker
+from src.database.management.operations.cluster import get_active_clusters
+from src.database.management.operations.peer import get_cluster_public_keys, get_existing_public_keys
+from src.database.models import ClusterModel
+from src.api.v1.management.http_client import ClusterAPIClient
+from src.management.logger import configure_logger
+from src.management.metrics import CLUSTER_PEER_DRIFT, RECONCILE_ORPHAN_DELETE_FAILURES, RECONCILE_ORPHANS_DELETED
+from src.management.settings import get_settings
+
+logger = configure_logger("RECONCILE_TASK", "yellow")
+settings = get_settings()
+
+
+async def reconcile_cluster(cluster: ClusterModel) -> dict[str, Any]:
+    """
+    Compare peers present on the node with peers stored in the database
+    and delete node peers that have no database row.
+
+    Peers present in the database but missing on the node are only reported.
+    """
+    cluster_client = ClusterAPIClient(cluster.endpoint, cluster.api_key, cluster.name)
+    node_peers = await cluster_client.get_all_peers()
+    node_keys = {peer["public_key"] for peer in node_peers if peer.get("public_key")}
+    del node_peers
+
+    async with sessionmaker() as session:
+        db_keys = await get_cluster_public_keys(session, cluster.id)
+
+    orphans = sorted(node_keys - db_keys)
+    missing_count = len(db_keys - node_keys)
+    node_count = len(node_keys)
+    db_count = len(db_keys)
+    del node_keys, db_keys
+
+    deleted = 0
+    failed = 0
+
+    if orphans:
+        # Peers are created on the node before their row is committed,
+        # so give in-flight creations time to land before deleting anything.
+        await asyncio.sleep(settings.reconcile_orphan_grace_seconds)
+
+    for start in range(0, len(orphans), settings.reconcile_batch_size):
+        batch = orphans[start:start + settings.reconcile_batch_size]
+
+        async with sessionmaker() as session:
+            known_keys = await get_existing_public_keys(session, batch)
+        batch = [public_key for public_key in batch if public_key not in known_keys]
+
+        results = await asyncio.gather(
+            *(cluster_client.delete_peer(public_key) for public_key in batch),
+            return_exceptions=True,
+        )
+        for public_key, result in zip(batch, results):
+            if isinstance(result, Exception):
+                failed += 1
+                logger.error(f"Failed to delete orphan peer {public_key} on {cluster.name}: {result}")
+            else:
+                deleted += 1
+
+    report = {
+        "cluster_id": str(cluster.id),
+        "cluster_name": cluster.name,
+        "node_peers": node_count,
+        "db_peers": db_count,
+        "orphan_peers": len(orphans),
+        "missing_peers": missing_count,
+        "deleted_orphans": deleted,
+        "failed_deletions": failed,
+    }
+
+    CLUSTER_PEER_DRIFT.labels(cluster=cluster.name, kind="orphan").set(report["orphan_peers"])
+    CLUSTER_PEER_DRIFT.labels(cluster=cluster.name, kind="missing").set(report["missing_peers"])
+    RECONCILE_ORPHANS_DELETED.labels(cluster=cluster.name).inc(deleted)
+    RECONCILE_ORPHAN_DELETE_FAILURES.labels(cluster=cluster.name).inc(failed)
+
+    if orphans or missing_count:
+        logger.warning(
+            f"Drift on cluster {cluster.name}: {len(orphans)} orphan peers on node "
+            f"({deleted} deleted, {failed} failed), {missing_count} peers missing on node"
+        )
+    else:
+        logger.debug(f"No drift on cluster {cluster.name}: {node_count} peers")
+
+    return report
+
+
+async def reconcile_peers() -> list[dict[str, Any]]:
+    logger.info("Starting peers reconciliation")
+
+    async with sessionmaker() as session:
+        clusters = await get_active_clusters(session)
+
+    semaphore = asyncio.Semaphore(settings.reconcile_concurrency)
+
+    async def _reconcile(cluster: ClusterModel) -> dict[str, Any] | None:
+        async with semaphore:
+            try:
+                return await reconcile_cluster(cluster)
+            except Exception as e:
+                logger.error(f"Failed to reconcile cluster {cluster.name}: {e}")
+                return None
+
+    results = await asyncio.gather(*(_reconcile(cluster) for cluster in clusters))
+    reports = [report for report in results if report is not None]
+
+    logger.info(
+        f"Reconciliation completed: {len(reports)}/{len(clusters)} clusters, "
+        f"{sum(r['orphan_peers'] for r in reports)} orphan peers, "
+        f"{sum(r['deleted_orphans'] for r in reports)} deleted, "
+        f"{sum(r['missing_peers'] for r in reports)} missing on nodes"
+    )
+    return reports
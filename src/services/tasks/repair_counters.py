@@ -0,0 +1,35 @@
+from src.database.connection import sessionmaker
+from src.database.management.operations.counters import (
+    lock_peers_for_counting,
+    repair_client_counters,
+    repair_cluster_counters,
+)
+from src.management.logger import configure_logger
+
+logger = configure_logger("COUNTERS_TASK", "yellow")
+
+
+async def repair_peer_counters():
+    """
+    Recompute the trigger-maintained peer counters of clients and clusters.
+
+    The trigger keeps them exact; this only corrects drift from manual edits or
+    restores that bypassed it. Peer writes wait while the counts are taken.
+    """
+    logger.info("Starting peer counters repair")
+
+    async with sessionmaker() as session:
+        try:
+            await lock_peers_for_counting(session)
+            clients_fixed = await repair_client_counters(session)
+            clusters_fixed = await repair_cluster_counters(session)
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            logger.error(f"Error during peer counters repair: {e}")
+            return
+
+    if clients_fixed or clusters_fixed:
+        logger.warning(f"Peer counters drifted: fixed {clients_fixed} clients, {clusters_fixed} clusters")
+    else:
+        logger.info("Peer counters repair completed, no drift found")
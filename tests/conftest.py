@@ -0,0 +1,50 @@
+"""
+Fixtures for tests that need Postgres.
+
+A scratch database is created on the server from the regular POSTGRES_*
+settings, migrated to head with the project's migrations and dropped after the
+session. The tests are skipped when that server is unreachable.
+"""
+import uuid
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import URL, create_engine, pool, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import OperationalError
+
+from src.database.migrations import ALEMBIC_INI
+from src.management.settings import get_settings
+
+settings = get_settings()
+
+
+@pytest.fixture(scope="session")
+def postgres_url() -> URL:
+    """Sync (psycopg2) URL of a freshly migrated scratch database."""
+    admin_engine = create_engine(settings.sync_postgres_url, poolclass=pool.NullPool, isolation_level="AUTOCOMMIT")
+    database = f"test_{uuid.uuid4().hex[:12]}"
+    try:
+        with admin_engine.connect() as connection:
+            connection.execute(text(f'CREATE DATABASE "{database}"'))
+    except OperationalError as e:
+        admin_engine.dispose()
+        pytest.skip(f"Postgres is not available: {e}")
+
+    url = make_url(settings.sync_postgres_url).set(database=database)
+    try:
+        engine = create_engine(url, poolclass=pool.NullPool)
+        try:
+            with engine.connect() as connection:
+                alembic_cfg = Config(str(ALEMBIC_INI))
+                alembic_cfg.attributes["connection"] = connection
+                command.upgrade(alembic_cfg, "head")
+                connection.commit()
+        finally:
+            engine.dispose()
+        yield url
+    finally:
+        with admin_engine.connect() as connection:
+            connection.execute(text(f'DROP DATABASE IF EXISTS "{database}" WITH (FORCE)'))
+        admin_engine.dispose()
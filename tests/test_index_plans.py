@@ -0,0 +1,209 @@
+"""
+Regression checks for the indexes of the hot query paths.
+
+The queries are issued by the real operations functions against a seeded
+scratch database; the captured SQL is then EXPLAINed after VACUUM ANALYZE, and
+the plan must reference the index added for it. A failure means a query or
+index change made the planner fall back to scanning the table.
+
+Left out on purpose: full listings and aggregates that read whole tables by
+design (get_all_*, statistics, get_online_peers_total), primary-key lookups,
+the tariffs operations (a table of a handful of rows) and plain writes.
+"""
+import asyncio
+import hashlib
+import json
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import URL, create_engine, event, pool, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.database.management.operations.client import get_client_by_username, get_expired_clients
+from src.database.management.operations.cluster import get_cluster_by_api_key, get_cluster_by_name
+from src.database.management.operations.counters import repair_client_counters, repair_cluster_counters
+from src.database.management.operations.outbox import claim_outbox_batch, get_pending_outbox_cluster_ids
+from src.database.management.operations.peer import (
+    get_cluster_public_keys,
+    get_existing_public_keys,
+    get_peer_by_client_cluster_apptype,
+    get_peer_by_public_key,
+    get_peer_keys_by_client_ids,
+    get_peers_by_client_id,
+)
+
+CLUSTERS = 1000
+CLIENTS = 5000
+OUTBOX_ENTRIES = 20000
+
+# Ids are md5-derived so the tests can address seeded rows without a lookup.
+# The endpoint colon is escaped, text() would read :8080 as a bind parameter.
+SEED_SQL = (
+    f"""
+    INSERT INTO clusters (id, name, endpoint, api_key, is_active, peers_count, online_peers_count)
+    SELECT md5('cluster-' || i)::uuid, 'plan-' || i, '198.51.100.' || i || '\\:8080', md5(i::text), true, 0, 0
+    FROM generate_series(1, {CLUSTERS}) AS i
+    """,
+    # Expiry dates spread around now; every tenth client is already expired
+    # and every hundredth is an admin, both outside the partial index.
+    f"""
+    INSERT INTO clients (id, username, expires_at, subscription_status, trial_used, is_admin)
+    SELECT md5('client-' || i)::uuid, 'plan-' || i, now() + ((i % 200) - 20) * interval '1 day',
+           CASE WHEN i % 10 = 0 THEN 'expired' ELSE 'active' END, true, i % 100 = 0
+    FROM generate_series(1, {CLIENTS}) AS i
+    """,
+    f"""
+    INSERT INTO peers (id, client_id, cluster_id, public_key, private_key_hash, allocated_ip, endpoint, app_type, protocol)
+    SELECT gen_random_uuid(), md5('client-' || c.i)::uuid, md5('cluster-' || (c.i % {CLUSTERS} + 1))::uuid,
+           'plan-' || c.i || '-' || a.app_type, 'plan', '10.8.0.2/32', '203.0.113.10\\:51820', a.app_type, 'awg'
+    FROM generate_series(1, {CLIENTS}) AS c(i)
+    CROSS JOIN (VALUES ('amnezia_vpn'), ('amnezia_wg')) AS a(app_type)
+    """,
+    # Mostly failed entries, which the pending partial index leaves out.
+    f"""
+    INSERT INTO peer_outbox (id, cluster_id, operation, public_key, status, attempts, next_attempt_at)
+    SELECT gen_random_uuid(), md5('cluster-' || (i % {CLUSTERS} + 1))::uuid, 'delete_peer', 'outbox-' || i,
+           CASE WHEN i % 50 = 0 THEN 'pending' ELSE 'failed' END, 0, now() - interval '1 minute'
+    FROM generate_series(1, {OUTBOX_ENTRIES}) AS i
+    """,
+)
+
+
+def _seeded_id(name: str) -> uuid.UUID:
+    return uuid.UUID(hashlib.md5(name.encode()).hexdigest())
+
+
+CLUSTER_ID = _seeded_id("cluster-1")
+CLIENT_ID = _seeded_id("client-1")
+
+
+@pytest.fixture(scope="module")
+def seeded_url(postgres_url: URL) -> URL:
+    engine = create_engine(postgres_url, poolclass=pool.NullPool)
+    try:
+        with engine.begin() as connection:
+            for statement in SEED_SQL:
+                connection.execute(text(statement))
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            connection.execute(text("VACUUM ANALYZE"))
+    finally:
+        engine.dispose()
+    return postgres_url
+
+
+def _index_names(plan: dict) -> set[str]:
+    names = {plan["Index Name"]} if "Index Name" in plan else set()
+    for child in plan.get("Plans", ()):
+        names |= _index_names(child)
+    return names
+
+
+async def _explain(url: URL, run) -> set[str]:
+    """Index names in the plan of the last statement issued by run(session)."""
+    engine = create_async_engine(url.set(drivername="postgresql+asyncpg"), poolclass=pool.NullPool)
+    statements = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _capture(connection, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    try:
+        async with AsyncSession(engine) as session:
+            await run(session)
+            await session.rollback()
+
+        statement, parameters = statements[-1]
+        async with engine.connect() as connection:
+            result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+            plan = result.scalar_one()
+    finally:
+        await engine.dispose()
+
+    # asyncpg has no codec for json and returns it as text.
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return _index_names(plan[0]["Plan"])
+
+
+PEER_BY_CLUSTER_INDEXES = {"ix_peers_cluster_id_app_type", "ix_peers_cluster_id_client_id"}
+
+# (operation call, indexes of which the plan must use at least one)
+HOT_PATHS = [
+    pytest.param(
+        lambda session: get_expired_clients(session, datetime.now(timezone.utc), 100),
+        {"ix_clients_expires_at_expirable"},
+        id="get_expired_clients",
+    ),
+    pytest.param(
+        lambda session: get_client_by_username(session, "plan-1"),
+        {"ix_clients_username"},
+        id="get_client_by_username",
+    ),
+    pytest.param(
+        lambda session: get_cluster_by_api_key(session, "c4ca4238a0b923820dcc509a6f75849b"),
+        {"ix_clusters_api_key"},
+        id="get_cluster_by_api_key",
+    ),
+    pytest.param(
+        lambda session: get_cluster_by_name(session, "plan-1"),
+        {"ix_clusters_name"},
+        id="get_cluster_by_name",
+    ),
+    pytest.param(
+        lambda session: get_peer_by_public_key(session, "plan-1-amnezia_wg"),
+        {"ix_peers_public_key"},
+        id="get_peer_by_public_key",
+    ),
+    pytest.param(
+        lambda session: get_existing_public_keys(session, ["plan-1-amnezia_wg", "plan-2-amnezia_vpn", "unknown"]),
+        {"ix_peers_public_key"},
+        id="get_existing_public_keys",
+    ),
+    pytest.param(
+        lambda session: get_cluster_public_keys(session, CLUSTER_ID),
+        PEER_BY_CLUSTER_INDEXES,
+        id="get_cluster_public_keys",
+    ),
+    pytest.param(
+        lambda session: get_peer_by_client_cluster_apptype(session, CLIENT_ID, _seeded_id("cluster-2"), "amnezia_wg"),
+        {"uq_peer_client_cluster_apptype", "ix_peers_cluster_id_client_id"},
+        id="get_peer_by_client_cluster_apptype",
+    ),
+    pytest.param(
+        lambda session: get_peers_by_client_id(session, CLIENT_ID),
+        {"uq_peer_client_cluster_apptype"},
+        id="get_peers_by_client_id",
+    ),
+    pytest.param(
+        lambda session: get_peer_keys_by_client_ids(session, [CLIENT_ID, _seeded_id("client-2")]),
+        {"uq_peer_client_cluster_apptype"},
+        id="get_peer_keys_by_client_ids",
+    ),
+    pytest.param(
+        repair_client_counters,
+        {"uq_peer_client_cluster_apptype"},
+        id="repair_client_counters",
+    ),
+    pytest.param(
+        get_pending_outbox_cluster_ids,
+        {"ix_peer_outbox_pending"},
+        id="get_pending_outbox_cluster_ids",
+    ),
+    pytest.param(
+        lambda session: claim_outbox_batch(session, CLUSTER_ID, 50),
+        {"ix_peer_outbox_pending"},
+        id="claim_outbox_batch",
+    ),
+]
+
+
+@pytest.mark.parametrize(("run", "indexes"), HOT_PATHS)
+def test_hot_path_uses_index(seeded_url: URL, run, indexes: set[str]):
+    used = asyncio.run(_explain(seeded_url, run))
+    assert used & indexes, f"plan uses {sorted(used) or 'no index'}, expected one of {sorted(indexes)}"
+
+
+def test_cluster_counters_use_composite_peer_indexes(seeded_url: URL):
+    indexes = asyncio.run(_explain(seeded_url, repair_cluster_counters))
+    assert PEER_BY_CLUSTER_INDEXES <= indexes
@@ -0,0 +1,138 @@
+"""
+Checks of the peers_maintain_counters triggers.
+
+Each test works on its own cluster and clients, so it can share the scratch
+database with other modules. Statements touching several peers of one
+client/cluster pair are the case the counters have to survive: the expiry
+sweep deletes all peers of expired clients in one statement.
+"""
+import uuid
+
+import pytest
+from sqlalchemy import URL, create_engine, pool, text
+
+
+@pytest.fixture
+def connection(postgres_url: URL):
+    engine = create_engine(postgres_url, poolclass=pool.NullPool)
+    try:
+        with engine.begin() as connection:
+            yield connection
+            connection.rollback()
+    finally:
+        engine.dispose()
+
+
+def _create_cluster(connection) -> uuid.UUID:
+    cluster_id = uuid.uuid4()
+    connection.execute(
+        text(
+            "INSERT INTO clusters (id, name, endpoint, api_key, is_active, peers_count, online_peers_count) "
+            "VALUES (:id, :name, '198.51.100.1\\:8080', :api_key, true, 0, 0)"
+        ),
+        {"id": cluster_id, "name": f"counters-{cluster_id}", "api_key": cluster_id.hex},
+    )
+    return cluster_id
+
+
+def _create_client(connection) -> uuid.UUID:
+    client_id = uuid.uuid4()
+    connection.execute(
+        text(
+            "INSERT INTO clients (id, username, subscription_status, trial_used, is_admin) "
+            "VALUES (:id, :username, 'active', true, false)"
+        ),
+        {"id": client_id, "username": f"counters-{client_id}"},
+    )
+    return client_id
+
+
+def _insert_peers(connection, peers: list[tuple[uuid.UUID, uuid.UUID, str]]) -> list[uuid.UUID]:
+    """Insert (client_id, cluster_id, app_type) peers in one statement."""
+    peer_ids = [uuid.uuid4() for _ in peers]
+    connection.execute(
+        text(
+            "INSERT INTO peers (id, client_id, cluster_id, public_key, private_key_hash, allocated_ip, endpoint, app_type, protocol) "
+            "SELECT p.id, p.client_id, p.cluster_id, p.id::text, 'counters', '10.8.0.2/32', '203.0.113.10\\:51820', p.app_type, 'awg' "
+            "FROM unnest(CAST(:ids AS uuid[]), CAST(:client_ids AS uuid[]), CAST(:cluster_ids AS uuid[]), CAST(:app_types AS text[])) "
+            "AS p(id, client_id, cluster_id, app_type)"
+        ),
+        {
+            "ids": peer_ids,
+            "client_ids": [client_id for client_id, _, _ in peers],
+            "cluster_ids": [cluster_id for _, cluster_id, _ in peers],
+            "app_types": [app_type for _, _, app_type in peers],
+        },
+    )
+    return peer_ids
+
+
+def _cluster_counters(connection, cluster_id: uuid.UUID) -> tuple[int, int, int]:
+    return tuple(connection.execute(
+        text(
+            "SELECT amnezia_vpn_peers_count, amnezia_wg_peers_count, unique_clients_count "
+            "FROM clusters WHERE id = :id"
+        ),
+        {"id": cluster_id},
+    ).one())
+
+
+def _client_peers_count(connection, client_id: uuid.UUID) -> int:
+    return connection.execute(
+        text("SELECT peers_count FROM clients WHERE id = :id"), {"id": client_id}
+    ).scalar_one()
+
+
+def test_multi_row_insert_and_delete_of_one_client(connection):
+    cluster_id = _create_cluster(connection)
+    client_id = _create_client(connection)
+
+    peer_ids = _insert_peers(connection, [
+        (client_id, cluster_id, "amnezia_vpn"),
+        (client_id, cluster_id, "amnezia_wg"),
+    ])
+    assert _cluster_counters(connection, cluster_id) == (1, 1, 1)
+    assert _client_peers_count(connection, client_id) == 2
+
+    # The statement delete_peers_by_ids issues for the expiry sweep.
+    connection.execute(text("DELETE FROM peers WHERE id = ANY(:ids)"), {"ids": peer_ids})
+    assert _cluster_counters(connection, cluster_id) == (0, 0, 0)
+    assert _client_peers_count(connection, client_id) == 0
+
+
+def test_partial_delete_keeps_client_counted(connection):
+    cluster_id = _create_cluster(connection)
+    first, second = _create_client(connection), _create_client(connection)
+
+    peer_ids = _insert_peers(connection, [
+        (first, cluster_id, "amnezia_vpn"),
+        (first, cluster_id, "amnezia_wg"),
+        (second, cluster_id, "amnezia_wg"),
+    ])
+    assert _cluster_counters(connection, cluster_id) == (1, 2, 2)
+
+    connection.execute(text("DELETE FROM peers WHERE id = ANY(:ids)"), {"ids": peer_ids[1:]})
+    assert _cluster_counters(connection, cluster_id) == (1, 0, 1)
+    assert _client_peers_count(connection, first) == 1
+    assert _client_peers_count(connection, second) == 0
+
+
+def test_moving_peers_between_clusters(connection):
+    source, target = _create_cluster(connection), _create_cluster(connection)
+    client_id = _create_client(connection)
+
+    peer_ids = _insert_peers(connection, [
+        (client_id, source, "amnezia_vpn"),
+        (client_id, source, "amnezia_wg"),
+    ])
+    connection.execute(
+        text("UPDATE peers SET cluster_id = :target WHERE id = ANY(:ids)"),
+        {"target": target, "ids": peer_ids},
+    )
+    assert _cluster_counters(connection, source) == (0, 0, 0)
+    assert _cluster_counters(connection, target) == (1, 1, 1)
+    assert _client_peers_count(connection, client_id) == 2
+
+    # Updates that leave client, cluster and app type alone change nothing.
+    connection.execute(text("UPDATE peers SET allocated_ip = '10.8.0.3/32' WHERE id = ANY(:ids)"), {"ids": peer_ids})
+    assert _cluster_counters(connection, target) == (1, 1, 1)